@@ -1,16 +1,68 @@
 """Configuration management for Calypso file processor."""
 
+import functools
 import os
+import stat
+import sys
 from pathlib import Path
-from typing import List, Optional
-from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Callable, Iterator, List, Mapping, Optional, Tuple
+from dataclasses import dataclass, field
 
-from dotenv import load_dotenv
+from dotenv import dotenv_values, find_dotenv
 
 from .exceptions import ConfigurationError
 
 
-@dataclass
+# dataclass(slots=True) needs Python 3.10+; older versions keep __dict__
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@functools.lru_cache(maxsize=4)
+def _load_env_cached(env_file: str, mtime: float) -> Mapping[str, Optional[str]]:
+    """
+    Parse a .env file, caching the result per (path, mtime).
+    
+    The mtime is part of the cache key so edits to the file are picked up
+    automatically on the next call.
+    
+    Args:
+        env_file: Path to .env file ("" if none was found)
+        mtime: Modification time of the file (0.0 if none was found)
+        
+    Returns:
+        Read-only mapping of variables defined in the file
+    """
+    if not env_file:
+        return MappingProxyType({})
+    return MappingProxyType(dict(dotenv_values(env_file)))
+
+
+# Accepted values, in the order shown in validation messages
+_WHISPER_MODELS = ("tiny", "base", "small", "medium", "large", "large-v1", "large-v2", "large-v3")
+_LOG_LEVELS = ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL")
+_VALID_WHISPER_MODELS = frozenset(_WHISPER_MODELS)
+_VALID_LOG_LEVELS = frozenset(_LOG_LEVELS)
+_PROCESS_ORDERS = ("unsorted", "sorted", "mtime")
+_VALID_PROCESS_ORDERS = frozenset(_PROCESS_ORDERS)
+
+# (argparse dest, Config attribute, converter) for CLI overrides, in order
+_CLI_OVERRIDES: Tuple[Tuple[str, str, Optional[Callable]], ...] = (
+    ('inbound', 'inbound_dir', Path),
+    ('outbound', 'outbound_dir', Path),
+    ('logs', 'logs_dir', Path),
+    ('failed', 'failed_dir', Path),
+    ('whisper_model', 'whisper_model', None),
+    ('whisper_timeout', 'whisper_timeout', None),
+    ('dry_run', 'dry_run', None),
+    ('log_level', 'log_level', None),
+    ('log_file', 'log_file', Path),
+    ('max_workers', 'max_workers', None),
+    ('process_order', 'process_order', None),
+)
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class Config:
     """Configuration for file processor."""
     
@@ -25,6 +77,8 @@ class Config:
     whisper_timeout: int = 3600  # 1 hour default
     dry_run: bool = False
     verbose: bool = False
+    max_workers: int = field(default_factory=lambda: os.cpu_count() or 1)
+    process_order: str = "unsorted"  # unsorted (directory order), sorted (by name), mtime
     
     # Logging options
     log_level: str = "INFO"
@@ -44,16 +98,26 @@ class Config:
         Raises:
             ConfigurationError: If required variables are missing
         """
-        if env_file:
-            load_dotenv(env_file)
-        else:
-            load_dotenv()
+        if not env_file:
+            env_file = find_dotenv()
+        try:
+            mtime = Path(env_file).stat().st_mtime if env_file else 0.0
+        except OSError:
+            env_file, mtime = "", 0.0
+        file_values = _load_env_cached(env_file, mtime)
+        
+        def getenv(key: str, default: Optional[str] = None) -> Optional[str]:
+            # Process environment takes precedence over the .env file
+            value = os.environ.get(key)
+            if value is None:
+                value = file_values.get(key)
+            return default if value is None else value
         
         # Required directories
-        inbound = os.getenv("CALYPSO_INBOUND_DIR")
-        outbound = os.getenv("CALYPSO_OUTBOUND_DIR")
-        logs = os.getenv("CALYPSO_LOGS_DIR")
-        failed = os.getenv("CALYPSO_FAILED_DIR")
+        inbound = getenv("CALYPSO_INBOUND_DIR")
+        outbound = getenv("CALYPSO_OUTBOUND_DIR")
+        logs = getenv("CALYPSO_LOGS_DIR")
+        failed = getenv("CALYPSO_FAILED_DIR")
         
         if not all([inbound, outbound, logs, failed]):
             missing = []
@@ -68,10 +132,12 @@ class Config:
             raise ConfigurationError(f"Missing required environment variables: {', '.join(missing)}")
         
         # Optional settings
-        whisper_model = os.getenv("CALYPSO_WHISPER_MODEL", "base")
-        whisper_timeout = int(os.getenv("CALYPSO_WHISPER_TIMEOUT", "3600"))
-        log_level = os.getenv("CALYPSO_LOG_LEVEL", "INFO")
-        log_file = os.getenv("CALYPSO_LOG_FILE")
+        whisper_model = getenv("CALYPSO_WHISPER_MODEL", "base")
+        whisper_timeout = int(getenv("CALYPSO_WHISPER_TIMEOUT", "3600"))
+        log_level = getenv("CALYPSO_LOG_LEVEL", "INFO")
+        log_file = getenv("CALYPSO_LOG_FILE")
+        max_workers = getenv("CALYPSO_MAX_WORKERS")
+        process_order = getenv("CALYPSO_PROCESS_ORDER", "unsorted")
         
         return cls(
             inbound_dir=Path(inbound),
@@ -82,6 +148,8 @@ class Config:
             whisper_timeout=whisper_timeout,
             log_level=log_level,
             log_file=Path(log_file) if log_file else None,
+            max_workers=int(max_workers) if max_workers else (os.cpu_count() or 1),
+            process_order=process_order,
         )
     
     @classmethod
@@ -95,40 +163,30 @@ class Config:
         Returns:
             Config instance
         """
+        cli_args = vars(args)
+        
         # Start with environment config
         try:
-            config = cls.from_env(getattr(args, 'env_file', None))
+            config = cls.from_env(cli_args.get('env_file'))
         except ConfigurationError:
             # If environment config fails, create from CLI args only
             config = cls(
-                inbound_dir=Path(args.inbound) if hasattr(args, 'inbound') and args.inbound else Path("inbound"),
-                outbound_dir=Path(args.outbound) if hasattr(args, 'outbound') and args.outbound else Path("processed"),
-                logs_dir=Path(args.logs) if hasattr(args, 'logs') and args.logs else Path("logs"),
-                failed_dir=Path(args.failed) if hasattr(args, 'failed') and args.failed else Path("failed"),
+                inbound_dir=Path(cli_args.get('inbound') or "inbound"),
+                outbound_dir=Path(cli_args.get('outbound') or "processed"),
+                logs_dir=Path(cli_args.get('logs') or "logs"),
+                failed_dir=Path(cli_args.get('failed') or "failed"),
             )
         
-        # Override with CLI arguments if provided
-        if hasattr(args, 'inbound') and args.inbound:
-            config.inbound_dir = Path(args.inbound)
-        if hasattr(args, 'outbound') and args.outbound:
-            config.outbound_dir = Path(args.outbound)
-        if hasattr(args, 'logs') and args.logs:
-            config.logs_dir = Path(args.logs)
-        if hasattr(args, 'failed') and args.failed:
-            config.failed_dir = Path(args.failed)
-        if hasattr(args, 'whisper_model') and args.whisper_model:
-            config.whisper_model = args.whisper_model
-        if hasattr(args, 'whisper_timeout') and args.whisper_timeout:
-            config.whisper_timeout = args.whisper_timeout
-        if hasattr(args, 'dry_run') and args.dry_run:
-            config.dry_run = args.dry_run
-        if hasattr(args, 'verbose') and args.verbose:
-            config.verbose = args.verbose
+        # Verbose implies DEBUG unless an explicit log level follows
+        if cli_args.get('verbose'):
+            config.verbose = cli_args['verbose']
             config.log_level = "DEBUG"
-        if hasattr(args, 'log_level') and args.log_level:
-            config.log_level = args.log_level
-        if hasattr(args, 'log_file') and args.log_file:
-            config.log_file = Path(args.log_file)
+        
+        # Override with CLI arguments if provided
+        for arg_name, attr_name, convert in _CLI_OVERRIDES:
+            value = cli_args.get(arg_name)
+            if value:
+                setattr(config, attr_name, convert(value) if convert else value)
         
         return config
     
@@ -139,29 +197,52 @@ class Config:
         Returns:
             List of validation error messages (empty if valid)
         """
-        errors = []
+        return list(self._iter_validation_errors())
+    
+    def validate_fast(self) -> Optional[str]:
+        """
+        Validate configuration settings, stopping at the first error.
         
-        # Validate inbound directory exists
-        if not self.inbound_dir.exists():
-            errors.append(f"Inbound directory does not exist: {self.inbound_dir}")
-        elif not self.inbound_dir.is_dir():
-            errors.append(f"Inbound path is not a directory: {self.inbound_dir}")
+        Returns:
+            First validation error message, or None if valid
+        """
+        return next(self._iter_validation_errors(), None)
+    
+    def _iter_validation_errors(self) -> Iterator[str]:
+        """
+        Run the validation checks lazily, yielding each error message.
+        
+        Yields:
+            Validation error messages
+        """
+        # Validate inbound directory exists (one stat for both checks)
+        try:
+            inbound_mode = os.stat(self.inbound_dir).st_mode
+        except OSError:
+            yield f"Inbound directory does not exist: {self.inbound_dir}"
+        else:
+            if not stat.S_ISDIR(inbound_mode):
+                yield f"Inbound path is not a directory: {self.inbound_dir}"
         
         # Validate whisper model
-        valid_models = ["tiny", "base", "small", "medium", "large", "large-v1", "large-v2", "large-v3"]
-        if self.whisper_model not in valid_models:
-            errors.append(f"Invalid Whisper model: {self.whisper_model}. Must be one of: {', '.join(valid_models)}")
+        if self.whisper_model not in _VALID_WHISPER_MODELS:
+            yield f"Invalid Whisper model: {self.whisper_model}. Must be one of: {', '.join(_WHISPER_MODELS)}"
         
         # Validate timeout
         if self.whisper_timeout <= 0:
-            errors.append(f"Whisper timeout must be positive: {self.whisper_timeout}")
+            yield f"Whisper timeout must be positive: {self.whisper_timeout}"
         
-        # Validate log level
-        valid_levels = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
-        if self.log_level.upper() not in valid_levels:
-            errors.append(f"Invalid log level: {self.log_level}. Must be one of: {', '.join(valid_levels)}")
+        # Validate worker count
+        if self.max_workers <= 0:
+            yield f"Max workers must be positive: {self.max_workers}"
+        
+        # Validate processing order
+        if self.process_order not in _VALID_PROCESS_ORDERS:
+            yield f"Invalid process order: {self.process_order}. Must be one of: {', '.join(_PROCESS_ORDERS)}"
         
-        return errors
+        # Validate log level
+        if self.log_level.upper() not in _VALID_LOG_LEVELS:
+            yield f"Invalid log level: {self.log_level}. Must be one of: {', '.join(_LOG_LEVELS)}"
     
     def ensure_directories(self) -> None:
         """
@@ -201,6 +282,8 @@ class Config:
             f"  Whisper Timeout: {self.whisper_timeout}s\n"
             f"  Log Level: {self.log_level}\n"
             f"  Log File: {self.log_file or 'None'}\n"
+            f"  Max Workers: {self.max_workers}\n"
+            f"  Process Order: {self.process_order}\n"
             f"  Dry Run: {self.dry_run}\n"
             f"  Verbose: {self.verbose}"
         )
\ No newline at end of file
@@ -43,8 +43,9 @@ class FileTypeDetector:
         Returns:
             True if supported, False otherwise
         """
+        # detect_file_type already returns the canonical form
         extension = self.detect_file_type(file_path)
-        return self.factory.is_supported(extension)
+        return self.factory.is_supported_normalized(extension)
     
     def get_processor_type(self, file_path: Path) -> Optional[str]:
         """
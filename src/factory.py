@@ -1,20 +1,30 @@
 """Factory for creating file processors."""
 
+import sys
+import threading
 from pathlib import Path
-from typing import Dict, List, Optional, Type
+from types import MappingProxyType
+from typing import Callable, Dict, List, Mapping, Optional, Type, Union
 
 from .processors.base import FileProcessor
 from .logger import get_logger
 
 
+ProcessorLoader = Callable[[], Type[FileProcessor]]
+ProcessorEntry = Union[Type[FileProcessor], ProcessorLoader]
+
+
 class ProcessorFactory:
     """Factory for creating file processors based on file extension."""
     
     def __init__(self):
         """Initialize processor factory."""
         self.logger = get_logger("ProcessorFactory")
-        self._processors: Dict[str, Type[FileProcessor]] = {}
-        self._extension_map: Dict[str, Type[FileProcessor]] = {}
+        self._processors: Dict[str, ProcessorEntry] = {}
+        self._extension_map: Mapping[str, ProcessorEntry] = {}
+        self._loaded: Dict[ProcessorLoader, Type[FileProcessor]] = {}
+        self._instance_cache: Dict[Type[FileProcessor], FileProcessor] = {}
+        self._load_lock = threading.Lock()
     
     def register(self, processor_class: Type[FileProcessor]) -> None:
         """
@@ -23,23 +33,96 @@ class ProcessorFactory:
         Args:
             processor_class: Processor class to register
         """
-        # Instantiate to get supported extensions
-        instance = processor_class()
-        extensions = instance.get_supported_extensions()
+        extensions = processor_class.SUPPORTED_EXTENSIONS
+        extension_map = self._writable_extension_map()
         
         # Register each extension
         for ext in extensions:
-            ext_lower = ext.lower()
-            if ext_lower in self._extension_map:
+            ext_lower = sys.intern(ext.lower())
+            if ext_lower in extension_map:
+                existing = extension_map[ext_lower]
                 self.logger.warning(
-                    f"Extension {ext} already registered to {self._extension_map[ext_lower].__name__}, "
+                    f"Extension {ext} already registered to {getattr(existing, '__name__', 'lazy processor')}, "
                     f"overwriting with {processor_class.__name__}"
                 )
-            self._extension_map[ext_lower] = processor_class
+            extension_map[ext_lower] = processor_class
         
         self._processors[processor_class.__name__] = processor_class
         self.logger.debug(f"Registered processor: {processor_class.__name__} for {extensions}")
     
+    def register_lazy(self, name: str, extensions: List[str], loader: ProcessorLoader) -> None:
+        """
+        Register a processor whose module is imported on first use.
+        
+        Heavy processors (Whisper, pandas) are only imported when a file
+        with one of their extensions is actually processed.
+        
+        Args:
+            name: Processor class name
+            extensions: File extensions handled by the processor
+            loader: Callable returning the processor class
+        """
+        extension_map = self._writable_extension_map()
+        for ext in extensions:
+            ext_lower = sys.intern(ext.lower())
+            if ext_lower in extension_map:
+                self.logger.warning(
+                    f"Extension {ext} already registered, overwriting with {name}"
+                )
+            extension_map[ext_lower] = loader
+        
+        self._processors[name] = loader
+        self.logger.debug(f"Registered lazy processor: {name} for {extensions}")
+    
+    def freeze(self) -> None:
+        """
+        Make the extension map read-only once registration is complete.
+        
+        Lookups then go through a MappingProxyType over a dict that never
+        changes size. Registering another processor afterwards is still
+        allowed and works on a fresh copy.
+        """
+        self._extension_map = MappingProxyType(dict(self._extension_map))
+    
+    def _writable_extension_map(self) -> Dict[str, ProcessorEntry]:
+        """
+        Get the extension map as a mutable dict, copying it if frozen.
+        
+        Returns:
+            Mutable extension map
+        """
+        if not isinstance(self._extension_map, dict):
+            self._extension_map = dict(self._extension_map)
+        return self._extension_map
+    
+    def _resolve(self, ext_lower: str) -> Optional[Type[FileProcessor]]:
+        """
+        Get the processor class for a normalized extension, loading it if needed.
+        
+        Args:
+            ext_lower: Lowercase extension with leading dot
+            
+        Returns:
+            Processor class, or None if not supported
+        """
+        entry = self._extension_map.get(ext_lower)
+        if entry is None or isinstance(entry, type):
+            return entry
+        
+        processor_class = self._loaded.get(entry)
+        if processor_class is not None:
+            return processor_class
+        
+        # Lazy entry: load once and memoize the class for every extension
+        with self._load_lock:
+            processor_class = self._loaded.get(entry)
+            if processor_class is None:
+                processor_class = entry()
+                self._loaded[entry] = processor_class
+                self.logger.debug(f"Loaded processor: {processor_class.__name__}")
+        
+        return processor_class
+    
     def get_processor(self, file_extension: str) -> Optional[FileProcessor]:
         """
         Get a processor instance for the given file extension.
@@ -54,13 +137,41 @@ class ProcessorFactory:
         if not file_extension.startswith('.'):
             file_extension = f'.{file_extension}'
         
-        ext_lower = file_extension.lower()
+        return self.get_processor_normalized(file_extension.lower())
+    
+    def get_processor_normalized(self, ext_lower: str) -> Optional[FileProcessor]:
+        """
+        Get a processor instance for an already normalized extension.
+        
+        Processors hold no per-file state, so one instance per class is
+        created and reused for every later call.
         
-        processor_class = self._extension_map.get(ext_lower)
-        if processor_class:
-            return processor_class()
+        Args:
+            ext_lower: Lowercase extension with leading dot
+            
+        Returns:
+            Processor instance, or None if not supported
+        """
+        processor_class = self._resolve(ext_lower)
+        if processor_class is None:
+            return None
         
-        return None
+        instance = self._instance_cache.get(processor_class)
+        if instance is None:
+            instance = self._instance_cache.setdefault(processor_class, processor_class())
+        return instance
+    
+    def get_processor_class_by_ext(self, ext_lower: str) -> Optional[Type[FileProcessor]]:
+        """
+        Get the processor class for an already normalized extension.
+        
+        Args:
+            ext_lower: Lowercase extension with leading dot
+            
+        Returns:
+            Processor class, or None if not supported
+        """
+        return self._resolve(ext_lower)
     
     def get_processor_for_file(self, file_path: Path) -> Optional[FileProcessor]:
         """
@@ -72,8 +183,8 @@ class ProcessorFactory:
         Returns:
             Processor instance, or None if not supported
         """
-        extension = file_path.suffix
-        return self.get_processor(extension)
+        # Path.suffix is empty or starts with a dot, so only case needs fixing
+        return self.get_processor_normalized(file_path.suffix.lower())
     
     def is_supported(self, file_extension: str) -> bool:
         """
@@ -90,6 +201,18 @@ class ProcessorFactory:
         
         return file_extension.lower() in self._extension_map
     
+    def is_supported_normalized(self, ext_lower: str) -> bool:
+        """
+        Check if an already normalized extension is supported.
+        
+        Args:
+            ext_lower: Lowercase extension with leading dot
+            
+        Returns:
+            True if supported, False otherwise
+        """
+        return ext_lower in self._extension_map
+    
     def get_all_supported_extensions(self) -> List[str]:
         """
         Get list of all supported file extensions.
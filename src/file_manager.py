@@ -1,20 +1,113 @@
 """File management utilities for Calypso file processor."""
 
+import errno
+import os
 import shutil
+import threading
+import time
+from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional, Set, Tuple, Union
 
 from .logger import get_logger
 
 
+# Path or plain string path; hot loops pass strings to skip Path objects
+StrPath = Union[str, Path]
+
+# Directories created or confirmed by any FileManager in this process. An
+# entry can go stale if the directory is removed later; operations that then
+# fail with FileNotFoundError recreate it and retry (see _recreate_parent)
+_CREATED_DIRS: Set[str] = set()
+
+# Linux (kernel 4.5+, Python 3.8+) can copy between files inside the kernel
+_HAS_COPY_FILE_RANGE = hasattr(os, "copy_file_range")
+
+# copy_file_range errors that mean "not possible here", not "copy failed"
+_COPY_FILE_RANGE_UNSUPPORTED = frozenset(
+    code for code in (
+        errno.EXDEV, errno.ENOSYS, errno.EINVAL,
+        getattr(errno, "EOPNOTSUPP", None), getattr(errno, "ENOTSUP", None),
+    ) if code is not None
+)
+
+# Bytes requested per copy_file_range call
+_COPY_CHUNK_SIZE = 1 << 30
+
+
+def _copy_file_range(source: StrPath, destination: StrPath) -> bool:
+    """
+    Copy file data with os.copy_file_range.
+    
+    Args:
+        source: Source file path
+        destination: Destination file path
+        
+    Returns:
+        True if copied, False if copy_file_range cannot be used for these
+        files (e.g., different filesystems on older kernels)
+        
+    Raises:
+        OSError: If the copy fails for another reason
+    """
+    # Open without truncating so copying a file onto itself is caught
+    # (as shutil.copyfile does) before any data is lost
+    src_fd = os.open(source, os.O_RDONLY)
+    try:
+        dst_fd = os.open(destination, os.O_WRONLY | os.O_CREAT, 0o666)
+        try:
+            src_stat, dst_stat = os.fstat(src_fd), os.fstat(dst_fd)
+            if (src_stat.st_dev, src_stat.st_ino) == (dst_stat.st_dev, dst_stat.st_ino):
+                raise shutil.SameFileError(f"{source} and {destination} are the same file")
+            os.ftruncate(dst_fd, 0)
+    
+            while os.copy_file_range(src_fd, dst_fd, _COPY_CHUNK_SIZE):
+                pass
+        finally:
+            os.close(dst_fd)
+    except OSError as e:
+        if e.errno in _COPY_FILE_RANGE_UNSUPPORTED:
+            return False
+        raise
+    finally:
+        os.close(src_fd)
+    
+    return True
+
+
+def fast_copy(source: StrPath, destination: StrPath) -> None:
+    """
+    Copy file contents using the fastest mechanism available.
+    
+    Uses os.copy_file_range where supported, so data moves between the
+    files inside the kernel, and falls back to shutil.copyfile (which uses
+    sendfile on Linux). Metadata is not copied.
+    
+    Args:
+        source: Source file path
+        destination: Destination file path
+        
+    Raises:
+        OSError: If the copy fails
+    """
+    if not (_HAS_COPY_FILE_RANGE and _copy_file_range(source, destination)):
+        shutil.copyfile(source, destination)
+
+
 class FileManager:
     """Handles file operations with proper error handling and logging."""
     
     def __init__(self):
         """Initialize file manager."""
         self.logger = get_logger("FileManager")
+        # Destination directories known to be on another filesystem
+        self._cross_device_dirs: Set[str] = set()
+        # Failed-file timestamp, reformatted at most once per second
+        self._ts_cache: Tuple[int, str] = (0, "")
+        self._ts_counter = 0
+        self._ts_lock = threading.Lock()
     
-    def move_file(self, source: Path, destination: Path, create_dirs: bool = True) -> bool:
+    def move_file(self, source: StrPath, destination: StrPath, create_dirs: bool = True) -> bool:
         """
         Move a file from source to destination.
         
@@ -27,22 +120,51 @@ class FileManager:
             True if successful, False otherwise
         """
         try:
-            if not source.exists():
-                self.logger.error(f"Source file does not exist: {source}")
-                return False
-            
             if create_dirs:
-                destination.parent.mkdir(parents=True, exist_ok=True)
+                self._ensure_parent(destination)
             
-            shutil.move(str(source), str(destination))
-            self.logger.debug(f"Moved file: {source} -> {destination}")
+            try:
+                self._move(source, destination)
+            except FileNotFoundError:
+                if not self._recreate_parent(destination):
+                    raise
+                self._move(source, destination)
+            self.logger.debug("Moved file: %s -> %s", source, destination)
             return True
             
+        except FileNotFoundError as e:
+            self._log_not_found(source, e)
+            return False
         except Exception as e:
-            self.logger.error(f"Failed to move file {source} to {destination}: {e}")
+            self.logger.error("Failed to move file %s to %s: %s", source, destination, e)
             return False
     
-    def copy_file(self, source: Path, destination: Path, create_dirs: bool = True) -> bool:
+    def _move(self, source: StrPath, destination: StrPath) -> None:
+        """
+        Rename a file, copying and deleting it across filesystems.
+        
+        Args:
+            source: Source file path
+            destination: Destination file path
+            
+        Raises:
+            OSError: If the move fails
+        """
+        parent = os.path.dirname(destination)
+        if parent in self._cross_device_dirs:
+            shutil.move(str(source), str(destination))
+            return
+        
+        try:
+            os.replace(source, destination)
+        except OSError as e:
+            if e.errno != errno.EXDEV:
+                raise
+            # Different filesystem: copy + delete now and for later moves
+            self._cross_device_dirs.add(parent)
+            shutil.move(str(source), str(destination))
+    
+    def copy_file(self, source: StrPath, destination: StrPath, create_dirs: bool = True) -> bool:
         """
         Copy a file from source to destination.
         
@@ -55,21 +177,69 @@ class FileManager:
             True if successful, False otherwise
         """
         try:
-            if not source.exists():
-                self.logger.error(f"Source file does not exist: {source}")
-                return False
-            
             if create_dirs:
-                destination.parent.mkdir(parents=True, exist_ok=True)
+                self._ensure_parent(destination)
             
-            shutil.copy2(str(source), str(destination))
-            self.logger.debug(f"Copied file: {source} -> {destination}")
+            try:
+                fast_copy(source, destination)
+            except FileNotFoundError:
+                if not self._recreate_parent(destination):
+                    raise
+                fast_copy(source, destination)
+            shutil.copystat(source, destination)
+            self.logger.debug("Copied file: %s -> %s", source, destination)
             return True
             
+        except FileNotFoundError as e:
+            self._log_not_found(source, e)
+            return False
         except Exception as e:
-            self.logger.error(f"Failed to copy file {source} to {destination}: {e}")
+            self.logger.error("Failed to copy file %s to %s: %s", source, destination, e)
             return False
     
+    def link_or_copy(self, source: StrPath, destination: StrPath, create_dirs: bool = True) -> bool:
+        """
+        Hard link source to destination, falling back to a copy.
+        
+        On the same filesystem this is a metadata-only operation no matter
+        how large the file is. Source and destination then share data, so
+        use it only for files that are not modified afterwards (e.g.,
+        artifacts that are moved to logs next). The link is attempted
+        directly; if it fails (different filesystem, no hard link support,
+        destination exists) the file is copied with copy_file instead.
+        
+        Args:
+            source: Source file path
+            destination: Destination file path
+            create_dirs: Whether to create destination directories
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            if create_dirs:
+                self._ensure_parent(destination)
+            
+            try:
+                os.link(source, destination)
+            except FileNotFoundError:
+                if not self._recreate_parent(destination):
+                    raise
+                os.link(source, destination)
+            self.logger.debug("Linked file: %s -> %s", source, destination)
+            return True
+            
+        except FileNotFoundError as e:
+            self._log_not_found(source, e)
+            return False
+        except FileExistsError:
+            if os.path.samefile(source, destination):
+                return True  # Already linked
+            return self.copy_file(source, destination, create_dirs=False)
+        except OSError:
+            # Different filesystem or no hard link support
+            return self.copy_file(source, destination, create_dirs=False)
+    
     def create_directory(self, directory: Path, parents: bool = True) -> bool:
         """
         Create a directory.
@@ -83,11 +253,12 @@ class FileManager:
         """
         try:
             directory.mkdir(parents=parents, exist_ok=True)
-            self.logger.debug(f"Created directory: {directory}")
+            _CREATED_DIRS.add(str(directory))
+            self.logger.debug("Created directory: %s", directory)
             return True
             
         except Exception as e:
-            self.logger.error(f"Failed to create directory {directory}: {e}")
+            self.logger.error("Failed to create directory %s: %s", directory, e)
             return False
     
     def ensure_directory(self, directory: Path) -> bool:
@@ -100,11 +271,15 @@ class FileManager:
         Returns:
             True if directory exists or was created, False otherwise
         """
+        if str(directory) in _CREATED_DIRS:
+            return True
+        
         if directory.exists():
             if directory.is_dir():
+                _CREATED_DIRS.add(str(directory))
                 return True
             else:
-                self.logger.error(f"Path exists but is not a directory: {directory}")
+                self.logger.error("Path exists but is not a directory: %s", directory)
                 return False
         
         return self.create_directory(directory, parents=True)
@@ -120,16 +295,15 @@ class FileManager:
             True if successful, False otherwise
         """
         try:
-            if not file_path.exists():
-                self.logger.warning(f"File does not exist: {file_path}")
-                return True
-            
-            file_path.unlink()
-            self.logger.debug(f"Deleted file: {file_path}")
+            os.unlink(file_path)
+            self.logger.debug("Deleted file: %s", file_path)
             return True
             
+        except FileNotFoundError:
+            self.logger.warning("File does not exist: %s", file_path)
+            return True
         except Exception as e:
-            self.logger.error(f"Failed to delete file {file_path}: {e}")
+            self.logger.error("Failed to delete file %s: %s", file_path, e)
             return False
     
     def get_file_size(self, file_path: Path) -> Optional[int]:
@@ -143,13 +317,65 @@ class FileManager:
             File size in bytes, or None if error
         """
         try:
-            if not file_path.exists():
-                return None
-            return file_path.stat().st_size
+            return os.stat(file_path).st_size
+        except FileNotFoundError:
+            return None
         except Exception as e:
-            self.logger.error(f"Failed to get file size for {file_path}: {e}")
+            self.logger.error("Failed to get file size for %s: %s", file_path, e)
             return None
     
+    def _ensure_parent(self, destination: StrPath) -> None:
+        """
+        Create the parent directory of a destination path once per process.
+        
+        Args:
+            destination: Destination file path
+        """
+        parent = os.path.dirname(destination) or os.curdir
+        if parent not in _CREATED_DIRS:
+            os.makedirs(parent, exist_ok=True)
+            _CREATED_DIRS.add(parent)
+    
+    def _recreate_parent(self, destination: StrPath) -> bool:
+        """
+        Recreate a destination's parent directory that was removed while cached.
+        
+        Called after an operation fails with FileNotFoundError. Only parents
+        recorded in _CREATED_DIRS are recreated: they were created or
+        confirmed earlier, so a missing one was removed behind our back
+        (e.g., an operator cleaned out the failed directory).
+        
+        Args:
+            destination: Destination file path
+            
+        Returns:
+            True if the parent was recreated and the operation should be
+            retried, False otherwise
+        """
+        parent = os.path.dirname(destination) or os.curdir
+        if parent not in _CREATED_DIRS or os.path.isdir(parent):
+            return False
+        
+        os.makedirs(parent, exist_ok=True)
+        self.logger.warning("Recreated removed directory: %s", parent)
+        return True
+    
+    def _log_not_found(self, source: StrPath, error: FileNotFoundError) -> None:
+        """
+        Log a FileNotFoundError raised by a move or copy.
+        
+        The error can come from either end of the operation, so the source
+        is only checked here, after the fact, to pick the right message.
+        
+        Args:
+            source: Source file path
+            error: The raised error
+        """
+        if not os.path.exists(source):
+            self.logger.error("Source file does not exist: %s", source)
+        else:
+            self.logger.error("Destination directory does not exist: %s", error)
+    
     def move_to_failed(self, file_path: Path, failed_dir: Path, reason: str = "") -> bool:
         """
         Move a file to the failed directory with timestamp.
@@ -162,35 +388,91 @@ class FileManager:
         Returns:
             True if successful, False otherwise
         """
-        from datetime import datetime
-        
         try:
-            if not file_path.exists():
-                self.logger.error(f"File does not exist: {file_path}")
-                return False
-            
-            # Create timestamped filename
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            stem = file_path.stem
-            suffix = file_path.suffix
-            new_name = f"{stem}_{timestamp}{suffix}"
-            
-            destination = failed_dir / new_name
-            
             # Ensure failed directory exists
             if not self.ensure_directory(failed_dir):
                 return False
             
-            # Move file
-            success = self.move_file(file_path, destination, create_dirs=False)
+            return self._move_to_failed_dir(file_path, failed_dir, reason)
+            
+        except Exception as e:
+            self.logger.error("Failed to move file to failed directory: %s", e)
+            return False
+    
+    def move_batch_to_failed(self, files: List[Tuple[Path, str]], failed_dir: Path) -> int:
+        """
+        Move several files to the failed directory in one pass.
+        
+        The failed directory is checked once for the whole batch instead of
+        once per file.
+        
+        Args:
+            files: List of (file_path, reason) tuples
+            failed_dir: Failed files directory
             
-            if success:
-                self.logger.info(f"Moved failed file to: {destination}")
-                if reason:
-                    self.logger.info(f"Failure reason: {reason}")
+        Returns:
+            Number of files moved successfully
+        """
+        if not files:
+            return 0
+        
+        if not self.ensure_directory(failed_dir):
+            return 0
+        
+        moved = 0
+        for file_path, reason in files:
+            try:
+                if self._move_to_failed_dir(file_path, failed_dir, reason):
+                    moved += 1
+            except Exception as e:
+                self.logger.error("Failed to move file to failed directory: %s", e)
+        
+        return moved
+    
+    def _failed_timestamp(self) -> str:
+        """
+        Get the timestamp used to name a failed file.
+        
+        The formatted time is cached for the current second. The first file
+        in a second gets the plain timestamp; later ones get a counter
+        suffix so files with the same name do not overwrite each other.
+        
+        Returns:
+            Timestamp string (e.g., "20240101_120000" or "20240101_120000_2")
+        """
+        now = int(time.time())
+        with self._ts_lock:
+            if now != self._ts_cache[0]:
+                self._ts_cache = (now, datetime.fromtimestamp(now).strftime("%Y%m%d_%H%M%S"))
+                self._ts_counter = 0
+                return self._ts_cache[1]
             
-            return success
+            self._ts_counter += 1
+            return f"{self._ts_cache[1]}_{self._ts_counter}"
+    
+    def _move_to_failed_dir(self, file_path: Path, failed_dir: Path, reason: str) -> bool:
+        """
+        Move a file into an existing failed directory with a timestamped name.
+        
+        Args:
+            file_path: Path to file that failed processing
+            failed_dir: Failed files directory (must already exist)
+            reason: Reason for failure (optional)
             
-        except Exception as e:
-            self.logger.error(f"Failed to move file to failed directory: {e}")
-            return False
\ No newline at end of file
+        Returns:
+            True if successful, False otherwise
+        """
+        # Create timestamped filename
+        timestamp = self._failed_timestamp()
+        new_name = f"{file_path.stem}_{timestamp}{file_path.suffix}"
+        destination = failed_dir / new_name
+        
+        # Move file
+        success = self.move_file(file_path, destination, create_dirs=False)
+        
+        if success:
+            self.logger.info("Moved failed file to: %s", destination)
+            if reason:
+                self.logger.info("Failure reason: %s", reason)
+        
+        return success
@@ -1,21 +1,43 @@
 """Main file processor orchestrator."""
 
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from importlib import import_module
 from pathlib import Path
-from typing import List, Dict
+from typing import List, Dict, Tuple, Type
 from dataclasses import dataclass
 
-from .factory import ProcessorFactory
+from .factory import ProcessorFactory, ProcessorLoader
 from .detector import FileTypeDetector
+from .exceptions import ConfigurationError
 from .file_manager import FileManager
-from .processors.text import TextProcessor
-from .processors.audio import AudioProcessor
-from .processors.spreadsheet import SpreadsheetProcessor
-from .processors.document import DocumentProcessor
-from .processors.base import ProcessResult
+from .processors.base import BUILTIN_PROCESSORS, FileProcessor, ProcessResult
 from .logger import get_logger
 
 
-@dataclass
+# Slotted stats where supported (dataclass slots need Python 3.10+)
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+def _processor_loader(module: str, class_name: str) -> ProcessorLoader:
+    """
+    Build a loader that imports a built-in processor class on first use.
+    
+    Args:
+        module: Module name under src.processors
+        class_name: Processor class name
+        
+    Returns:
+        Callable returning the processor class
+    """
+    def load() -> Type[FileProcessor]:
+        return getattr(import_module(f'.processors.{module}', __package__), class_name)
+    return load
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class ProcessingStats:
     """Statistics for file processing session."""
     
@@ -48,7 +70,15 @@ class FileProcessorOrchestrator:
         
         Args:
             config: Configuration object
+            
+        Raises:
+            ConfigurationError: If the configuration is invalid
         """
+        # Fail fast on the first problem; validate() lists them all
+        error = config.validate_fast()
+        if error:
+            raise ConfigurationError(error)
+        
         self.config = config
         self.logger = get_logger("FileProcessor")
         self.file_manager = FileManager()
@@ -56,20 +86,30 @@ class FileProcessorOrchestrator:
         # Initialize factory and register processors
         self.factory = ProcessorFactory()
         self._register_processors()
+        self.factory.freeze()
         
         # Initialize detector
         self.detector = FileTypeDetector(self.factory)
         
         self.logger.info("File processor initialized")
-        self.logger.debug(f"Registered processors: {self.factory.get_registered_processors()}")
-        self.logger.debug(f"Supported extensions: {self.factory.get_all_supported_extensions()}")
+        self.logger.debug("Registered processors: %s", self.factory.get_registered_processors())
+        self.logger.debug("Supported extensions: %s", self.factory.get_all_supported_extensions())
     
     def _register_processors(self) -> None:
-        """Register all available file processors."""
-        self.factory.register(TextProcessor)
-        self.factory.register(AudioProcessor)
-        self.factory.register(SpreadsheetProcessor)
-        self.factory.register(DocumentProcessor)
+        """
+        Register all available file processors.
+        
+        Processor modules are imported lazily so that heavy dependencies
+        (Whisper, pandas) are only loaded when a matching file is processed.
+        Their extensions come from BUILTIN_PROCESSORS, which the processor
+        classes read as well.
+        """
+        for (module, class_name), extensions in BUILTIN_PROCESSORS.items():
+            self.factory.register_lazy(
+                class_name,
+                sorted(extensions),
+                _processor_loader(module, class_name)
+            )
     
     def process_all(self) -> ProcessingStats:
         """
@@ -78,12 +118,11 @@ class FileProcessorOrchestrator:
         Returns:
             ProcessingStats with processing results
         """
-        import time
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         stats = ProcessingStats()
         
-        self.logger.info(f"Starting file processing from: {self.config.inbound_dir}")
+        self.logger.info("Starting file processing from: %s", self.config.inbound_dir)
         
         # Get all files from inbound directory
         files = self._get_inbound_files()
@@ -93,41 +132,52 @@ class FileProcessorOrchestrator:
             self.logger.info("No files found in inbound directory")
             return stats
         
-        self.logger.info(f"Found {len(files)} files to process")
+        self.logger.info("Found %d files to process", len(files))
         
-        # Process each file
-        for file_path in files:
-            try:
-                result = self._process_single_file(file_path)
-                
-                if result.success:
-                    stats.successful += 1
-                    self.logger.info(f"✓ Successfully processed: {file_path.name}")
+        max_workers = min(len(files), self.config.max_workers)
+        failed_moves: List[Tuple[Path, str]] = []
+        
+        if max_workers <= 1:
+            # Sequential processing (easier to debug); bound methods are
+            # looked up once instead of on every iteration
+            process_file = self._process_single_file_fast
+            handle_result = self._handle_result
+            handle_exception = self._handle_exception
+            for file_path in files:
+                try:
+                    result = process_file(file_path, sys.intern(file_path.suffix.lower()))
+                except Exception as e:
+                    handle_exception(file_path, e, stats, failed_moves)
                 else:
-                    stats.failed += 1
-                    self.logger.error(f"✗ Failed to process: {file_path.name} - {result.message}")
-                    
-                    # Move failed file
-                    if file_path.exists():  # File may have been moved before failure
-                        self.file_manager.move_to_failed(
-                            file_path,
-                            self.config.failed_dir,
-                            reason=result.message
-                        )
-            
-            except Exception as e:
-                stats.failed += 1
-                self.logger.error(f"✗ Unexpected error processing {file_path.name}: {e}", exc_info=True)
-                
-                # Move failed file
-                if file_path.exists():
-                    self.file_manager.move_to_failed(
+                    handle_result(file_path, result, stats, failed_moves)
+        else:
+            # Processors spend most of their time in subprocesses (Whisper) and
+            # file I/O, both of which release the GIL, so threads are sufficient.
+            self.logger.debug("Processing with %d workers", max_workers)
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = {
+                    executor.submit(
+                        self._process_single_file_fast,
                         file_path,
-                        self.config.failed_dir,
-                        reason=str(e)
-                    )
+                        sys.intern(file_path.suffix.lower())
+                    ): file_path
+                    for file_path in files
+                }
+                
+                for future in as_completed(futures):
+                    file_path = futures[future]
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        self._handle_exception(file_path, e, stats, failed_moves)
+                    else:
+                        self._handle_result(file_path, result, stats, failed_moves)
         
-        stats.processing_time = time.time() - start_time
+        # Move all failed files in a single batch
+        if failed_moves:
+            self.file_manager.move_batch_to_failed(failed_moves, self.config.failed_dir)
+        
+        stats.processing_time = time.perf_counter() - start_time
         
         self.logger.info("=" * 60)
         self.logger.info(str(stats))
@@ -135,27 +185,96 @@ class FileProcessorOrchestrator:
         
         return stats
     
+    def _handle_result(
+        self,
+        file_path: Path,
+        result: ProcessResult,
+        stats: ProcessingStats,
+        failed_moves: List[Tuple[Path, str]]
+    ) -> None:
+        """
+        Record a processing result and queue the file for the failed directory.
+        
+        Always runs on the calling thread so workers never touch the failed
+        directory.
+        
+        Args:
+            file_path: Path to processed file
+            result: ProcessResult returned by the processor
+            stats: ProcessingStats to update
+            failed_moves: List of (file_path, reason) to move after processing
+        """
+        if result.success:
+            stats.successful += 1
+            self.logger.info("✓ Successfully processed: %s", file_path.name)
+        else:
+            stats.failed += 1
+            self.logger.error("✗ Failed to process: %s - %s", file_path.name, result.message)
+            
+            # Queue failed file for move
+            if file_path.exists():  # File may have been moved before failure
+                failed_moves.append((file_path, result.message))
+    
+    def _handle_exception(
+        self,
+        file_path: Path,
+        error: Exception,
+        stats: ProcessingStats,
+        failed_moves: List[Tuple[Path, str]]
+    ) -> None:
+        """
+        Record an unexpected processing error and queue the file for the failed directory.
+        
+        Args:
+            file_path: Path to file that raised
+            error: Exception raised while processing
+            stats: ProcessingStats to update
+            failed_moves: List of (file_path, reason) to move after processing
+        """
+        stats.failed += 1
+        self.logger.error("✗ Unexpected error processing %s: %s", file_path.name, error, exc_info=error)
+        
+        # Queue failed file for move
+        if file_path.exists():
+            failed_moves.append((file_path, str(error)))
+    
     def _get_inbound_files(self) -> List[Path]:
         """
         Get all files from inbound directory.
         
+        Files are returned in the order set by config.process_order:
+        directory order ("unsorted"), by name ("sorted") or oldest first
+        ("mtime").
+        
         Returns:
             List of file paths
         """
-        if not self.config.inbound_dir.exists():
-            self.logger.error(f"Inbound directory does not exist: {self.config.inbound_dir}")
-            return []
+        process_order = self.config.process_order
         
-        files = []
-        for item in self.config.inbound_dir.iterdir():
-            if item.is_file():
-                files.append(item)
+        # DirEntry.is_file() uses the type returned by the directory read,
+        # so regular files need no extra stat() call
+        try:
+            with os.scandir(self.config.inbound_dir) as entries:
+                if process_order == "mtime":
+                    dated = [
+                        (entry.stat().st_mtime, entry.path)
+                        for entry in entries if entry.is_file()
+                    ]
+                    dated.sort()
+                    return [Path(path) for _, path in dated]
+                
+                files = [Path(entry.path) for entry in entries if entry.is_file()]
+        except FileNotFoundError:
+            self.logger.error("Inbound directory does not exist: %s", self.config.inbound_dir)
+            return []
         
-        return sorted(files)
+        if process_order == "sorted":
+            files.sort(key=lambda p: p.name)
+        return files
     
     def _process_single_file(self, file_path: Path) -> ProcessResult:
         """
-        Process a single file.
+        Process a single file, moving it to the failed directory if unsupported.
         
         Args:
             file_path: Path to file
@@ -163,20 +282,43 @@ class FileProcessorOrchestrator:
         Returns:
             ProcessResult with processing outcome
         """
-        self.logger.info(f"Processing: {file_path.name}")
+        ext = sys.intern(file_path.suffix.lower())
+        result = self._process_single_file_fast(file_path, ext)
         
-        # Check if file type is supported
-        if not self.detector.is_supported(file_path):
-            file_type = self.detector.detect_file_type(file_path)
-            self.logger.warning(f"Unsupported file type: {file_path.name} ({file_type})")
-            
-            # Move unsupported file to failed directory
+        # process_all() batches these moves; a single file is moved here
+        if self.factory.get_processor_class_by_ext(ext) is None:
             self.file_manager.move_to_failed(
                 file_path,
                 self.config.failed_dir,
-                reason=f"Unsupported file type: {file_type}"
+                reason=result.message
             )
+        
+        return result
+    
+    def _process_single_file_fast(self, file_path: Path, ext: str) -> ProcessResult:
+        """
+        Process a single file whose extension has already been computed.
+        
+        The extension is interned (as are the factory's keys), so the
+        processor lookups below can match on identity. Nothing is moved to
+        the failed directory here, so this is safe to run on worker threads;
+        the caller moves unsupported and failed files.
+        
+        Args:
+            file_path: Path to file
+            ext: Interned lowercase extension with leading dot ("" if none)
+            
+        Returns:
+            ProcessResult with processing outcome
+        """
+        self.logger.info("Processing: %s", file_path.name)
+        
+        # Check if file type is supported
+        if self.factory.get_processor_class_by_ext(ext) is None:
+            file_type = ext or "unknown"
+            self.logger.warning("Unsupported file type: %s (%s)", file_path.name, file_type)
             
+            # Left in place; the caller moves it to the failed directory
             return ProcessResult(
                 success=False,
                 file_path=file_path,
@@ -186,9 +328,9 @@ class FileProcessorOrchestrator:
             )
         
         # Get appropriate processor
-        processor = self.factory.get_processor_for_file(file_path)
+        processor = self.factory.get_processor_normalized(ext)
         if not processor:
-            self.logger.error(f"No processor found for: {file_path.name}")
+            self.logger.error("No processor found for: %s", file_path.name)
             return ProcessResult(
                 success=False,
                 file_path=file_path,
@@ -197,14 +339,14 @@ class FileProcessorOrchestrator:
                 processing_time=0.0
             )
         
-        self.logger.debug(f"Using processor: {processor.__class__.__name__}")
+        self.logger.debug("Using processor: %s", processor.__class__.__name__)
         
         # Process the file
         try:
             result = processor.process(file_path, self.config)
             return result
         except Exception as e:
-            self.logger.error(f"Processor error for {file_path.name}: {e}", exc_info=True)
+            self.logger.error("Processor error for %s: %s", file_path.name, e, exc_info=True)
             return ProcessResult(
                 success=False,
                 file_path=file_path,
@@ -225,7 +367,7 @@ class FileProcessorOrchestrator:
             ProcessResult with processing outcome
         """
         if not file_path.exists():
-            self.logger.error(f"File does not exist: {file_path}")
+            self.logger.error("File does not exist: %s", file_path)
             return ProcessResult(
                 success=False,
                 file_path=file_path,
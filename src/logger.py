@@ -1,10 +1,14 @@
 """Logging configuration for Calypso file processor."""
 
+import atexit
 import logging
+import queue
 import sys
+import threading
+from collections import OrderedDict
 from pathlib import Path
-from logging.handlers import TimedRotatingFileHandler
-from typing import Optional
+from logging.handlers import QueueHandler, QueueListener, TimedRotatingFileHandler
+from typing import List, Optional
 
 try:
     import colorlog
@@ -13,6 +17,203 @@ except ImportError:
     HAS_COLORLOG = False
 
 
+class BufferedTimedRotatingFileHandler(TimedRotatingFileHandler):
+    """
+    TimedRotatingFileHandler that buffers writes instead of flushing per record.
+    
+    The log file is opened with a large write buffer and records are not
+    flushed individually. A daemon thread flushes the buffer every
+    flush_interval seconds; rollover and close flush as well.
+    """
+    
+    def __init__(self, *args, buffer_size: int = 65536, flush_interval: float = 1.0, **kwargs):
+        """
+        Initialize buffered handler.
+        
+        Args:
+            *args: Positional arguments for TimedRotatingFileHandler
+            buffer_size: Size of the file write buffer in bytes
+            flush_interval: Seconds between background flushes
+            **kwargs: Keyword arguments for TimedRotatingFileHandler
+        """
+        self.buffer_size = buffer_size
+        self.flush_interval = flush_interval
+        self._in_emit = False
+        super().__init__(*args, **kwargs)
+        
+        self._flush_stop = threading.Event()
+        self._flush_thread = threading.Thread(
+            target=self._flush_periodically,
+            name="calypso-log-flush",
+            daemon=True
+        )
+        self._flush_thread.start()
+    
+    def _open(self):
+        """Open the log file with a large write buffer."""
+        return open(
+            self.baseFilename,
+            self.mode,
+            buffering=self.buffer_size,
+            encoding=self.encoding,
+            errors=getattr(self, 'errors', None)
+        )
+    
+    def emit(self, record: logging.LogRecord) -> None:
+        """Write a record without StreamHandler's flush after every record."""
+        self._in_emit = True
+        try:
+            super().emit(record)
+        finally:
+            self._in_emit = False
+    
+    def flush(self) -> None:
+        """Flush buffered records (skipped when called from emit)."""
+        if not self._in_emit:
+            super().flush()
+    
+    def doRollover(self) -> None:
+        """Flush buffered records to the current file before rotating it."""
+        if self.stream:
+            self.stream.flush()
+        super().doRollover()
+    
+    def close(self) -> None:
+        """Stop the background flusher, then flush and close the file."""
+        self._flush_stop.set()
+        super().close()
+    
+    def _flush_periodically(self) -> None:
+        """Flush the buffer every flush_interval seconds until closed."""
+        while not self._flush_stop.wait(self.flush_interval):
+            self.flush()
+
+
+class ErrorLocationFormatter(logging.Formatter):
+    """
+    Formatter that adds funcName:lineno only to ERROR and CRITICAL records.
+    
+    Routine records stay short; the source location is kept where it helps
+    track down a failure. This only changes the output: the logging module
+    still looks up the caller (findCaller) for every record, whatever its
+    level, before any formatter sees it.
+    """
+    
+    def __init__(self, fmt: str, datefmt: Optional[str] = None):
+        """
+        Initialize formatter.
+        
+        Args:
+            fmt: Format for records below ERROR
+            datefmt: Date format
+        """
+        super().__init__(fmt, datefmt=datefmt)
+        self._error_formatter = logging.Formatter(
+            fmt.replace("%(message)s", "%(funcName)s:%(lineno)d - %(message)s"),
+            datefmt=datefmt
+        )
+    
+    def format(self, record: logging.LogRecord) -> str:
+        """Format a record, with its source location if it is an error."""
+        if record.levelno >= logging.ERROR:
+            return self._error_formatter.format(record)
+        return super().format(record)
+
+
+class TemplateSamplingFilter(logging.Filter):
+    """
+    Filter that keeps one in every sample_rate DEBUG records per message.
+    
+    Records are grouped by their unformatted template, so a per-artifact
+    "Moved ... to logs: %s" line is thinned out while distinct messages
+    each still get through, starting with their first occurrence. Records
+    at pass_level or above are never dropped. Counters are kept for the
+    max_templates most recently seen templates.
+    
+    Intended for a handler fed by the QueueListener, which calls filters
+    from a single thread. By then record.msg is already the formatted
+    message, so the template is read from record.template, which
+    TemplateQueueHandler sets before enqueueing.
+    """
+    
+    def __init__(
+        self,
+        sample_rate: int = 10,
+        pass_level: int = logging.INFO,
+        max_templates: int = 1024
+    ):
+        """
+        Initialize sampling filter.
+        
+        Args:
+            sample_rate: Keep one record in this many per template
+            pass_level: Records at or above this level always pass
+            max_templates: Maximum number of templates tracked
+        """
+        super().__init__()
+        self.sample_rate = sample_rate
+        self.pass_level = pass_level
+        self.max_templates = max_templates
+        self._counts: "OrderedDict[object, int]" = OrderedDict()
+    
+    def filter(self, record: logging.LogRecord) -> bool:
+        """Return True if the record should be emitted."""
+        if record.levelno >= self.pass_level:
+            return True
+        
+        counts = self._counts
+        key = getattr(record, 'template', record.msg)
+        count = counts.get(key)
+        if count is None:
+            count = 0
+            if len(counts) >= self.max_templates:
+                counts.popitem(last=False)
+        else:
+            counts.move_to_end(key)
+        counts[key] = count + 1
+        return count % self.sample_rate == 0
+
+
+class TemplateQueueHandler(QueueHandler):
+    """
+    QueueHandler that keeps each record's unformatted template.
+    
+    QueueHandler.prepare() merges the arguments into record.msg before the
+    record is enqueued; the original template is saved as record.template
+    so TemplateSamplingFilter can still group records by it.
+    """
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Prepare a record for queuing, preserving its template."""
+        template = record.msg
+        record = super().prepare(record)
+        record.template = template
+        return record
+
+
+# Background listener that writes queued records to the real handlers
+_queue_listener: Optional[QueueListener] = None
+
+
+def shutdown_logging() -> None:
+    """
+    Stop the background log listener, if running.
+    
+    Records still in the queue are written out and the console and file
+    handlers are flushed and closed. Registered with atexit, and safe to
+    call more than once.
+    """
+    global _queue_listener
+    if _queue_listener is not None:
+        listener, _queue_listener = _queue_listener, None
+        listener.stop()
+        for handler in listener.handlers:
+            handler.close()
+
+
+atexit.register(shutdown_logging)
+
+
 def setup_logging(
     log_level: str = "INFO",
     log_file: Optional[Path] = None,
@@ -21,6 +222,11 @@ def setup_logging(
     """
     Configure logging for Calypso file processor.
     
+    The console and file handlers run on a background QueueListener thread;
+    the logger itself only enqueues records, so logging calls never block
+    on terminal or file I/O. Call shutdown_logging() to flush pending
+    records before exit (done automatically at interpreter shutdown).
+    
     Args:
         log_level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
         log_file: Path to log file (optional)
@@ -33,14 +239,22 @@ def setup_logging(
     logger.setLevel(getattr(logging, log_level.upper()))
     
     # Remove existing handlers
+    shutdown_logging()
     logger.handlers.clear()
+    handlers: List[logging.Handler] = []
+    
+    # None of the formats below use thread/process fields; skip collecting
+    # them for every record
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
     
-    # Console handler with colors
+    # Console handler with colors (only when writing to a terminal)
     if console:
         console_handler = logging.StreamHandler(sys.stdout)
         console_handler.setLevel(getattr(logging, log_level.upper()))
         
-        if HAS_COLORLOG:
+        if HAS_COLORLOG and sys.stdout.isatty():
             console_formatter = colorlog.ColoredFormatter(
                 "%(log_color)s%(asctime)s - %(name)s - %(levelname)s - %(message)s%(reset)s",
                 datefmt="%Y-%m-%d %H:%M:%S",
@@ -60,14 +274,14 @@ def setup_logging(
             )
             console_handler.setFormatter(console_formatter)
         
-        logger.addHandler(console_handler)
+        handlers.append(console_handler)
     
     # File handler with rotation
     if log_file:
         # Ensure parent directory exists
         log_file.parent.mkdir(parents=True, exist_ok=True)
         
-        file_handler = TimedRotatingFileHandler(
+        file_handler = BufferedTimedRotatingFileHandler(
             log_file,
             when='midnight',
             interval=1,
@@ -75,14 +289,23 @@ def setup_logging(
             encoding='utf-8'
         )
         file_handler.setLevel(logging.DEBUG)  # Always log DEBUG to file
+        # ...but thin out repetitive per-file DEBUG lines
+        file_handler.addFilter(TemplateSamplingFilter())
         
-        file_formatter = logging.Formatter(
-            "%(asctime)s - %(name)s - %(levelname)s - %(funcName)s:%(lineno)d - %(message)s",
+        file_formatter = ErrorLocationFormatter(
+            "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
             datefmt="%Y-%m-%d %H:%M:%S"
         )
         file_handler.setFormatter(file_formatter)
         
-        logger.addHandler(file_handler)
+        handlers.append(file_handler)
+    
+    if handlers:
+        global _queue_listener
+        log_queue = queue.SimpleQueue()
+        logger.addHandler(TemplateQueueHandler(log_queue))
+        _queue_listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+        _queue_listener.start()
     
     return logger
 
@@ -1,42 +1,41 @@
 """Audio file processor with Whisper transcription."""
 
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List
+from typing import List, Tuple
 import time
-import tempfile
 
-from .base import FileProcessor, ProcessResult
+from .base import BUILTIN_PROCESSORS, FileProcessor, ProcessResult
 from ..file_manager import FileManager
-from ..utils.whisper_wrapper import WhisperWrapper
+from ..utils.scratch_pool import scratch_dirs
+from ..utils.whisper_wrapper import WhisperResult, WhisperWrapper
 from ..exceptions import ProcessingError
 
 
+# Shared pool for moving Whisper artifacts; file I/O releases the GIL
+_ARTIFACT_IO = ThreadPoolExecutor(max_workers=8, thread_name_prefix="calypso-artifact-io")
+
+
 class AudioProcessor(FileProcessor):
     """Processor for audio files using Whisper transcription."""
     
+    SUPPORTED_EXTENSIONS = BUILTIN_PROCESSORS['audio', 'AudioProcessor']
+    
     def __init__(self):
         """Initialize audio processor."""
         super().__init__()
         self.file_manager = FileManager()
         self.whisper = WhisperWrapper()
     
-    def get_supported_extensions(self) -> List[str]:
-        """
-        Get list of supported file extensions.
-        
-        Returns:
-            List of audio file extensions
-        """
-        return ['.m4a', '.mp3', '.wav', '.flac']
-    
     def process(self, file_path: Path, config) -> ProcessResult:
         """
         Process an audio file by transcribing it with Whisper.
         
         Processing steps:
         1. Validate audio file
-        2. Run Whisper transcription in temp directory
-        3. Copy .txt file to outbound
+        2. Run Whisper transcription in temp directory (_transcribe)
+        3. Copy .txt file to outbound (_organize, through step 6)
         4. Create logs/{root_name}/ directory
         5. Move all artifacts to log directory
         6. Move original audio to log directory
@@ -48,8 +47,7 @@ class AudioProcessor(FileProcessor):
         Returns:
             ProcessResult with processing outcome
         """
-        start_time = time.time()
-        output_files = []
+        start_time = time.perf_counter()
         
         try:
             # Validate file
@@ -61,11 +59,11 @@ class AudioProcessor(FileProcessor):
                     "Whisper is not installed. Install with: pip install openai-whisper"
                 )
             
-            self.logger.info(f"Processing audio file: {file_path.name}")
+            self.logger.info("Processing audio file: %s", file_path.name)
             
             # Handle dry run
             if config.dry_run:
-                self.logger.info(f"[DRY RUN] Would transcribe {file_path}")
+                self.logger.info("[DRY RUN] Would transcribe %s", file_path)
                 return self._create_result(
                     success=True,
                     file_path=file_path,
@@ -73,56 +71,10 @@ class AudioProcessor(FileProcessor):
                     start_time=start_time
                 )
             
-            # Create temporary directory for Whisper output
-            with tempfile.TemporaryDirectory() as temp_dir:
-                temp_path = Path(temp_dir)
-                
-                # Run Whisper transcription
-                self.logger.info(f"Transcribing with Whisper (model: {config.whisper_model})...")
-                whisper_result = self.whisper.transcribe(
-                    audio_file=file_path,
-                    output_dir=temp_path,
-                    model=config.whisper_model,
-                    timeout=config.whisper_timeout
-                )
-                
-                if not whisper_result.success:
-                    raise ProcessingError(f"Whisper transcription failed: {whisper_result.message}")
-                
-                # Get the .txt artifact
-                txt_artifact = whisper_result.get_artifact('txt')
-                if not txt_artifact:
-                    raise ProcessingError("Whisper did not generate .txt file")
-                
-                # Copy .txt file to outbound
-                txt_dest = config.outbound_dir / txt_artifact.name
-                if not self.file_manager.copy_file(txt_artifact, txt_dest):
-                    raise ProcessingError(f"Failed to copy transcript to {txt_dest}")
-                
-                output_files.append(txt_dest)
-                self.logger.info(f"Copied transcript to: {txt_dest}")
-                
-                # Create logs directory for this file
-                root_name = file_path.stem
-                logs_subdir = config.logs_dir / root_name
-                if not self.file_manager.ensure_directory(logs_subdir):
-                    raise ProcessingError(f"Failed to create logs directory: {logs_subdir}")
-                
-                # Move all artifacts to logs directory
-                for ext, artifact_path in whisper_result.artifacts.items():
-                    if artifact_path and artifact_path.exists():
-                        dest = logs_subdir / artifact_path.name
-                        if self.file_manager.move_file(artifact_path, dest, create_dirs=False):
-                            output_files.append(dest)
-                            self.logger.debug(f"Moved artifact to logs: {dest}")
-                
-                # Move original audio file to logs directory
-                audio_dest = logs_subdir / file_path.name
-                if not self.file_manager.move_file(file_path, audio_dest, create_dirs=False):
-                    raise ProcessingError(f"Failed to move audio to {audio_dest}")
-                
-                output_files.append(audio_dest)
-                self.logger.info(f"Organized all files in: {logs_subdir}")
+            # Borrow a scratch directory for Whisper output
+            with scratch_dirs.scoped() as temp_path:
+                whisper_result = self._transcribe(file_path, temp_path, config)
+                output_files, logs_subdir = self._organize(file_path, whisper_result, temp_path, config)
             
             return self._create_result(
                 success=True,
@@ -133,11 +85,114 @@ class AudioProcessor(FileProcessor):
             )
         
         except Exception as e:
-            self.logger.error(f"Error processing audio file {file_path}: {e}", exc_info=True)
+            self.logger.error("Error processing audio file %s: %s", file_path, e,
+                              exc_info=not isinstance(e, ProcessingError))
             return self._create_result(
                 success=False,
                 file_path=file_path,
                 message=f"Error: {str(e)}",
                 start_time=start_time,
                 error=e
-            )
\ No newline at end of file
+            )
+    
+    def _transcribe(self, file_path: Path, temp_path: Path, config) -> WhisperResult:
+        """
+        Run Whisper on an audio file (the compute-bound stage).
+        
+        Args:
+            file_path: Path to audio file
+            temp_path: Scratch directory for Whisper output
+            config: Configuration object
+            
+        Returns:
+            Successful WhisperResult with a .txt artifact
+            
+        Raises:
+            ProcessingError: If transcription fails or produces no transcript
+        """
+        self.logger.info("Transcribing with Whisper (model: %s)...", config.whisper_model)
+        whisper_result = self.whisper.transcribe(
+            audio_file=file_path,
+            output_dir=temp_path,
+            model=config.whisper_model,
+            timeout=config.whisper_timeout
+        )
+        
+        if not whisper_result.success:
+            raise ProcessingError(f"Whisper transcription failed: {whisper_result.message}")
+        
+        if not whisper_result.get_artifact('txt'):
+            raise ProcessingError("Whisper did not generate .txt file")
+        
+        return whisper_result
+    
+    def _organize(
+        self,
+        file_path: Path,
+        whisper_result: WhisperResult,
+        temp_path: Path,
+        config
+    ) -> Tuple[List[Path], Path]:
+        """
+        Publish the transcript and file everything under logs (the I/O stage).
+        
+        Args:
+            file_path: Path to audio file
+            whisper_result: Result returned by _transcribe
+            temp_path: Scratch directory holding the Whisper output
+            config: Configuration object
+            
+        Returns:
+            Tuple of (output files, logs subdirectory)
+            
+        Raises:
+            ProcessingError: If the transcript or audio cannot be moved
+        """
+        output_files = []
+        
+        # Copy .txt file to outbound
+        txt_artifact = whisper_result.get_artifact('txt')
+        txt_dest = config.outbound_dir / txt_artifact.name
+        if not self.file_manager.link_or_copy(txt_artifact, txt_dest):
+            raise ProcessingError(f"Failed to copy transcript to {txt_dest}")
+        
+        output_files.append(txt_dest)
+        self.logger.info("Copied transcript to: %s", txt_dest)
+        
+        # Create logs directory for this file
+        root_name = file_path.stem
+        logs_subdir = config.logs_dir / root_name
+        if not self.file_manager.ensure_directory(logs_subdir):
+            raise ProcessingError(f"Failed to create logs directory: {logs_subdir}")
+        
+        # Move all artifacts to logs directory; the temp directory
+        # holds only Whisper output, so one scan finds them all
+        logs_str = os.fspath(logs_subdir)
+        with os.scandir(temp_path) as entries:
+            artifacts = [
+                (entry.path, os.path.join(logs_str, entry.name))
+                for entry in entries if entry.is_file()
+            ]
+        
+        # The moves are independent, so run them concurrently
+        futures = [
+            _ARTIFACT_IO.submit(self.file_manager.move_file, artifact_path, dest, False)
+            for artifact_path, dest in artifacts
+        ]
+        
+        # Move original audio file to logs directory
+        audio_dest = logs_subdir / file_path.name
+        audio_moved = self.file_manager.move_file(file_path, audio_dest, create_dirs=False)
+        
+        for (artifact_path, dest), future in zip(artifacts, futures):
+            if future.result():
+                output_files.append(Path(dest))
+                self.logger.debug("Moved artifact to logs: %s", dest)
+        
+        if not audio_moved:
+            raise ProcessingError(f"Failed to move audio to {audio_dest}")
+        
+        output_files.append(audio_dest)
+        self.logger.info("Organized all files in: %s", logs_subdir)
+        
+        return output_files, logs_subdir
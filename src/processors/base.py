@@ -1,16 +1,39 @@
 """Base processor class for file processing."""
 
+import logging
+import os
+import stat
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import List, Optional
+from types import MappingProxyType
+from typing import ClassVar, FrozenSet, List, Mapping, Optional, Tuple
 import time
+import sys
 
 from ..exceptions import ProcessingError
 from ..logger import get_logger
 
 
-@dataclass
+# One ProcessResult is created per file; slot it where Python allows (3.10+)
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# Extensions of the built-in processors, keyed by (module under
+# src.processors, class name). The only copy of these lists: each class
+# reads its SUPPORTED_EXTENSIONS from here, and the orchestrator registers
+# the processors from here without importing their (heavy) modules.
+BUILTIN_PROCESSORS: Mapping[Tuple[str, str], FrozenSet[str]] = MappingProxyType({
+    ('text', 'TextProcessor'): frozenset({
+        '.txt', '.log', '.html', '.md', '.json',
+        '.xml', '.csv', '.srt', '.vtt', '.tsv'
+    }),
+    ('audio', 'AudioProcessor'): frozenset({'.m4a', '.mp3', '.wav', '.flac'}),
+    ('spreadsheet', 'SpreadsheetProcessor'): frozenset({'.xls', '.xlsx'}),
+    ('document', 'DocumentProcessor'): frozenset({'.doc', '.docx', '.pdf', '.odt', '.rtf'}),
+})
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class ProcessResult:
     """Result of file processing operation."""
     
@@ -19,21 +42,23 @@ class ProcessResult:
     message: str
     processor_type: str
     processing_time: float
-    output_files: List[Path] = None
+    output_files: List[Path] = field(default_factory=list)
     error: Optional[Exception] = None
-    
-    def __post_init__(self):
-        """Initialize output_files if not provided."""
-        if self.output_files is None:
-            self.output_files = []
 
 
 class FileProcessor(ABC):
     """Abstract base class for file processors."""
     
-    def __init__(self):
-        """Initialize processor."""
-        self.logger = get_logger(self.__class__.__name__)
+    # Extensions handled by the processor (e.g., frozenset({'.txt', '.log'}))
+    SUPPORTED_EXTENSIONS: ClassVar[FrozenSet[str]] = frozenset()
+    
+    # Per-class logger, set once in __init_subclass__ rather than per instance
+    logger: ClassVar[logging.Logger]
+    
+    def __init_subclass__(cls, **kwargs):
+        """Attach a logger named after the subclass."""
+        super().__init_subclass__(**kwargs)
+        cls.logger = get_logger(cls.__name__)
     
     @abstractmethod
     def process(self, file_path: Path, config) -> ProcessResult:
@@ -52,15 +77,15 @@ class FileProcessor(ABC):
         """
         pass
     
-    @abstractmethod
-    def get_supported_extensions(self) -> List[str]:
+    @classmethod
+    def get_supported_extensions(cls) -> FrozenSet[str]:
         """
-        Get list of supported file extensions.
+        Get supported file extensions.
         
         Returns:
-            List of extensions (e.g., ['.txt', '.log'])
+            Frozen set of extensions (e.g., frozenset({'.txt', '.log'}))
         """
-        pass
+        return cls.SUPPORTED_EXTENSIONS
     
     def _validate_file(self, file_path: Path) -> None:
         """
@@ -72,14 +97,17 @@ class FileProcessor(ABC):
         Raises:
             ProcessingError: If file is invalid
         """
-        if not file_path.exists():
+        # One stat covers existence, type and size
+        try:
+            st = os.stat(os.fspath(file_path))
+        except (FileNotFoundError, NotADirectoryError):
             raise ProcessingError(f"File does not exist: {file_path}")
         
-        if not file_path.is_file():
+        if not stat.S_ISREG(st.st_mode):
             raise ProcessingError(f"Path is not a file: {file_path}")
         
-        if not file_path.stat().st_size > 0:
-            self.logger.warning(f"File is empty: {file_path}")
+        if st.st_size == 0:
+            self.logger.warning("File is empty: %s", file_path)
     
     def _create_result(
         self,
@@ -97,14 +125,14 @@ class FileProcessor(ABC):
             success: Whether processing succeeded
             file_path: Path to processed file
             message: Result message
-            start_time: Processing start time
+            start_time: Processing start time (from time.perf_counter())
             output_files: List of output files created
             error: Exception if processing failed
             
         Returns:
             ProcessResult object
         """
-        processing_time = time.time() - start_time
+        processing_time = time.perf_counter() - start_time
         
         return ProcessResult(
             success=success,
@@ -118,5 +146,5 @@ class FileProcessor(ABC):
     
     def __str__(self) -> str:
         """String representation of processor."""
-        extensions = ", ".join(self.get_supported_extensions())
+        extensions = ", ".join(sorted(self.get_supported_extensions()))
         return f"{self.__class__.__name__}(extensions: {extensions})"
\ No newline at end of file
@@ -1,10 +1,9 @@
 """Document file processor."""
 
 from pathlib import Path
-from typing import List
 import time
 
-from .base import FileProcessor, ProcessResult
+from .base import BUILTIN_PROCESSORS, FileProcessor, ProcessResult
 from ..file_manager import FileManager
 from ..exceptions import ProcessingError
 
@@ -12,20 +11,13 @@ from ..exceptions import ProcessingError
 class DocumentProcessor(FileProcessor):
     """Processor for document files (PDF, Word, etc.)."""
     
+    SUPPORTED_EXTENSIONS = BUILTIN_PROCESSORS['document', 'DocumentProcessor']
+    
     def __init__(self):
         """Initialize document processor."""
         super().__init__()
         self.file_manager = FileManager()
     
-    def get_supported_extensions(self) -> List[str]:
-        """
-        Get list of supported file extensions.
-        
-        Returns:
-            List of document file extensions
-        """
-        return ['.doc', '.docx', '.pdf', '.odt', '.rtf']
-    
     def process(self, file_path: Path, config) -> ProcessResult:
         """
         Process a document file by moving it to the unprocessed directory.
@@ -40,13 +32,13 @@ class DocumentProcessor(FileProcessor):
         Returns:
             ProcessResult with processing outcome
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         try:
             # Validate file
             self._validate_file(file_path)
             
-            self.logger.info(f"Processing document file: {file_path.name}")
+            self.logger.info("Processing document file: %s", file_path.name)
             
             # Create unprocessed directory
             unprocessed_dir = config.logs_dir / "unprocessed"
@@ -54,7 +46,7 @@ class DocumentProcessor(FileProcessor):
             # Handle dry run
             if config.dry_run:
                 destination = unprocessed_dir / file_path.name
-                self.logger.info(f"[DRY RUN] Would move {file_path} to {destination}")
+                self.logger.info("[DRY RUN] Would move %s to %s", file_path, destination)
                 return self._create_result(
                     success=True,
                     file_path=file_path,
@@ -72,7 +64,7 @@ class DocumentProcessor(FileProcessor):
             success = self.file_manager.move_file(file_path, destination, create_dirs=False)
             
             if success:
-                self.logger.info(f"Moved document to unprocessed: {file_path.name}")
+                self.logger.info("Moved document to unprocessed: %s", file_path.name)
                 return self._create_result(
                     success=True,
                     file_path=file_path,
@@ -84,7 +76,8 @@ class DocumentProcessor(FileProcessor):
                 raise ProcessingError(f"Failed to move file to {destination}")
         
         except Exception as e:
-            self.logger.error(f"Error processing document {file_path}: {e}", exc_info=True)
+            self.logger.error("Error processing document %s: %s", file_path, e,
+                              exc_info=not isinstance(e, ProcessingError))
             return self._create_result(
                 success=False,
                 file_path=file_path,
@@ -1,34 +1,32 @@
 """Spreadsheet file processor with CSV extraction."""
 
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List
 import time
-import tempfile
 
-from .base import FileProcessor, ProcessResult
+from .base import BUILTIN_PROCESSORS, FileProcessor, ProcessResult
 from ..file_manager import FileManager
+from ..utils.scratch_pool import scratch_dirs
 from ..utils.excel_reader import ExcelReader
 from ..exceptions import ProcessingError
 
 
+# Shared pool for copying and moving extracted CSVs; file I/O releases the GIL
+_CSV_IO = ThreadPoolExecutor(max_workers=8, thread_name_prefix="calypso-csv-io")
+
+
 class SpreadsheetProcessor(FileProcessor):
     """Processor for spreadsheet files (Excel)."""
     
+    SUPPORTED_EXTENSIONS = BUILTIN_PROCESSORS['spreadsheet', 'SpreadsheetProcessor']
+    
     def __init__(self):
         """Initialize spreadsheet processor."""
         super().__init__()
         self.file_manager = FileManager()
         self.excel_reader = ExcelReader()
     
-    def get_supported_extensions(self) -> List[str]:
-        """
-        Get list of supported file extensions.
-        
-        Returns:
-            List of spreadsheet file extensions
-        """
-        return ['.xls', '.xlsx']
-    
     def process(self, file_path: Path, config) -> ProcessResult:
         """
         Process a spreadsheet file by extracting all sheets to CSV.
@@ -49,20 +47,21 @@ class SpreadsheetProcessor(FileProcessor):
         Returns:
             ProcessResult with processing outcome
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
         output_files = []
         
         try:
             # Validate file
             self._validate_file(file_path)
             
-            self.logger.info(f"Processing spreadsheet file: {file_path.name}")
+            self.logger.info("Processing spreadsheet file: %s", file_path.name)
             
             # Handle dry run
             if config.dry_run:
-                sheet_names = self.excel_reader.get_sheet_names(file_path)
+                with self.excel_reader.open(file_path) as workbook:
+                    sheet_names = workbook.sheet_names if workbook is not None else None
                 if sheet_names:
-                    self.logger.info(f"[DRY RUN] Would extract {len(sheet_names)} sheets: {', '.join(sheet_names)}")
+                    self.logger.info("[DRY RUN] Would extract %d sheets: %s", len(sheet_names), ', '.join(sheet_names))
                 return self._create_result(
                     success=True,
                     file_path=file_path,
@@ -70,44 +69,53 @@ class SpreadsheetProcessor(FileProcessor):
                     start_time=start_time
                 )
             
-            # Create temporary directory for CSV extraction
-            with tempfile.TemporaryDirectory() as temp_dir:
-                temp_path = Path(temp_dir)
-                
-                # Extract all sheets to CSV
+            # Borrow a scratch directory for CSV extraction
+            with scratch_dirs.scoped() as temp_path:
+                # Extract all sheets to CSV, parsing the workbook only once
                 root_name = file_path.stem
-                csv_files = self.excel_reader.extract_all_sheets(
-                    excel_file=file_path,
-                    output_dir=temp_path,
-                    base_name=root_name
-                )
+                with self.excel_reader.open(file_path) as workbook:
+                    csv_files = workbook.extract_all(temp_path, root_name) if workbook is not None else []
                 
                 if not csv_files:
                     raise ProcessingError("Failed to extract any sheets from spreadsheet")
                 
-                self.logger.info(f"Extracted {len(csv_files)} sheets to CSV")
+                self.logger.info("Extracted %d sheets to CSV", len(csv_files))
                 
-                # Copy all CSVs to outbound
-                for csv_file in csv_files:
-                    csv_dest = config.outbound_dir / csv_file.name
-                    if not self.file_manager.copy_file(csv_file, csv_dest):
-                        self.logger.warning(f"Failed to copy CSV to outbound: {csv_file.name}")
+                # Copy all CSVs to outbound; the copies are independent,
+                # so run them concurrently and collect results in order.
+                # Destinations are plain strings; only successful ones are
+                # promoted to Path for output_files
+                outbound_str = os.fspath(config.outbound_dir)
+                csv_dests = [os.path.join(outbound_str, csv_file.name) for csv_file in csv_files]
+                copied = list(_CSV_IO.map(self.file_manager.link_or_copy, csv_files, csv_dests))
+                for csv_file, csv_dest, ok in zip(csv_files, csv_dests, copied):
+                    if not ok:
+                        self.logger.warning("Failed to copy CSV to outbound: %s", csv_file.name)
                     else:
-                        output_files.append(csv_dest)
-                        self.logger.debug(f"Copied CSV to outbound: {csv_dest}")
+                        output_files.append(Path(csv_dest))
+                        self.logger.debug("Copied CSV to outbound: %s", csv_dest)
                 
                 # Create logs directory for this file
                 logs_subdir = config.logs_dir / root_name
                 if not self.file_manager.ensure_directory(logs_subdir):
                     raise ProcessingError(f"Failed to create logs directory: {logs_subdir}")
                 
-                # Move all CSVs to logs directory
-                for csv_file in csv_files:
-                    if csv_file.exists():  # In case copy failed earlier
-                        csv_log_dest = logs_subdir / csv_file.name
-                        if self.file_manager.move_file(csv_file, csv_log_dest, create_dirs=False):
-                            output_files.append(csv_log_dest)
-                            self.logger.debug(f"Moved CSV to logs: {csv_log_dest}")
+                # Move all CSVs to logs directory (one scan of the temp
+                # directory instead of an exists() check per CSV)
+                logs_str = os.fspath(logs_subdir)
+                with os.scandir(temp_path) as entries:
+                    extracted = [
+                        (entry.path, os.path.join(logs_str, entry.name))
+                        for entry in entries if entry.is_file()
+                    ]
+                futures = [
+                    _CSV_IO.submit(self.file_manager.move_file, csv_path, csv_log_dest, False)
+                    for csv_path, csv_log_dest in extracted
+                ]
+                for (csv_path, csv_log_dest), future in zip(extracted, futures):
+                    if future.result():
+                        output_files.append(Path(csv_log_dest))
+                        self.logger.debug("Moved CSV to logs: %s", csv_log_dest)
             
             # Move original spreadsheet to logs directory
             spreadsheet_dest = logs_subdir / file_path.name
@@ -115,7 +123,7 @@ class SpreadsheetProcessor(FileProcessor):
                 raise ProcessingError(f"Failed to move spreadsheet to {spreadsheet_dest}")
             
             output_files.append(spreadsheet_dest)
-            self.logger.info(f"Organized all files in: {logs_subdir}")
+            self.logger.info("Organized all files in: %s", logs_subdir)
             
             return self._create_result(
                 success=True,
@@ -126,7 +134,8 @@ class SpreadsheetProcessor(FileProcessor):
             )
         
         except Exception as e:
-            self.logger.error(f"Error processing spreadsheet {file_path}: {e}", exc_info=True)
+            self.logger.error("Error processing spreadsheet %s: %s", file_path, e,
+                              exc_info=not isinstance(e, ProcessingError))
             return self._create_result(
                 success=False,
                 file_path=file_path,
@@ -1,10 +1,9 @@
 """Text file processor."""
 
 from pathlib import Path
-from typing import List
 import time
 
-from .base import FileProcessor, ProcessResult
+from .base import BUILTIN_PROCESSORS, FileProcessor, ProcessResult
 from ..file_manager import FileManager
 from ..exceptions import ProcessingError
 
@@ -12,23 +11,13 @@ from ..exceptions import ProcessingError
 class TextProcessor(FileProcessor):
     """Processor for text-based files."""
     
+    SUPPORTED_EXTENSIONS = BUILTIN_PROCESSORS['text', 'TextProcessor']
+    
     def __init__(self):
         """Initialize text processor."""
         super().__init__()
         self.file_manager = FileManager()
     
-    def get_supported_extensions(self) -> List[str]:
-        """
-        Get list of supported file extensions.
-        
-        Returns:
-            List of text file extensions
-        """
-        return [
-            '.txt', '.log', '.html', '.md', '.json', 
-            '.xml', '.csv', '.srt', '.vtt', '.tsv'
-        ]
-    
     def process(self, file_path: Path, config) -> ProcessResult:
         """
         Process a text file by moving it to the outbound directory.
@@ -40,7 +29,7 @@ class TextProcessor(FileProcessor):
         Returns:
             ProcessResult with processing outcome
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         try:
             # Validate file
@@ -49,11 +38,11 @@ class TextProcessor(FileProcessor):
             # Determine destination
             destination = config.outbound_dir / file_path.name
             
-            self.logger.info(f"Processing text file: {file_path.name}")
+            self.logger.info("Processing text file: %s", file_path.name)
             
             # Handle dry run
             if config.dry_run:
-                self.logger.info(f"[DRY RUN] Would move {file_path} to {destination}")
+                self.logger.info("[DRY RUN] Would move %s to %s", file_path, destination)
                 return self._create_result(
                     success=True,
                     file_path=file_path,
@@ -66,7 +55,7 @@ class TextProcessor(FileProcessor):
             success = self.file_manager.move_file(file_path, destination)
             
             if success:
-                self.logger.info(f"Successfully processed text file: {file_path.name}")
+                self.logger.info("Successfully processed text file: %s", file_path.name)
                 return self._create_result(
                     success=True,
                     file_path=file_path,
@@ -78,7 +67,8 @@ class TextProcessor(FileProcessor):
                 raise ProcessingError(f"Failed to move file to {destination}")
         
         except Exception as e:
-            self.logger.error(f"Error processing text file {file_path}: {e}", exc_info=True)
+            self.logger.error("Error processing text file %s: %s", file_path, e,
+                              exc_info=not isinstance(e, ProcessingError))
             return self._create_result(
                 success=False,
                 file_path=file_path,
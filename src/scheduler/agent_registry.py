@@ -1,18 +1,109 @@
 """Agent registry for loading and managing agent configurations."""
 
+import hashlib
+import io
 import json
 import logging
+import mmap
+import sys
+from collections import defaultdict
+from contextlib import contextmanager
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List, Optional
+from types import MappingProxyType
+from typing import Dict, Iterator, List, Mapping, Optional, Tuple, Union
+
+try:
+    from msgspec import DecodeError as _FastDecodeError
+    from msgspec.json import decode as _fast_json_decode
+except ImportError:
+    _fast_json_decode = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
 
 logger = logging.getLogger(__name__)
 
+# Fields an agent entry is expected to have
+_EXPECTED_FIELDS = frozenset({'agentName', 'agentType'})
+
+# Control files at least this large are memory-mapped rather than read
+# (when msgspec is installed to decode the mapping in place)
+_MMAP_MIN_SIZE = 1 << 20
+
+# Control files at least this large are parsed one agent entry at a time
+# (when ijson is installed) so the full list of dicts is never built
+_STREAM_MIN_SIZE = 16 << 20
+
+
+def _intern(value):
+    """Intern a string value; other values (malformed entries) pass through."""
+    return sys.intern(value) if type(value) is str else value
+
+
+@contextmanager
+def _file_buffer(path: Path, size: int) -> Iterator[Union[bytes, mmap.mmap]]:
+    """
+    Expose a file's contents as a read-only buffer.
+    
+    Large files are memory-mapped so the kernel pages them in on demand
+    without copying them into a Python bytes object; small files are
+    simply read, which is cheaper than setting up a mapping. Without
+    msgspec the file is always read: json can only decode a bytes copy of
+    a mapping, which would cost more than reading the file.
+    
+    Args:
+        path: File to read
+        size: File size in bytes, from a preceding stat
+        
+    Yields:
+        File contents as bytes or an mmap
+    """
+    with open(path, 'rb') as f:
+        if size < _MMAP_MIN_SIZE or _fast_json_decode is None:
+            yield f.read()
+            return
+        buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    try:
+        yield buffer
+    finally:
+        buffer.close()
+
+
+def _decode_json(raw: Union[bytes, mmap.mmap]):
+    """
+    Decode a JSON document, using msgspec's C decoder when it is installed.
+    
+    msgspec decodes straight from a memory map. A map is only passed in
+    when msgspec is installed; json then just re-reports its errors.
+    
+    Args:
+        raw: JSON document bytes or buffer
+        
+    Returns:
+        Decoded Python object
+        
+    Raises:
+        json.JSONDecodeError: If the document is not valid JSON
+    """
+    if _fast_json_decode is not None:
+        try:
+            return _fast_json_decode(raw)
+        except _FastDecodeError:
+            pass  # Let json report the error with its usual message and position
+    return json.loads(raw if isinstance(raw, bytes) else bytes(raw))
+
 
 @dataclass
 class AgentConfig:
     """Configuration for a single agent."""
     
+    # Declared by hand since dataclass(slots=True) needs Python 3.10.
+    # Fields with defaults would clash with these slots.
+    __slots__ = ('agent_name', 'agent_type')
+    
     agent_name: str
     agent_type: str
     # Future extensions:
@@ -40,21 +131,58 @@ class AgentConfig:
         if 'agentType' not in data:
             raise KeyError("Missing required field 'agentType' in agent configuration")
         
-        # Log warnings for unexpected fields (forward compatibility)
-        expected_fields = {'agentName', 'agentType'}
-        unexpected_fields = set(data.keys()) - expected_fields
-        if unexpected_fields:
+        # Log warnings for unexpected fields (forward compatibility). Both
+        # expected fields are present, so any extra key makes data longer
+        if len(data) > len(_EXPECTED_FIELDS):
+            unexpected_fields = data.keys() - _EXPECTED_FIELDS
             logger.warning(
                 f"Agent '{data.get('agentName', 'unknown')}' has unexpected fields: "
                 f"{', '.join(sorted(unexpected_fields))}"
             )
         
+        # Types (queue names) repeat across agents and names recur across
+        # reloads; interning shares one string object per value and lets
+        # index lookups match on identity
         return cls(
-            agent_name=data['agentName'],
-            agent_type=data['agentType']
+            agent_name=_intern(data['agentName']),
+            agent_type=_intern(data['agentType'])
         )
 
 
+def _stream_agents(raw: Union[bytes, mmap.mmap]) -> Optional[List["AgentConfig"]]:
+    """
+    Parse agent entries incrementally with ijson.
+    
+    Only one entry's dict is alive at a time, so peak memory stays close to
+    the AgentConfig list itself.
+    
+    Args:
+        raw: JSON document bytes or buffer
+        
+    Returns:
+        Parsed agents, or None if the document is not a JSON array or ijson
+        rejects it (the caller then decodes it in full, which reports the
+        problem the usual way)
+        
+    Raises:
+        KeyError: If required fields are missing from agent entries
+    """
+    # ijson silently yields nothing for a non-array document
+    if not bytes(raw[:4096]).lstrip().startswith(b'['):
+        return None
+    
+    if isinstance(raw, mmap.mmap):
+        raw.seek(0)
+        source = raw
+    else:
+        source = io.BytesIO(raw)
+    
+    try:
+        return [AgentConfig.from_dict(item) for item in ijson.items(source, 'item')]
+    except ijson.JSONError:
+        return None
+
+
 class AgentRegistry:
     """Registry of agents and their configurations."""
     
@@ -73,74 +201,128 @@ class AgentRegistry:
         """
         self.control_file_path = control_file_path
         self.agents: List[AgentConfig] = []
-        self._agents_by_type: Dict[str, List[str]] = {}
-        self._agents_by_name: Dict[str, AgentConfig] = {}
+        self._agents_by_type: Mapping[str, Tuple[str, ...]] = MappingProxyType({})
+        self._agents_by_name: Mapping[str, AgentConfig] = MappingProxyType({})
+        self._all_agent_names: Tuple[str, ...] = ()
+        self._all_types: Tuple[str, ...] = ()
+        # (st_mtime_ns, st_size) of the last loaded file, and its BLAKE2b
+        # digest if the last load compared contents (None otherwise)
+        self._file_stamp: Optional[Tuple[int, int]] = None
+        self._file_digest: Optional[bytes] = None
         
         self._load()
     
-    def _load(self):
+    def _load(self, force_hash: bool = False):
         """
         Load agents from control file.
         
+        Parsing is skipped when the file's modification time and size are
+        unchanged since the last successful load. With force_hash, a file
+        whose stat is unchanged is read and its hash compared instead, which
+        catches same-size rewrites within the filesystem's timestamp
+        granularity. Files whose stat changed are reparsed without hashing;
+        a missing digest counts as changed.
+        
+        Args:
+            force_hash: Compare file contents when the stat is unchanged
+            
         Raises:
             FileNotFoundError: If control file does not exist
             json.JSONDecodeError: If control file contains invalid JSON
             ValueError: If control file format is invalid
             KeyError: If required fields are missing from agent entries
         """
-        if not self.control_file_path.exists():
+        try:
+            st = self.control_file_path.stat()
+        except FileNotFoundError:
             raise FileNotFoundError(
                 f"Agent control file not found: {self.control_file_path}"
-            )
+            ) from None
         
-        try:
-            with open(self.control_file_path) as f:
-                data = json.load(f)
-        except json.JSONDecodeError as e:
-            raise json.JSONDecodeError(
-                f"Invalid JSON in agent control file: {e.msg}",
-                e.doc,
-                e.pos
-            )
+        file_stamp = (st.st_mtime_ns, st.st_size)
+        unchanged = file_stamp == self._file_stamp
+        if unchanged and not force_hash:
+            logger.debug("Agent control file unchanged, skipping reload")
+            return
         
-        # Validate that data is a list
-        if not isinstance(data, list):
-            raise ValueError(
-                f"Agent control file must contain a JSON array, got {type(data).__name__}"
-            )
+        with _file_buffer(self.control_file_path, st.st_size) as raw:
+            file_digest = None
+            if unchanged:
+                file_digest = hashlib.blake2b(raw, digest_size=16).digest()
+                if file_digest == self._file_digest:
+                    logger.debug("Agent control file contents unchanged, skipping reload")
+                    return
+            
+            agents = None
+            if ijson is not None and st.st_size >= _STREAM_MIN_SIZE:
+                agents = _stream_agents(raw)
+            
+            if agents is None:
+                try:
+                    data = _decode_json(raw)
+                except json.JSONDecodeError as e:
+                    raise json.JSONDecodeError(
+                        f"Invalid JSON in agent control file: {e.msg}",
+                        e.doc,
+                        e.pos
+                    )
+                
+                # Validate that data is a list
+                if not isinstance(data, list):
+                    raise ValueError(
+                        f"Agent control file must contain a JSON array, got {type(data).__name__}"
+                    )
+                
+                agents = [AgentConfig.from_dict(item) for item in data]
         
-        # Parse agents
-        self.agents = [AgentConfig.from_dict(item) for item in data]
+        self.agents = agents
         
         # Build indexes
-        self._agents_by_type = {}
-        self._agents_by_name = {}
+        agents_by_type: Dict[str, List[str]] = defaultdict(list)
+        for agent in self.agents:
+            agents_by_type[agent.agent_type].append(agent.agent_name)
+        
+        # By name, built in one pass (duplicates keep the last occurrence)
+        agents_by_name = {agent.agent_name: agent for agent in self.agents}
+        if len(agents_by_name) != len(self.agents):
+            self._warn_duplicate_names()
+        
+        # Indexes are read-only until the next load: publish them as
+        # mapping proxies, with each type's agent pool as a tuple
+        self._agents_by_name = MappingProxyType(agents_by_name)
+        self._agents_by_type = MappingProxyType({
+            agent_type: tuple(names) for agent_type, names in agents_by_type.items()
+        })
+        
+        # Listings only change here, so build them once per load
+        self._all_agent_names = tuple(agent.agent_name for agent in self.agents)
+        self._all_types = tuple(self._agents_by_type)
         
+        self._file_stamp = file_stamp
+        self._file_digest = file_digest
+    
+    def _warn_duplicate_names(self):
+        """Log a warning for each repeated agent name in the control file."""
+        seen = set()
         for agent in self.agents:
-            # By type
-            if agent.agent_type not in self._agents_by_type:
-                self._agents_by_type[agent.agent_type] = []
-            self._agents_by_type[agent.agent_type].append(agent.agent_name)
-            
-            # By name (handle duplicates by keeping the last one)
-            if agent.agent_name in self._agents_by_name:
+            if agent.agent_name in seen:
                 logger.warning(
                     f"Duplicate agent name '{agent.agent_name}' found in control file. "
                     f"Using the last occurrence."
                 )
-            self._agents_by_name[agent.agent_name] = agent
+            seen.add(agent.agent_name)
     
-    def get_agents_by_type(self, agent_type: str) -> List[str]:
+    def get_agents_by_type(self, agent_type: str) -> Tuple[str, ...]:
         """
-        Get list of agent names for a given type.
+        Get agent names for a given type.
         
         Args:
             agent_type: The agent type (queue name) to query
             
         Returns:
-            List of agent names for the given type, empty list if type not found
+            Tuple of agent names for the given type, empty tuple if type not found
         """
-        return self._agents_by_type.get(agent_type, [])
+        return self._agents_by_type.get(agent_type, ())
     
     def get_agent_type(self, agent_name: str) -> Optional[str]:
         """
@@ -162,7 +344,7 @@ class AgentRegistry:
         Returns:
             List of all unique agent types
         """
-        return list(self._agents_by_type.keys())
+        return list(self._all_types)
     
     def get_all_agent_names(self) -> List[str]:
         """
@@ -171,19 +353,24 @@ class AgentRegistry:
         Returns:
             List of all agent names in the order they appear in the control file
         """
-        return [agent.agent_name for agent in self.agents]
+        return list(self._all_agent_names)
     
-    def reload(self):
+    def reload(self, force_hash: bool = False):
         """
         Reload agents from control file.
         
         This allows dynamic updates to the agent configuration without restarting
-        the application.
+        the application. An unchanged file (same modification time and size)
+        is not parsed again.
         
+        Args:
+            force_hash: Also compare file contents when the modification time
+                and size are unchanged
+            
         Raises:
             FileNotFoundError: If control file does not exist
             json.JSONDecodeError: If control file contains invalid JSON
             ValueError: If control file format is invalid
             KeyError: If required fields are missing from agent entries
         """
-        self._load()
+        self._load(force_hash=force_hash)
@@ -4,22 +4,26 @@ import argparse
 import json
 import sys
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Callable, List, Optional
 
 try:
-    from .config import TinySchedulerConfig
-    from .validation import validate_agent_control_file
     from ..exceptions import ConfigurationError
 except ImportError:
-    from src.scheduler.config import TinySchedulerConfig
-    from src.scheduler.validation import validate_agent_control_file
     from src.exceptions import ConfigurationError
 
+# Configuration and validation modules are imported where they are used,
+# so --help and argument errors don't pay for loading them
+if TYPE_CHECKING:
+    from .config import TinySchedulerConfig
+
 
-def create_parser() -> argparse.ArgumentParser:
+def create_parser(command: Optional[str] = None) -> argparse.ArgumentParser:
     """
     Create argument parser for TinyScheduler CLI.
     
+    Args:
+        command: Only add the subparser for this command (default: add all)
+        
     Returns:
         Configured ArgumentParser instance
     """
@@ -90,8 +94,15 @@ Environment Variables:
     
     # Subcommands
     subparsers = parser.add_subparsers(dest='command', help='Command to execute')
+    for name, add_subparser in _SUBPARSERS.items():
+        if command is None or name == command:
+            add_subparser(subparsers)
     
-    # Config command
+    return parser
+
+
+def _add_config_parser(subparsers) -> None:
+    """Add the config command's subparser."""
     config_parser = subparsers.add_parser(
         'config',
         help='Show or validate configuration'
@@ -106,8 +117,10 @@ Environment Variables:
         action='store_true',
         help='Output configuration as JSON'
     )
-    
-    # Validate config command
+
+
+def _add_validate_config_parser(subparsers) -> None:
+    """Add the validate-config command's subparser."""
     validate_parser = subparsers.add_parser(
         'validate-config',
         help='Validate configuration without running scheduler'
@@ -117,8 +130,10 @@ Environment Variables:
         action='store_true',
         help='Attempt to create missing directories'
     )
-    
-    # Run command
+
+
+def _add_run_parser(subparsers) -> None:
+    """Add the run command's subparser."""
     run_parser = subparsers.add_parser(
         'run',
         help='Run the scheduler'
@@ -205,11 +220,66 @@ Environment Variables:
         action='store_true',
         help='Disable task blocking feature (rollback to legacy behavior)'
     )
+
+
+# Subparser builders, in help order
+_SUBPARSERS = {
+    'config': _add_config_parser,
+    'validate-config': _add_validate_config_parser,
+    'run': _add_run_parser,
+}
+
+
+# Global options that take a value, which may look like a command name
+_GLOBAL_VALUE_OPTIONS = ('--env-file', '--base-path', '--log-level')
+
+
+def _takes_value(option: str) -> bool:
+    """
+    Check whether a global option consumes the next argument.
     
-    return parser
+    Args:
+        option: Option as typed, possibly abbreviated (argparse accepts
+            unique prefixes)
+        
+    Returns:
+        True if the option is, or abbreviates, a value-taking global option
+    """
+    return len(option) > 2 and '=' not in option and any(
+        name.startswith(option) for name in _GLOBAL_VALUE_OPTIONS
+    )
 
 
-def validate_config_command(config: TinySchedulerConfig, fix: bool = False) -> int:
+def _requested_command(argv: List[str]) -> Optional[str]:
+    """
+    Find the subcommand named on the command line without parsing it.
+    
+    Only global options can come before the subcommand, so it is the first
+    argument that is neither an option nor a global option's value.
+    
+    Args:
+        argv: Command-line arguments
+        
+    Returns:
+        The command if one is named and no help was requested, otherwise
+        None (the full parser is needed)
+    """
+    if '-h' in argv or '--help' in argv:
+        return None
+    
+    args = iter(argv)
+    for arg in args:
+        if arg == '--':
+            arg = next(args, None)
+        elif arg.startswith('-'):
+            if _takes_value(arg):
+                next(args, None)
+            continue
+        return arg if arg in _SUBPARSERS else None
+    return None
+
+
+def validate_config_command(config: "TinySchedulerConfig", fix: bool = False) -> int:
     """
     Execute validate-config command.
     
@@ -220,89 +290,122 @@ def validate_config_command(config: TinySchedulerConfig, fix: bool = False) -> i
     Returns:
         Exit code (0 for success, 1 for failure)
     """
-    print("Validating TinyScheduler configuration...")
-    print()
+    # Collect the report and write it to stdout once at the end, even if
+    # validation raises part way through
+    lines: List[str] = []
+    try:
+        return _validate_config_report(config, fix, lines.append)
+    finally:
+        if lines:
+            sys.stdout.write("\n".join(lines) + "\n")
+
+
+def _validate_config_report(
+    config: "TinySchedulerConfig",
+    fix: bool,
+    out: Callable[[str], None]
+) -> int:
+    """
+    Run the validate-config checks, reporting each line through out.
+    
+    Args:
+        config: TinyScheduler configuration
+        fix: Whether to attempt fixing issues
+        out: Receives each report line
+        
+    Returns:
+        Exit code (0 for success, 1 for failure)
+    """
+    try:
+        from .validation import validate_agent_control_file
+    except ImportError:
+        from src.scheduler.validation import validate_agent_control_file
+    
+    out("Validating TinyScheduler configuration...")
+    out("")
     
     has_errors = False
     
     # Validate standard configuration
-    print("Configuration Settings:")
+    out("Configuration Settings:")
     errors = config.validate()
     
     if errors:
-        print("  ❌ Configuration validation FAILED:")
-        print()
+        out("  ❌ Configuration validation FAILED:")
+        out("")
         for error in errors:
-            print(f"    • {error}")
-        print()
+            out(f"    • {error}")
+        out("")
         has_errors = True
         
         if fix:
-            print("  Attempting to fix issues...")
+            out("  Attempting to fix issues...")
             try:
                 config.ensure_directories()
-                print("  ✓ Created missing directories")
-                print()
+                out("  ✓ Created missing directories")
+                out("")
                 
                 # Re-validate
                 errors = config.validate()
                 if errors:
-                    print("  Some issues remain:")
+                    out("  Some issues remain:")
                     for error in errors:
-                        print(f"    • {error}")
-                    print()
+                        out(f"    • {error}")
+                    out("")
                 else:
-                    print("  ✅ Configuration settings are now valid")
-                    print()
+                    out("  ✅ Configuration settings are now valid")
+                    out("")
                     has_errors = False
             except ConfigurationError as e:
-                print(f"  ✗ Failed to fix issues: {e}")
-                print()
+                out(f"  ✗ Failed to fix issues: {e}")
+                out("")
         else:
-            print("  Run with --fix to attempt automatic fixes")
-            print()
+            out("  Run with --fix to attempt automatic fixes")
+            out("")
     else:
-        print("  ✅ Configuration settings are valid")
-        print()
+        out("  ✅ Configuration settings are valid")
+        out("")
     
     # Validate agent control file
-    print("Agent Control File:")
+    out("Agent Control File:")
     agent_results = validate_agent_control_file(config, fix=fix)
     
     for result in agent_results:
         indent = "  "
         if result.is_error and not result.success:
-            print(f"{indent}{result}")
+            out(f"{indent}{result}")
             has_errors = True
         elif not result.is_error:
             # Info/warning messages
-            print(f"{indent}{result}")
+            out(f"{indent}{result}")
     
-    print()
+    out("")
     
     # Summary
     if has_errors:
-        print("❌ Validation FAILED")
+        out("❌ Validation FAILED")
         if not fix:
-            print("Run with --fix to attempt automatic fixes")
-        return 1
+            out("Run with --fix to attempt automatic fixes")
+        exit_code = 1
     else:
-        print("✅ All validations passed")
-        print()
-        print(f"Base Path: {config.base_path}")
-        print(f"Running Dir: {config.running_dir}")
-        print(f"Log Dir: {config.log_dir}")
-        print(f"Recipes Dir: {config.recipes_dir}")
-        print(f"Agent Control File: {config.agent_control_file}")
-        print(f"Goose Binary: {config.goose_bin}")
-        print(f"MCP Endpoint: {config.mcp_endpoint}")
-        print()
+        out("✅ All validations passed")
+        out("")
+        out(f"Base Path: {config.base_path}")
+        out(f"Running Dir: {config.running_dir}")
+        out(f"Log Dir: {config.log_dir}")
+        out(f"Recipes Dir: {config.recipes_dir}")
+        out(f"Agent Control File: {config.agent_control_file}")
+        out(f"Goose Binary: {config.goose_bin}")
+        out(f"MCP Endpoint: {config.mcp_endpoint}")
+        out("")
         agent_limits = ", ".join(f"{agent}={slots}" for agent, slots in sorted(config.agent_limits.items()))
-        print(f"Agent Limits: {agent_limits}")
-        return 0
+        out(f"Agent Limits: {agent_limits}")
+        exit_code = 0
+    
+    return exit_code
 
 
-def config_command(config: TinySchedulerConfig, show: bool = False, as_json: bool = False) -> int:
+def config_command(config: "TinySchedulerConfig", show: bool = False, as_json: bool = False) -> int:
     """
     Execute config command.
     
@@ -332,9 +435,18 @@ def main(argv: Optional[list] = None) -> int:
     Returns:
         Exit code
     """
-    parser = create_parser()
+    if argv is None:
+        argv = sys.argv[1:]
+    
+    # Only build the subparser that is actually going to be used
+    parser = create_parser(_requested_command(argv))
     args = parser.parse_args(argv)
     
+    try:
+        from .config import TinySchedulerConfig
+    except ImportError:
+        from src.scheduler.config import TinySchedulerConfig
+    
     # Load configuration
     try:
         config = TinySchedulerConfig.from_cli(args)
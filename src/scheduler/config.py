@@ -1,11 +1,15 @@
 """Configuration management for TinyScheduler."""
 
+import functools
 import json
 import os
+import re
 import socket
-from dataclasses import dataclass, field
+import sys
+import threading
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from dotenv import load_dotenv
 
@@ -15,7 +19,128 @@ except ImportError:
     from src.exceptions import ConfigurationError
 
 
-@dataclass
+# Looked up once per process rather than per config instance
+_HOSTNAME = socket.gethostname()
+
+# (field, environment variable, default path parts under the base path)
+# for every path setting resolved relative to the base path
+_PATH_SPECS = (
+    ("running_dir", "TINYSCHEDULER_RUNNING_DIR", ("state", "running")),
+    ("log_dir", "TINYSCHEDULER_LOG_DIR", ("state", "logs")),
+    ("recipes_dir", "TINYSCHEDULER_RECIPES_DIR", ("recipes",)),
+    ("bin_dir", "TINYSCHEDULER_BIN_DIR", ("scripts",)),
+    ("task_cache_dir", "TINYSCHEDULER_TASK_CACHE_DIR", ("state", "tasks")),
+    ("lock_file", "TINYSCHEDULER_LOCK_FILE", ("state", "tinyscheduler.lock")),
+    ("agent_control_file", "TINYSCHEDULER_AGENT_CONTROL_FILE", ("docs", "technical", "agent-control.json")),
+)
+
+# TINYSCHEDULER_AGENT_LIMITS default, and its parsed form
+_DEFAULT_AGENT_LIMITS_STR = '{"dispatcher": 1}'
+_DEFAULT_AGENT_LIMITS = {"dispatcher": 1}
+
+# Accepted values checked by validate()
+_LOG_LEVELS = ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL")
+_VALID_LOG_LEVELS = frozenset(_LOG_LEVELS)
+_MCP_SCHEME_RE = re.compile(r'(?:https?|wss?)://')
+
+
+def _resolve_base_path(base_path_str: str) -> Path:
+    """
+    Resolve a base path string to an absolute, canonical Path.
+    
+    Memoized: resolve() walks the filesystem (realpath), and the same base
+    path is resolved by every from_env()/from_cli() call. A relative path
+    is resolved against the working directory, so that is part of the key.
+    Symlinks are not re-checked: if one in the base path is retargeted
+    while the process runs, the old target is returned until
+    TinySchedulerConfig.invalidate() clears the cache.
+    
+    Args:
+        base_path_str: Base path as configured
+        
+    Returns:
+        Resolved Path
+    """
+    cwd = "" if os.path.isabs(base_path_str) else os.getcwd()
+    return _resolve_path_cached(base_path_str, cwd)
+
+
+@functools.lru_cache(maxsize=32)
+def _resolve_path_cached(path_str: str, cwd: str) -> Path:
+    """
+    Resolve a path string against a working directory.
+    
+    Args:
+        path_str: Absolute or relative path
+        cwd: Working directory for a relative path ("" for an absolute one)
+        
+    Returns:
+        Resolved Path
+    """
+    return Path(cwd, path_str).resolve()
+
+
+@functools.lru_cache(maxsize=32)
+def _parse_agent_limits_cached(limits_str: str) -> Tuple[Tuple[str, int], ...]:
+    """
+    Parse an already stripped agent limits string (JSON or simple format).
+    
+    Memoized per string; the result is an immutable tuple of items so the
+    cached value cannot be changed by callers.
+    
+    Args:
+        limits_str: Agent limits string, already stripped
+        
+    Returns:
+        Tuple of (agent name, slot count) pairs
+        
+    Raises:
+        ConfigurationError: If format is invalid
+    """
+    # Try JSON first
+    if limits_str.startswith('{'):
+        try:
+            limits = json.loads(limits_str)
+            if not isinstance(limits, dict):
+                raise ConfigurationError("Agent limits JSON must be an object")
+            # Validate values are integers
+            for agent, slots in limits.items():
+                if not isinstance(slots, int) or slots < 0:
+                    raise ConfigurationError(f"Invalid slot count for agent '{agent}': {slots}")
+            return tuple(limits.items())
+        except json.JSONDecodeError as e:
+            raise ConfigurationError(f"Invalid JSON in agent limits: {e}")
+    
+    # Try simple format: agent1:slots1,agent2:slots2
+    limits = {}
+    if limits_str:
+        for spec in limits_str.split(','):
+            spec = spec.strip()
+            if ':' not in spec:
+                raise ConfigurationError(f"Invalid agent limit format (expected 'agent:slots'): {spec}")
+            agent, slots_str = spec.split(':', 1)
+            agent = agent.strip()
+            try:
+                slots = int(slots_str.strip())
+                if slots < 0:
+                    raise ValueError("Negative slot count")
+                limits[agent] = slots
+            except ValueError:
+                raise ConfigurationError(f"Invalid slot count for agent '{agent}': {slots_str}")
+    
+    return tuple(limits.items())
+
+
+# Slotted instances on Python 3.10+ (dataclass(slots=True) is new in 3.10)
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# Process-wide configuration returned by TinySchedulerConfig.get()
+_cached_config: Optional["TinySchedulerConfig"] = None
+_cached_env_file: Optional[str] = None
+_cache_lock = threading.Lock()
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class TinySchedulerConfig:
     """Configuration for TinyScheduler control plane."""
     
@@ -48,7 +173,7 @@ class TinySchedulerConfig:
     disable_blocking: bool = False
     
     # Runtime metadata
-    hostname: str = field(default_factory=socket.gethostname)
+    hostname: str = _HOSTNAME
     
     @classmethod
     def from_env(cls, env_file: Optional[str] = None) -> "TinySchedulerConfig":
@@ -69,101 +194,52 @@ class TinySchedulerConfig:
         else:
             load_dotenv()
         
-        # Base path (defaults to workspace/calypso)
-        base_path_str = os.getenv("TINYSCHEDULER_BASE_PATH", "/home/user/workspace/calypso")
-        base_path = Path(base_path_str).resolve()
-        
-        # Derive directory paths relative to base
-        running_dir_str = os.getenv("TINYSCHEDULER_RUNNING_DIR")
-        if running_dir_str:
-            running_dir = Path(running_dir_str)
-            if not running_dir.is_absolute():
-                running_dir = base_path / running_dir
-        else:
-            running_dir = base_path / "state" / "running"
-        
-        log_dir_str = os.getenv("TINYSCHEDULER_LOG_DIR")
-        if log_dir_str:
-            log_dir = Path(log_dir_str)
-            if not log_dir.is_absolute():
-                log_dir = base_path / log_dir
-        else:
-            log_dir = base_path / "state" / "logs"
-        
-        recipes_dir_str = os.getenv("TINYSCHEDULER_RECIPES_DIR")
-        if recipes_dir_str:
-            recipes_dir = Path(recipes_dir_str)
-            if not recipes_dir.is_absolute():
-                recipes_dir = base_path / recipes_dir
-        else:
-            recipes_dir = base_path / "recipes"
-        
-        bin_dir_str = os.getenv("TINYSCHEDULER_BIN_DIR")
-        if bin_dir_str:
-            bin_dir = Path(bin_dir_str)
-            if not bin_dir.is_absolute():
-                bin_dir = base_path / bin_dir
-        else:
-            bin_dir = base_path / "scripts"
-        
-        task_cache_dir_str = os.getenv("TINYSCHEDULER_TASK_CACHE_DIR")
-        if task_cache_dir_str:
-            task_cache_dir = Path(task_cache_dir_str)
-            if not task_cache_dir.is_absolute():
-                task_cache_dir = base_path / task_cache_dir
-        else:
-            task_cache_dir = base_path / "state" / "tasks"
+        # One snapshot of the environment instead of a getenv call per setting
+        env = dict(os.environ)
         
-        lock_file_str = os.getenv("TINYSCHEDULER_LOCK_FILE")
-        if lock_file_str:
-            lock_file = Path(lock_file_str)
-            if not lock_file.is_absolute():
-                lock_file = base_path / lock_file
-        else:
-            lock_file = base_path / "state" / "tinyscheduler.lock"
-        
-        # Agent control file
-        agent_control_file_str = os.getenv("TINYSCHEDULER_AGENT_CONTROL_FILE")
-        if agent_control_file_str:
-            agent_control_file = Path(agent_control_file_str)
-            if not agent_control_file.is_absolute():
-                agent_control_file = base_path / agent_control_file
-        else:
-            agent_control_file = base_path / "docs" / "technical" / "agent-control.json"
+        # Base path (defaults to workspace/calypso)
+        base_path_str = env.get("TINYSCHEDULER_BASE_PATH", "/home/user/workspace/calypso")
+        base_path = _resolve_base_path(base_path_str)
+        
+        # Derive directory and file paths relative to base
+        paths: Dict[str, Path] = {}
+        for attr, key, default_parts in _PATH_SPECS:
+            value = env.get(key)
+            if value:
+                path = Path(value)
+                if not path.is_absolute():
+                    path = base_path / path
+            else:
+                path = base_path.joinpath(*default_parts)
+            paths[attr] = path
         
         # Agent limits (JSON or simple format)
-        agent_limits_str = os.getenv("TINYSCHEDULER_AGENT_LIMITS", '{"dispatcher": 1}')
+        agent_limits_str = env.get("TINYSCHEDULER_AGENT_LIMITS", _DEFAULT_AGENT_LIMITS_STR)
         agent_limits = cls._parse_agent_limits(agent_limits_str)
         
         # Goose binary path
-        goose_bin_str = os.getenv("TINYSCHEDULER_GOOSE_BIN", "/root/.local/bin/goose")
+        goose_bin_str = env.get("TINYSCHEDULER_GOOSE_BIN", "/root/.local/bin/goose")
         goose_bin = Path(goose_bin_str)
         if not goose_bin.is_absolute():
             goose_bin = base_path / goose_bin
         
         # Tinytask MCP endpoint
-        mcp_endpoint = os.getenv("TINYSCHEDULER_MCP_ENDPOINT", "http://localhost:3000")
+        mcp_endpoint = env.get("TINYSCHEDULER_MCP_ENDPOINT", "http://localhost:3000")
         
         # Scheduler timing
-        loop_interval = int(os.getenv("TINYSCHEDULER_LOOP_INTERVAL_SEC", "60"))
-        heartbeat_interval = int(os.getenv("TINYSCHEDULER_HEARTBEAT_SEC", "15"))
-        max_runtime = int(os.getenv("TINYSCHEDULER_MAX_RUNTIME_SEC", "3600"))
+        loop_interval = int(env.get("TINYSCHEDULER_LOOP_INTERVAL_SEC", "60"))
+        heartbeat_interval = int(env.get("TINYSCHEDULER_HEARTBEAT_SEC", "15"))
+        max_runtime = int(env.get("TINYSCHEDULER_MAX_RUNTIME_SEC", "3600"))
         
         # Operational settings
-        log_level = os.getenv("TINYSCHEDULER_LOG_LEVEL", "INFO")
-        dry_run = os.getenv("TINYSCHEDULER_DRY_RUN", "false").lower() in ("true", "1", "yes")
-        enabled = os.getenv("TINYSCHEDULER_ENABLED", "false").lower() in ("true", "1", "yes")
-        disable_blocking = os.getenv("TINYSCHEDULER_DISABLE_BLOCKING", "false").lower() in ("true", "1", "yes")
+        log_level = env.get("TINYSCHEDULER_LOG_LEVEL", "INFO")
+        dry_run = env.get("TINYSCHEDULER_DRY_RUN", "false").lower() in ("true", "1", "yes")
+        enabled = env.get("TINYSCHEDULER_ENABLED", "false").lower() in ("true", "1", "yes")
+        disable_blocking = env.get("TINYSCHEDULER_DISABLE_BLOCKING", "false").lower() in ("true", "1", "yes")
         
         return cls(
             base_path=base_path,
-            running_dir=running_dir,
-            log_dir=log_dir,
-            recipes_dir=recipes_dir,
-            bin_dir=bin_dir,
-            task_cache_dir=task_cache_dir,
-            lock_file=lock_file,
-            agent_control_file=agent_control_file,
+            **paths,
             agent_limits=agent_limits,
             goose_bin=goose_bin,
             mcp_endpoint=mcp_endpoint,
@@ -176,6 +252,47 @@ class TinySchedulerConfig:
             disable_blocking=disable_blocking,
         )
     
+    @classmethod
+    def get(cls, env_file: Optional[str] = None, force: bool = False) -> "TinySchedulerConfig":
+        """
+        Get the process-wide configuration, loading it on first use.
+        
+        The environment is parsed once; later calls return the same instance
+        (unless a different env_file is requested). Treat the result as
+        read-only, since it is shared. Use from_env() or from_cli() for a
+        private copy.
+        
+        Args:
+            env_file: Path to .env file (optional)
+            force: Reload even if a configuration is already cached
+            
+        Returns:
+            Shared TinySchedulerConfig instance
+            
+        Raises:
+            ConfigurationError: If required variables are missing or invalid
+        """
+        global _cached_config, _cached_env_file
+        with _cache_lock:
+            if force or _cached_config is None or env_file != _cached_env_file:
+                _cached_config = cls.from_env(env_file)
+                _cached_env_file = env_file
+            return _cached_config
+    
+    @classmethod
+    def invalidate(cls) -> None:
+        """
+        Drop the configuration cached by get(), e.g. between tests.
+        
+        Resolved base paths are forgotten too, so a retargeted symlink in
+        the base path is followed on the next load.
+        """
+        global _cached_config, _cached_env_file
+        with _cache_lock:
+            _cached_config = None
+            _cached_env_file = None
+            _resolve_path_cached.cache_clear()
+    
     @classmethod
     def from_cli(cls, args) -> "TinySchedulerConfig":
         """
@@ -192,7 +309,7 @@ class TinySchedulerConfig:
         
         # Override with CLI arguments if provided
         if hasattr(args, 'base_path') and args.base_path:
-            config.base_path = Path(args.base_path).resolve()
+            config.base_path = _resolve_base_path(args.base_path)
         
         if hasattr(args, 'running_dir') and args.running_dir:
             running_dir = Path(args.running_dir)
@@ -265,38 +382,11 @@ class TinySchedulerConfig:
         """
         limits_str = limits_str.strip()
         
-        # Try JSON first
-        if limits_str.startswith('{'):
-            try:
-                limits = json.loads(limits_str)
-                if not isinstance(limits, dict):
-                    raise ConfigurationError("Agent limits JSON must be an object")
-                # Validate values are integers
-                for agent, slots in limits.items():
-                    if not isinstance(slots, int) or slots < 0:
-                        raise ConfigurationError(f"Invalid slot count for agent '{agent}': {slots}")
-                return limits
-            except json.JSONDecodeError as e:
-                raise ConfigurationError(f"Invalid JSON in agent limits: {e}")
-        
-        # Try simple format: agent1:slots1,agent2:slots2
-        limits = {}
-        if limits_str:
-            for spec in limits_str.split(','):
-                spec = spec.strip()
-                if ':' not in spec:
-                    raise ConfigurationError(f"Invalid agent limit format (expected 'agent:slots'): {spec}")
-                agent, slots_str = spec.split(':', 1)
-                agent = agent.strip()
-                try:
-                    slots = int(slots_str.strip())
-                    if slots < 0:
-                        raise ValueError("Negative slot count")
-                    limits[agent] = slots
-                except ValueError:
-                    raise ConfigurationError(f"Invalid slot count for agent '{agent}': {slots_str}")
-        
-        return limits
+        # The default needs no parsing (copied, since from_cli() mutates it)
+        if limits_str == _DEFAULT_AGENT_LIMITS_STR:
+            return dict(_DEFAULT_AGENT_LIMITS)
+        
+        return dict(_parse_agent_limits_cached(limits_str))
     
     def validate(self) -> List[str]:
         """
@@ -340,12 +430,11 @@ class TinySchedulerConfig:
             errors.append(f"Max runtime must be positive: {self.max_runtime_sec}")
         
         # Validate log level
-        valid_levels = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
-        if self.log_level.upper() not in valid_levels:
-            errors.append(f"Invalid log level: {self.log_level}. Must be one of: {', '.join(valid_levels)}")
+        if self.log_level.upper() not in _VALID_LOG_LEVELS:
+            errors.append(f"Invalid log level: {self.log_level}. Must be one of: {', '.join(_LOG_LEVELS)}")
         
         # Validate MCP endpoint format
-        if not self.mcp_endpoint.startswith(('http://', 'https://', 'ws://', 'wss://')):
+        if not _MCP_SCHEME_RE.match(self.mcp_endpoint):
             errors.append(f"Invalid MCP endpoint (must start with http://, https://, ws://, or wss://): {self.mcp_endpoint}")
         
         return errors
@@ -357,23 +446,22 @@ class TinySchedulerConfig:
         Raises:
             ConfigurationError: If directories cannot be created
         """
-        dirs_to_create = [
+        # Deduplicated, in order (the lock file usually shares state/)
+        dirs_to_create = dict.fromkeys([
             self.running_dir,
             self.log_dir,
             self.task_cache_dir,
-        ]
+            self.lock_file.parent,
+        ])
         
+        # Checked on every call: a directory may be removed while the
+        # scheduler runs, and is_dir() is a single stat
         for directory in dirs_to_create:
             try:
-                directory.mkdir(parents=True, exist_ok=True)
+                if not directory.is_dir():
+                    directory.mkdir(parents=True, exist_ok=True)
             except Exception as e:
                 raise ConfigurationError(f"Failed to create directory {directory}: {e}")
-        
-        # Ensure lock file directory exists
-        try:
-            self.lock_file.parent.mkdir(parents=True, exist_ok=True)
-        except Exception as e:
-            raise ConfigurationError(f"Failed to create lock file directory {self.lock_file.parent}: {e}")
     
     def to_dict(self) -> Dict:
         """
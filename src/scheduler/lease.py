@@ -3,11 +3,13 @@
 import json
 import os
 import signal
+import sys
 import tempfile
-from dataclasses import dataclass, field
+from copy import deepcopy
+from dataclasses import dataclass, field, replace
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional, Set, Tuple, Union
 
 try:
     from ..exceptions import ConfigurationError
@@ -16,8 +18,68 @@ except ImportError:
     from src.exceptions import ConfigurationError
     from src.scheduler.validators import validate_lease_path, validate_json_file_size
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+if orjson is not None:
+    def _dump_lease_json(data: Dict) -> bytes:
+        """Serialize lease data to indented JSON bytes (orjson)."""
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    
+    _load_lease_json = orjson.loads
+else:
+    # json.dumps(indent=2) builds a new encoder per call; reuse one
+    _LEASE_ENCODER = json.JSONEncoder(indent=2)
+    
+    def _dump_lease_json(data: Dict) -> bytes:
+        """Serialize lease data to indented JSON bytes."""
+        return _LEASE_ENCODER.encode(data).encode('utf-8')
+    
+    _load_lease_json = json.loads
+
+
+if sys.version_info >= (3, 11):
+    # Accepts a trailing 'Z' natively
+    _parse_timestamp = datetime.fromisoformat
+else:
+    def _parse_timestamp(value: str) -> datetime:
+        """Parse an ISO-8601 timestamp, accepting a trailing 'Z' for UTC."""
+        if value.endswith('Z'):
+            value = value[:-1] + '+00:00'
+        return datetime.fromisoformat(value)
+
+
+def _format_timestamp(value: datetime) -> str:
+    """Format a timestamp as ISO-8601, writing UTC as 'Z'."""
+    iso = value.isoformat()
+    if iso.endswith('+00:00'):
+        return iso[:-6] + 'Z'
+    return iso
+
+
+def _as_utc(value: datetime) -> datetime:
+    """Treat a naive timestamp as UTC; aware ones are returned unchanged."""
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value
+
 
-@dataclass
+# On Linux, one listing of /proc gives every live PID at once
+_PROC_DIR = "/proc"
+_HAVE_PROC = sys.platform.startswith("linux") and os.path.isdir(_PROC_DIR)
+
+# Subdirectory of the lease directory for leases that are no longer
+# running, so scans for active leases never read them
+_ARCHIVE_DIR = "archive"
+
+# dataclass(slots=True) needs Python 3.10; older versions keep a __dict__
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class Lease:
     """Represents a task execution lease."""
     
@@ -47,8 +109,8 @@ class Lease:
             agent=data['agent'],
             pid=data['pid'],
             recipe=data['recipe'],
-            started_at=datetime.fromisoformat(data['started_at'].replace('Z', '+00:00')),
-            heartbeat=datetime.fromisoformat(data['heartbeat'].replace('Z', '+00:00')),
+            started_at=_parse_timestamp(data['started_at']),
+            heartbeat=_parse_timestamp(data['heartbeat']),
             host=data['host'],
             state=data.get('state', 'running'),
             metadata=data.get('metadata', {}),
@@ -66,25 +128,41 @@ class Lease:
             'agent': self.agent,
             'pid': self.pid,
             'recipe': self.recipe,
-            'started_at': self.started_at.isoformat().replace('+00:00', 'Z'),
-            'heartbeat': self.heartbeat.isoformat().replace('+00:00', 'Z'),
+            'started_at': _format_timestamp(self.started_at),
+            'heartbeat': _format_timestamp(self.heartbeat),
             'host': self.host,
             'state': self.state,
             'metadata': self.metadata,
         }
     
-    def is_stale(self, max_runtime_sec: int, heartbeat_threshold_multiplier: int = 3) -> bool:
+    def copy(self) -> "Lease":
+        """
+        Get an independent copy of the lease.
+        
+        Returns:
+            Lease equal to this one, sharing no mutable state with it
+        """
+        return replace(self, metadata=deepcopy(self.metadata))
+    
+    def is_stale(
+        self,
+        max_runtime_sec: int,
+        heartbeat_threshold_multiplier: int = 3,
+        now: Optional[datetime] = None
+    ) -> bool:
         """
         Check if lease is stale based on heartbeat and runtime.
         
         Args:
             max_runtime_sec: Maximum allowed runtime in seconds
             heartbeat_threshold_multiplier: Multiplier for heartbeat interval to consider stale
+            now: Current UTC time (defaults to datetime.now)
             
         Returns:
             True if lease is stale
         """
-        now = datetime.now(timezone.utc)
+        if now is None:
+            now = datetime.now(timezone.utc)
         
         # Check if max runtime exceeded
         runtime_sec = (now - self.started_at).total_seconds()
@@ -100,24 +178,32 @@ class Lease:
         
         return False
     
-    def age_seconds(self) -> float:
+    def age_seconds(self, now: Optional[datetime] = None) -> float:
         """
         Get age of lease in seconds since start.
         
+        Args:
+            now: Current UTC time (defaults to datetime.now)
+            
         Returns:
             Age in seconds
         """
-        now = datetime.now(timezone.utc)
+        if now is None:
+            now = datetime.now(timezone.utc)
         return (now - self.started_at).total_seconds()
     
-    def heartbeat_age_seconds(self) -> float:
+    def heartbeat_age_seconds(self, now: Optional[datetime] = None) -> float:
         """
         Get age of last heartbeat in seconds.
         
+        Args:
+            now: Current UTC time (defaults to datetime.now)
+            
         Returns:
             Heartbeat age in seconds
         """
-        now = datetime.now(timezone.utc)
+        if now is None:
+            now = datetime.now(timezone.utc)
         return (now - self.heartbeat).total_seconds()
 
 
@@ -133,63 +219,189 @@ class LeaseStore:
         """
         self.lease_dir = lease_dir
         self.lease_dir.mkdir(parents=True, exist_ok=True)
+        # Created on first use
+        self.archive_dir = lease_dir / _ARCHIVE_DIR
+        # task_id -> ((mtime_ns, ctime_ns, inode, size), parsed lease);
+        # unchanged lease files are served from here instead of being
+        # re-read every pass
+        self._cache: Dict[str, Tuple[Tuple[int, int, int, int], Lease]] = {}
     
-    def _lease_path(self, task_id: str) -> Path:
+    def _lease_path(self, task_id: str, state: str = "running") -> Path:
         """
         Get path to lease file for task.
         
+        Running leases live directly in the lease directory; leases in any
+        other state live in its archive subdirectory.
+        
         Args:
             task_id: Task identifier
+            state: Lease state
             
         Returns:
             Path to lease file
         """
-        return self.lease_dir / f"task_{task_id}.json"
+        directory = self.lease_dir if state == "running" else self.archive_dir
+        return directory / f"task_{task_id}.json"
     
-    def create(self, lease: Lease) -> None:
+    def _lease_paths(self, task_id: str) -> Tuple[Path, Path]:
         """
-        Create a new lease file atomically.
+        Get both places a task's lease file may be.
         
         Args:
-            lease: Lease to create
+            task_id: Task identifier
+            
+        Returns:
+            (running path, archive path)
+        """
+        name = f"task_{task_id}.json"
+        return self.lease_dir / name, self.archive_dir / name
+    
+    def _other_lease_path(self, task_id: str, lease_path: Path) -> Path:
+        """
+        Get the location of a task's lease other than lease_path.
+        
+        Args:
+            task_id: Task identifier
+            lease_path: Running or archive path of the lease
+            
+        Returns:
+            The archive path for a running path, and vice versa
+        """
+        running_path, archive_path = self._lease_paths(task_id)
+        return archive_path if lease_path == running_path else running_path
+    
+    def _atomic_write(self, lease: Lease, *, must_exist: bool) -> bool:
+        """
+        Write a lease file atomically via a temp file next to the lease files.
+        
+        New leases are hard-linked into place, which fails atomically if the
+        lease already exists; the lease's other location (running or
+        archive) is checked only afterwards, so a concurrent create there
+        cannot slip past the check. Existing leases are swapped with
+        os.replace(), after _claim_update_path() has made sure one is there.
+        
+        Args:
+            lease: Lease to write
+            must_exist: True to update an existing lease, False to create one
+            
+        Returns:
+            False if the lease already exists in either location (create)
+            or does not exist (update)
             
         Raises:
-            FileExistsError: If lease already exists
-            ConfigurationError: If write fails
+            OSError: If the write fails
         """
-        lease_path = self._lease_path(lease.task_id)
+        self._cache.pop(lease.task_id, None)
         
-        if lease_path.exists():
-            raise FileExistsError(f"Lease already exists for task {lease.task_id}")
+        lease_path = self._lease_path(lease.task_id, lease.state)
+        
+        if lease.state != "running":
+            self.archive_dir.mkdir(exist_ok=True)
+        
+        data = _dump_lease_json(lease.to_dict())
+        
+        # Create temp file in same directory to ensure same filesystem
+        fd, temp_path = tempfile.mkstemp(
+            dir=self.lease_dir,
+            prefix=f"task_{lease.task_id}_",
+            suffix=".tmp"
+        )
         
-        # Write atomically using temp file + rename
         try:
-            lease_data = json.dumps(lease.to_dict(), indent=2)
+            try:
+                view = memoryview(data)
+                while view:
+                    view = view[os.write(fd, view):]
+                os.fsync(fd)
+            finally:
+                os.close(fd)
             
-            # Create temp file in same directory to ensure same filesystem
-            fd, temp_path = tempfile.mkstemp(
-                dir=self.lease_dir,
-                prefix=f"task_{lease.task_id}_",
-                suffix=".tmp"
-            )
+            # The mtime doubles as the heartbeat (see update_heartbeat)
+            heartbeat = _as_utc(lease.heartbeat).timestamp()
+            os.utime(temp_path, (heartbeat, heartbeat))
+            
+            if must_exist:
+                if not self._claim_update_path(lease.task_id, lease_path):
+                    return False
+                os.replace(temp_path, lease_path)
+                temp_path = None
+                return True
             
             try:
-                with os.fdopen(fd, 'w') as f:
-                    f.write(lease_data)
-                    f.flush()
-                    os.fsync(f.fileno())
-                
-                # Atomic rename
-                os.rename(temp_path, lease_path)
-            except Exception:
-                # Clean up temp file on error
+                os.link(temp_path, lease_path)
+            except FileExistsError:
+                return False
+            except OSError:
+                # No hard link support: claim the name with an exclusive
+                # create, then swap the finished file in over the placeholder
+                try:
+                    os.close(os.open(lease_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600))
+                except FileExistsError:
+                    return False
+                try:
+                    os.replace(temp_path, lease_path)
+                except OSError:
+                    os.unlink(lease_path)
+                    raise
+                temp_path = None
+            
+            # An archived (or running) lease for the task also counts
+            if os.path.lexists(self._other_lease_path(lease.task_id, lease_path)):
+                os.unlink(lease_path)
+                return False
+            return True
+        finally:
+            if temp_path is not None:
                 try:
                     os.unlink(temp_path)
                 except OSError:
                     pass  # Ignore errors during cleanup - file may not exist
-                raise
+    
+    def _claim_update_path(self, task_id: str, lease_path: Path) -> bool:
+        """
+        Make sure an existing lease file is at the path for its new state.
+        
+        The common case, an update without a state change, costs one stat.
+        Otherwise the lease is moved over from the other location, still
+        holding its old contents until the caller replaces them.
+        
+        Args:
+            task_id: Task identifier
+            lease_path: Path for the lease's (new) state
+            
+        Returns:
+            False if the lease exists in neither location
+        """
+        try:
+            os.stat(lease_path)
+            return True
+        except FileNotFoundError:
+            pass
+        
+        try:
+            os.rename(self._other_lease_path(task_id, lease_path), lease_path)
+        except FileNotFoundError:
+            return False
+        return True
+    
+    def create(self, lease: Lease) -> None:
+        """
+        Create a new lease file atomically.
+        
+        Args:
+            lease: Lease to create
+            
+        Raises:
+            FileExistsError: If lease already exists
+            ConfigurationError: If write fails
+        """
+        try:
+            created = self._atomic_write(lease, must_exist=False)
         except Exception as e:
             raise ConfigurationError(f"Failed to create lease for task {lease.task_id}: {e}")
+        
+        if not created:
+            raise FileExistsError(f"Lease already exists for task {lease.task_id}")
     
     def read(self, task_id: str) -> Optional[Lease]:
         """
@@ -201,24 +413,76 @@ class LeaseStore:
         Returns:
             Lease if exists, None otherwise
         """
-        lease_path = self._lease_path(task_id)
+        for lease_path in self._lease_paths(task_id):
+            try:
+                st = os.stat(lease_path)
+            except FileNotFoundError:
+                continue
+            except Exception as e:
+                print(f"Warning: Failed to read lease for task {task_id}: {e}")
+                return None
+            
+            return self._read_file(lease_path, task_id, st)
         
-        if not lease_path.exists():
-            return None
+        self._cache.pop(task_id, None)
+        return None
+    
+    def _read_file(
+        self,
+        lease_path: Union[str, Path],
+        task_id: str,
+        st: os.stat_result
+    ) -> Optional[Lease]:
+        """
+        Parse a lease file, reusing the cached lease if the file is unchanged.
+        
+        Callers get a copy of the cached lease, so changing it before an
+        update() cannot make the cache disagree with the file.
+        
+        Args:
+            lease_path: Path to the lease file
+            task_id: Task identifier
+            st: Stat result for lease_path
+            
+        Returns:
+            Lease if the file exists and parses, None otherwise
+        """
+        # The mtime is set to the heartbeat, so a rewrite that keeps the
+        # heartbeat keeps the mtime too, and the replaced file's inode
+        # number may be reused at once. Writing sets the ctime, which
+        # cannot be set back, so it tells such rewrites apart.
+        stamp = (st.st_mtime_ns, st.st_ctime_ns, st.st_ino, st.st_size)
+        cached = self._cache.get(task_id)
+        if cached is not None and cached[0] == stamp:
+            return cached[1].copy()
         
         try:
-            with open(lease_path, 'r') as f:
-                data = json.load(f)
-            return Lease.from_dict(data)
+            with open(lease_path, 'rb') as f:
+                data = _load_lease_json(f.read())
+            lease = Lease.from_dict(data)
+            
+            # update_heartbeat() only bumps the mtime
+            touched = datetime.fromtimestamp(st.st_mtime_ns / 1e9, timezone.utc)
+            if touched > _as_utc(lease.heartbeat):
+                lease.heartbeat = touched
+        except FileNotFoundError:
+            self._cache.pop(task_id, None)
+            return None
         except Exception as e:
             # Log error but don't raise - corrupted leases should be recoverable
             print(f"Warning: Failed to read lease for task {task_id}: {e}")
             return None
+        
+        self._cache[task_id] = (stamp, lease)
+        return lease.copy()
     
     def update(self, lease: Lease) -> None:
         """
         Update an existing lease file atomically.
         
+        A state change moves the lease between the lease directory and its
+        archive subdirectory.
+        
         Args:
             lease: Lease to update
             
@@ -226,39 +490,13 @@ class LeaseStore:
             FileNotFoundError: If lease doesn't exist
             ConfigurationError: If write fails
         """
-        lease_path = self._lease_path(lease.task_id)
-        
-        if not lease_path.exists():
-            raise FileNotFoundError(f"Lease does not exist for task {lease.task_id}")
-        
-        # Write atomically using temp file + rename
         try:
-            lease_data = json.dumps(lease.to_dict(), indent=2)
-            
-            # Create temp file in same directory
-            fd, temp_path = tempfile.mkstemp(
-                dir=self.lease_dir,
-                prefix=f"task_{lease.task_id}_",
-                suffix=".tmp"
-            )
-            
-            try:
-                with os.fdopen(fd, 'w') as f:
-                    f.write(lease_data)
-                    f.flush()
-                    os.fsync(f.fileno())
-                
-                # Atomic rename
-                os.rename(temp_path, lease_path)
-            except Exception:
-                # Clean up temp file on error
-                try:
-                    os.unlink(temp_path)
-                except OSError:
-                    pass
-                raise
+            updated = self._atomic_write(lease, must_exist=True)
         except Exception as e:
             raise ConfigurationError(f"Failed to update lease for task {lease.task_id}: {e}")
+        
+        if not updated:
+            raise FileNotFoundError(f"Lease does not exist for task {lease.task_id}")
     
     def delete(self, task_id: str) -> bool:
         """
@@ -270,17 +508,77 @@ class LeaseStore:
         Returns:
             True if lease was deleted, False if it didn't exist
         """
-        lease_path = self._lease_path(task_id)
+        self._cache.pop(task_id, None)
+        deleted = False
         
-        if not lease_path.exists():
-            return False
+        for lease_path in self._lease_paths(task_id):
+            try:
+                lease_path.unlink()
+                deleted = True
+            except FileNotFoundError:
+                pass
+            except Exception as e:
+                print(f"Warning: Failed to delete lease for task {task_id}: {e}")
+        
+        return deleted
+    
+    def _iter_leases(self, running_only: bool = False) -> Iterator[Lease]:
+        """
+        Read every lease file once.
+        
+        Args:
+            running_only: Skip the archive subdirectory of non-running leases
+            
+        Yields:
+            Lease objects (unreadable lease files are skipped)
+        """
+        seen: Set[str] = set()
+        
+        yield from self._scan_dir(self.lease_dir, seen)
+        if running_only:
+            return
+        yield from self._scan_dir(self.archive_dir, seen)
+        
+        # Forget leases whose files were removed behind our back
+        for task_id in self._cache.keys() - seen:
+            del self._cache[task_id]
+    
+    def _scan_dir(self, directory: Path, seen: Set[str]) -> Iterator[Lease]:
+        """
+        Read the lease files in one directory.
         
+        Args:
+            directory: Lease directory or archive subdirectory
+            seen: Collects the task IDs found
+            
+        Yields:
+            Lease objects (unreadable lease files are skipped)
+        """
         try:
-            lease_path.unlink()
-            return True
-        except Exception as e:
-            print(f"Warning: Failed to delete lease for task {task_id}: {e}")
-            return False
+            entries = os.scandir(directory)
+        except FileNotFoundError:
+            return  # No archive yet
+        
+        with entries:
+            for entry in entries:
+                name = entry.name
+                if not (name.startswith("task_") and name.endswith(".json")):
+                    continue
+                if not entry.is_file(follow_symlinks=False):
+                    continue
+                
+                task_id = name[5:-5]
+                seen.add(task_id)
+                
+                # Read straight from the entry path rather than rebuilding
+                # a Path from the task ID
+                try:
+                    st = entry.stat(follow_symlinks=False)
+                except FileNotFoundError:
+                    continue
+                lease = self._read_file(entry.path, task_id, st)
+                if lease:
+                    yield lease
     
     def list_all(self) -> List[Lease]:
         """
@@ -289,17 +587,7 @@ class LeaseStore:
         Returns:
             List of Lease objects
         """
-        leases = []
-        
-        for lease_file in self.lease_dir.glob("task_*.json"):
-            # Extract task ID from filename
-            task_id = lease_file.stem.replace("task_", "")
-            
-            lease = self.read(task_id)
-            if lease:
-                leases.append(lease)
-        
-        return leases
+        return list(self._iter_leases())
     
     def list_by_agent(self, agent: str) -> List[Lease]:
         """
@@ -311,29 +599,28 @@ class LeaseStore:
         Returns:
             List of Lease objects for the agent
         """
-        return [lease for lease in self.list_all() if lease.agent == agent]
+        return [lease for lease in self._iter_leases() if lease.agent == agent]
     
     def update_heartbeat(self, task_id: str) -> bool:
         """
         Update heartbeat timestamp for a lease.
         
+        Only the file's mtime is touched; read() reports the later of the
+        stored heartbeat and the mtime, so the JSON is not rewritten.
+        
         Args:
             task_id: Task identifier
             
         Returns:
             True if updated, False if lease doesn't exist
         """
-        lease = self.read(task_id)
-        if not lease:
-            return False
-        
-        lease.heartbeat = datetime.now(timezone.utc)
-        
-        try:
-            self.update(lease)
-            return True
-        except Exception:
-            return False
+        for lease_path in self._lease_paths(task_id):
+            try:
+                os.utime(lease_path)
+                return True
+            except OSError:
+                continue
+        return False
     
     @staticmethod
     def is_process_alive(pid: int) -> bool:
@@ -357,6 +644,22 @@ class LeaseStore:
         except OSError:
             return False
     
+    @staticmethod
+    def _alive_pid_set() -> Optional[Set[int]]:
+        """
+        Get the PIDs of all running processes with a single /proc listing.
+        
+        Returns:
+            Set of live PIDs, or None if /proc is not available
+        """
+        if not _HAVE_PROC:
+            return None
+        
+        try:
+            return {int(name) for name in os.listdir(_PROC_DIR) if name.isdigit()}
+        except OSError:
+            return None
+    
     def find_stale_leases(
         self,
         max_runtime_sec: int,
@@ -373,29 +676,59 @@ class LeaseStore:
             List of (Lease, reason) tuples for stale leases
         """
         stale_leases = []
+        alive_pids = self._alive_pid_set() if check_pid else None
+        now = datetime.now(timezone.utc)
         
-        for lease in self.list_all():
-            # Check if PID is dead
-            if check_pid and not self.is_process_alive(lease.pid):
-                stale_leases.append((lease, f"Process {lease.pid} is not alive"))
-                continue
-            
-            # Check if lease is stale by time
-            if lease.is_stale(max_runtime_sec):
-                if lease.age_seconds() > max_runtime_sec:
-                    stale_leases.append((
-                        lease,
-                        f"Runtime exceeded {max_runtime_sec}s (actual: {lease.age_seconds():.0f}s)"
-                    ))
-                else:
-                    stale_leases.append((
-                        lease,
-                        f"Heartbeat stale (age: {lease.heartbeat_age_seconds():.0f}s)"
-                    ))
-                continue
+        for lease in self._iter_leases():
+            reason = self._stale_reason(lease, max_runtime_sec, check_pid, alive_pids, now)
+            if reason:
+                stale_leases.append((lease, reason))
         
         return stale_leases
     
+    def _stale_reason(
+        self,
+        lease: Lease,
+        max_runtime_sec: int,
+        check_pid: bool,
+        alive_pids: Optional[Set[int]] = None,
+        now: Optional[datetime] = None
+    ) -> Optional[str]:
+        """
+        Decide whether a lease should be reclaimed.
+        
+        Args:
+            lease: Lease to check
+            max_runtime_sec: Maximum runtime in seconds
+            check_pid: Whether to check if process is alive
+            alive_pids: Live PIDs from _alive_pid_set(), if available
+            now: Current UTC time, shared by every lease in a scan
+            
+        Returns:
+            Reason the lease is stale, or None if it is healthy
+        """
+        # Check if PID is dead. A PID missing from the set may belong to a
+        # process started after the listing, so confirm it before reclaiming.
+        if check_pid:
+            if alive_pids is None or lease.pid not in alive_pids:
+                if not self.is_process_alive(lease.pid):
+                    return f"Process {lease.pid} is not alive"
+        
+        # Check if lease is stale by time (same tests as Lease.is_stale,
+        # each age computed once)
+        if now is None:
+            now = datetime.now(timezone.utc)
+        
+        age = lease.age_seconds(now)
+        if age > max_runtime_sec:
+            return f"Runtime exceeded {max_runtime_sec}s (actual: {age:.0f}s)"
+        
+        heartbeat_age = lease.heartbeat_age_seconds(now)
+        if heartbeat_age > max_runtime_sec:
+            return f"Heartbeat stale (age: {heartbeat_age:.0f}s)"
+        
+        return None
+    
     def reclaim_lease(self, lease: Lease, reason: str) -> bool:
         """
         Reclaim a stale lease by deleting it.
@@ -419,8 +752,46 @@ class LeaseStore:
         """
         counts: Dict[str, int] = {}
         
-        for lease in self.list_all():
+        # Files in the lease directory itself are normally running, but
+        # check the state anyway in case one was written by other tooling
+        for lease in self._iter_leases(running_only=True):
             if lease.state == "running":
                 counts[lease.agent] = counts.get(lease.agent, 0) + 1
         
         return counts
+    
+    def snapshot(
+        self,
+        max_runtime_sec: int,
+        check_pid: bool = True
+    ) -> Tuple[Dict[str, int], List[Tuple[Lease, str]], List[Lease]]:
+        """
+        Scan the lease directory once for everything a reconciliation pass needs.
+        
+        Equivalent to calling count_active_by_agent(), find_stale_leases() and
+        list_all() back to back, but each lease file is read only once.
+        
+        Args:
+            max_runtime_sec: Maximum runtime in seconds
+            check_pid: Whether to check if process is alive
+            
+        Returns:
+            Tuple of (active counts by agent, stale (Lease, reason) tuples, all leases)
+        """
+        counts: Dict[str, int] = {}
+        stale_leases: List[Tuple[Lease, str]] = []
+        leases: List[Lease] = []
+        alive_pids = self._alive_pid_set() if check_pid else None
+        now = datetime.now(timezone.utc)
+        
+        for lease in self._iter_leases():
+            leases.append(lease)
+            
+            if lease.state == "running":
+                counts[lease.agent] = counts.get(lease.agent, 0) + 1
+            
+            reason = self._stale_reason(lease, max_runtime_sec, check_pid, alive_pids, now)
+            if reason:
+                stale_leases.append((lease, reason))
+        
+        return counts, stale_leases, leases
@@ -3,7 +3,11 @@
 Transforms JSON data into human-readable console output.
 """
 
-from typing import Dict, List, Optional
+import heapq
+import io
+import operator
+from itertools import starmap, zip_longest
+from typing import Callable, Dict, List, Optional
 
 from .workload_reporter import (
     WorkloadData, WorkloadSummary, AgentWorkload,
@@ -11,6 +15,39 @@ from .workload_reporter import (
 )
 
 
+# str.format() alignment characters for TableFormatter
+_ALIGN_SPECS = {'left': '<', 'right': '>'}
+
+# Task table order (with nlargest: priority desc, then age desc). Built in
+# C, so keying thousands of tasks needs no Python-level lambda calls.
+_TASK_SORT_KEY = operator.attrgetter('priority', 'age_hours')
+
+# Horizontal rules used by the console report
+_EQ60 = '=' * 60
+_DASH20 = '-' * 20
+_DASH30 = '-' * 30
+_DASH40 = '-' * 40
+_DASH60 = '-' * 60
+
+# Priority chart bars are slices of one prebuilt full-length bar
+_MAX_BAR_LENGTH = 30
+_FULL_BAR = '█' * _MAX_BAR_LENGTH
+
+# Number format specs for per-row values
+_AGE_FMT = '.1f'
+_PERCENT_FMT = '.0f'
+
+# Row fields, fetched in one C call per row
+_TASK_ROW_FIELDS = operator.attrgetter('id', 'status', 'assigned_to', 'priority', 'age_hours', 'title')
+_AGENT_ROW_FIELDS = operator.attrgetter('agent_name', 'total_tasks', 'idle_tasks', 'working_tasks')
+_TOTAL_FIELD = operator.itemgetter(1)  # total_tasks in an _AGENT_ROW_FIELDS tuple
+
+
+def _truncate(text: str, limit: int) -> str:
+    """Cut text to limit characters, marking the cut with '...'."""
+    return text if len(text) <= limit else text[:limit] + '...'
+
+
 class TableFormatter:
     """Utility for formatting tabular data."""
     
@@ -31,52 +68,92 @@ class TableFormatter:
         Returns:
             Formatted table string
         """
+        buf = io.StringIO()
+        TableFormatter.write_table(buf, headers, rows, alignments)
+        return buf.getvalue()
+    
+    @staticmethod
+    def write_table(
+        buf: io.StringIO,
+        headers: List[str],
+        rows: List[List[str]],
+        alignments: Optional[List[str]] = None
+    ) -> None:
+        """
+        Write data as aligned table (no trailing newline).
+        
+        Args:
+            buf: Buffer to write to
+            headers: Column headers
+            rows: Data rows
+            alignments: List of 'left', 'right', 'center' per column (default: all left)
+        """
         if not headers or not rows:
-            return ""
+            return
         
-        # Default to left alignment
+        # Default to left alignment (also for columns the list doesn't cover)
+        num_cols = len(headers)
         if alignments is None:
-            alignments = ['left'] * len(headers)
-        
-        # Calculate column widths
-        col_widths = [len(h) for h in headers]
-        for row in rows:
-            for i, cell in enumerate(row):
-                if i < len(col_widths):
-                    col_widths[i] = max(col_widths[i], len(str(cell)))
-        
-        # Format header
-        header_parts = []
-        separator_parts = []
-        for i, (header, width) in enumerate(zip(headers, col_widths)):
-            alignment = alignments[i] if i < len(alignments) else 'left'
-            header_parts.append(TableFormatter._align_cell(header, width, alignment))
-            separator_parts.append('-' * width)
-        
-        lines = [
-            '  '.join(header_parts),
-            '  '.join(separator_parts)
+            alignments = ['left'] * num_cols
+        elif len(alignments) < num_cols:
+            alignments = list(alignments) + ['left'] * (num_cols - len(alignments))
+        
+        # Convert every cell to str once (extra cells beyond the headers
+        # are never shown)
+        str_rows = [
+            [cell if type(cell) is str else str(cell) for cell in row[:num_cols]]
+            for row in rows
         ]
         
-        # Format rows
-        for row in rows:
-            row_parts = []
-            for i, (cell, width) in enumerate(zip(row, col_widths)):
-                alignment = alignments[i] if i < len(alignments) else 'left'
-                row_parts.append(TableFormatter._align_cell(str(cell), width, alignment))
-            lines.append('  '.join(row_parts))
-        
-        return '\n'.join(lines)
-    
-    @staticmethod
-    def _align_cell(text: str, width: int, alignment: str) -> str:
-        """Align text in a cell."""
-        if alignment == 'right':
-            return text.rjust(width)
-        elif alignment == 'center':
-            return text.center(width)
-        else:  # left
-            return text.ljust(width)
+        # Calculate column widths, one column at a time so the per-cell
+        # work runs inside max()/map() rather than a Python loop
+        col_widths = [len(h) for h in headers]
+        for i, column in enumerate(zip_longest(*str_rows, fillvalue='')):
+            widest = max(map(len, column))
+            if widest > col_widths[i]:
+                col_widths[i] = widest
+        
+        # One format spec per column, so each row is a single str.format()
+        # call. str.center() splits odd padding differently from '^', so
+        # centered cells are padded up front and take a plain '{}'.
+        specs = []
+        centered = []
+        for i, (width, alignment) in enumerate(zip(col_widths, alignments)):
+            if alignment == 'center':
+                specs.append('{}')
+                centered.append((i, width))
+            else:
+                specs.append(f"{{:{_ALIGN_SPECS.get(alignment, '<')}{width}}}")
+        
+        template = '  '.join(specs)
+        short_templates: Dict[int, str] = {}
+        
+        def format_row(cells: List[str]) -> str:
+            if centered:
+                cells = list(cells)
+                for i, width in centered:
+                    if i < len(cells):
+                        cells[i] = cells[i].center(width)
+            if len(cells) == num_cols:
+                return template.format(*cells)
+            # Short rows only fill their leading columns
+            row_template = short_templates.get(len(cells))
+            if row_template is None:
+                row_template = short_templates[len(cells)] = '  '.join(specs[:len(cells)])
+            return row_template.format(*cells)
+        
+        write = buf.write
+        write(format_row(headers))
+        write('\n')
+        write('  '.join(['-' * width for width in col_widths]))
+        
+        # Format rows. In the common case (no centered columns, no short
+        # rows) every row is just template.format(*row).
+        write('\n')
+        if not centered and all(len(row) == num_cols for row in str_rows):
+            write('\n'.join(starmap(template.format, str_rows)))
+        else:
+            write('\n'.join(map(format_row, str_rows)))
 
 
 class ConsoleFormatter:
@@ -94,6 +171,16 @@ class ConsoleFormatter:
         'magenta': '\033[35m',
     }
     
+    REPORT_TITLE = '       TinyTask Workload Report'
+    
+    # Fixed section titles and the rule printed under each
+    SECTION_HEADINGS = {
+        'SUMMARY': _DASH20,
+        'AGENT WORKLOAD': _DASH30,
+        'PRIORITY DISTRIBUTION': _DASH40,
+        'TASK AGE METRICS': _DASH30,
+    }
+    
     def __init__(self, use_colors: bool = True):
         """
         Initialize console formatter.
@@ -102,12 +189,39 @@ class ConsoleFormatter:
             use_colors: Whether to use ANSI color codes
         """
         self.use_colors = use_colors
+        
+        # (prefix, suffix) per color name; without colors, _color is
+        # swapped for a passthrough so no call pays for wrapping
+        reset = self.COLORS['reset']
+        self._wraps = {name: (code, reset) for name, code in self.COLORS.items()}
+        self._unknown_wrap = ('', reset)
+        if not use_colors:
+            self._color = self._no_color
+        
+        # Static heading blocks, colored and joined once so each is a
+        # single buffer write per report
+        self._banner = f"{_EQ60}\n{self._color(self.REPORT_TITLE, 'bold')}\n{_EQ60}"
+        self._headings = {
+            title: f"{self._color(title, 'bold')}\n{rule}"
+            for title, rule in self.SECTION_HEADINGS.items()
+        }
     
     def _color(self, text: str, color: str) -> str:
         """Apply color to text if colors are enabled."""
-        if not self.use_colors:
-            return text
-        return f"{self.COLORS.get(color, '')}{text}{self.COLORS['reset']}"
+        prefix, suffix = self._wraps.get(color, self._unknown_wrap)
+        return prefix + text + suffix
+    
+    @staticmethod
+    def _no_color(text: str, color: str) -> str:
+        """Return text unchanged (replaces _color when colors are disabled)."""
+        return text
+    
+    @staticmethod
+    def _render(writer: Callable[..., None], *args) -> str:
+        """Run a section writer into a fresh buffer and return its text."""
+        buf = io.StringIO()
+        writer(buf, *args)
+        return buf.getvalue()
     
     def format_report(self, data: WorkloadData) -> str:
         """
@@ -119,120 +233,123 @@ class ConsoleFormatter:
         Returns:
             Multi-line formatted string ready for console output
         """
-        sections = []
+        # Every section is written into one buffer, separated by a blank line
+        buf = io.StringIO()
         
         # Header
-        sections.append(self._format_header(data.generated_at))
+        self._write_header(buf, data.generated_at)
         
         # Summary
-        sections.append(self.format_summary(data.summary))
+        buf.write('\n\n')
+        self._write_summary(buf, data.summary)
         
         # Agent breakdown
         if data.agent_breakdown:
-            sections.append(self.format_agent_table(data.agent_breakdown))
+            buf.write('\n\n')
+            self._write_agent_table(buf, data.agent_breakdown)
         
         # Priority distribution
         if data.priority_distribution.by_priority:
-            sections.append(self.format_priority_chart(data.priority_distribution))
+            buf.write('\n\n')
+            self._write_priority_chart(buf, data.priority_distribution)
         
         # Age metrics
         if data.tasks:
-            sections.append(self.format_age_metrics(data.age_metrics))
+            buf.write('\n\n')
+            self._write_age_metrics(buf, data.age_metrics)
         
         # Task table
         if data.tasks:
-            sections.append(self.format_task_table(data.tasks))
+            buf.write('\n\n')
+            self._write_task_table(buf, data.tasks)
         
         # Footer
-        sections.append('=' * 60)
+        buf.write('\n\n')
+        buf.write(_EQ60)
         
-        return '\n\n'.join(sections)
+        return buf.getvalue()
     
     def _format_header(self, timestamp: str) -> str:
         """Format report header."""
-        lines = [
-            '=' * 60,
-            self._color('       TinyTask Workload Report', 'bold'),
-            '=' * 60,
-            f"Generated: {timestamp}"
-        ]
-        return '\n'.join(lines)
+        return self._render(self._write_header, timestamp)
+    
+    def _write_header(self, buf: io.StringIO, timestamp: str) -> None:
+        """Write report header."""
+        buf.write(f"{self._banner}\nGenerated: {timestamp}")
     
     def format_summary(self, summary: WorkloadSummary) -> str:
         """Format summary section."""
-        lines = [
-            self._color('SUMMARY', 'bold'),
-            '-' * 20,
-            f"Total Open Tasks: {self._color(str(summary.total_open_tasks), 'cyan')}"
-        ]
+        return self._render(self._write_summary, summary)
+    
+    def _write_summary(self, buf: io.StringIO, summary: WorkloadSummary) -> None:
+        """Write summary section."""
+        write = buf.write
+        write(f"{self._headings['SUMMARY']}\nTotal Open Tasks: {self._color(str(summary.total_open_tasks), 'cyan')}")
         
         if summary.total_open_tasks > 0:
-            lines.extend([
-                f"  • Idle:    {self._color(str(summary.total_idle), 'yellow')}",
-                f"  • Working: {self._color(str(summary.total_working), 'green')}"
-            ])
+            write(
+                f"\n  • Idle:    {self._color(str(summary.total_idle), 'yellow')}"
+                f"\n  • Working: {self._color(str(summary.total_working), 'green')}"
+            )
         
         if summary.agents_with_work:
             agent_list = ', '.join(summary.agents_with_work)
-            lines.append(f"\nActive Agents: {summary.total_agents} ({agent_list})")
+            write(f"\n\nActive Agents: {summary.total_agents} ({agent_list})")
         else:
-            lines.append(f"\nActive Agents: 0")
-        
-        return '\n'.join(lines)
+            write("\n\nActive Agents: 0")
     
     def format_agent_table(self, agent_breakdown: Dict[str, AgentWorkload]) -> str:
         """Format agent workload as table."""
-        lines = [
-            self._color('AGENT WORKLOAD', 'bold'),
-            '-' * 30
-        ]
-        
-        # Sort agents by total tasks (descending)
-        sorted_agents = sorted(
-            agent_breakdown.values(),
-            key=lambda a: a.total_tasks,
-            reverse=True
-        )
+        return self._render(self._write_agent_table, agent_breakdown)
+    
+    def _write_agent_table(self, buf: io.StringIO, agent_breakdown: Dict[str, AgentWorkload]) -> None:
+        """Write agent workload as table."""
+        buf.write(self._headings['AGENT WORKLOAD'])
         
+        # Fetch each agent's fields once, sort those by total tasks
+        # (descending), and build the rows in one comprehension
         headers = ['Agent', 'Total', 'Idle', 'Working']
-        rows = []
-        
-        for agent in sorted_agents:
-            rows.append([
-                agent.agent_name,
-                str(agent.total_tasks),
-                str(agent.idle_tasks),
-                str(agent.working_tasks)
-            ])
+        rows = [
+            [agent_name, str(total), str(idle), str(working)]
+            for agent_name, total, idle, working in sorted(
+                map(_AGENT_ROW_FIELDS, agent_breakdown.values()),
+                key=_TOTAL_FIELD,
+                reverse=True
+            )
+        ]
         
         alignments = ['left', 'right', 'right', 'right']
-        table = TableFormatter.format_table(headers, rows, alignments)
-        lines.append(table)
-        
-        return '\n'.join(lines)
+        buf.write('\n')
+        TableFormatter.write_table(buf, headers, rows, alignments)
     
     def format_priority_chart(self, priority_dist: PriorityDistribution) -> str:
         """Format priority distribution as text chart."""
-        lines = [
-            self._color('PRIORITY DISTRIBUTION', 'bold'),
-            '-' * 40
-        ]
+        return self._render(self._write_priority_chart, priority_dist)
+    
+    def _write_priority_chart(self, buf: io.StringIO, priority_dist: PriorityDistribution) -> None:
+        """Write priority distribution as text chart."""
+        buf.write(self._headings['PRIORITY DISTRIBUTION'])
         
         # Sort by priority (descending)
         sorted_priorities = sorted(priority_dist.by_priority.items(), reverse=True)
         
-        total_tasks = sum(priority_dist.by_priority.values())
-        max_count = max(priority_dist.by_priority.values())
-        max_bar_length = 30
+        # Total and largest count in one pass
+        total_tasks = 0
+        max_count = 0
+        for count in priority_dist.by_priority.values():
+            total_tasks += count
+            if count > max_count:
+                max_count = count
         
         headers = ['Priority', 'Count', 'Graph']
         rows = []
         
         for priority, count in sorted_priorities:
             percentage = (count / total_tasks * 100) if total_tasks > 0 else 0
-            bar_length = int((count / max_count) * max_bar_length) if max_count > 0 else 0
-            bar = '█' * bar_length
-            graph = f"{bar} ({percentage:.0f}%)"
+            # Integer math gives the same lengths as the float ratio, exactly
+            bar_length = count * _MAX_BAR_LENGTH // max_count if max_count > 0 else 0
+            bar = _FULL_BAR[:bar_length]
+            graph = f"{bar} ({format(percentage, _PERCENT_FMT)}%)"
             
             rows.append([
                 str(priority),
@@ -241,60 +358,55 @@ class ConsoleFormatter:
             ])
         
         alignments = ['right', 'right', 'left']
-        table = TableFormatter.format_table(headers, rows, alignments)
-        lines.append(table)
-        
-        lines.append(f"\nAverage Priority: {priority_dist.average_priority:.2f}")
+        buf.write('\n')
+        TableFormatter.write_table(buf, headers, rows, alignments)
         
-        return '\n'.join(lines)
+        buf.write(f"\n\nAverage Priority: {priority_dist.average_priority:.2f}")
     
     def format_age_metrics(self, age_metrics: AgeMetrics) -> str:
         """Format age metrics section."""
-        lines = [
-            self._color('TASK AGE METRICS', 'bold'),
-            '-' * 30,
-            f"Oldest Task: {age_metrics.oldest_task_age_hours:.1f} hours (Task #{age_metrics.oldest_task_id})",
-            f"Newest Task: {age_metrics.newest_task_age_hours:.1f} hours (Task #{age_metrics.newest_task_id})",
+        return self._render(self._write_age_metrics, age_metrics)
+    
+    def _write_age_metrics(self, buf: io.StringIO, age_metrics: AgeMetrics) -> None:
+        """Write age metrics section."""
+        buf.write(
+            f"{self._headings['TASK AGE METRICS']}\n"
+            f"Oldest Task: {age_metrics.oldest_task_age_hours:.1f} hours (Task #{age_metrics.oldest_task_id})\n"
+            f"Newest Task: {age_metrics.newest_task_age_hours:.1f} hours (Task #{age_metrics.newest_task_id})\n"
             f"Average Age: {age_metrics.average_task_age_hours:.1f} hours"
-        ]
-        
-        return '\n'.join(lines)
+        )
     
     def format_task_table(self, tasks: List[TaskDetail]) -> str:
         """Format task list as table."""
-        lines = [
-            self._color(f'OPEN TASKS ({len(tasks)} total)', 'bold'),
-            '-' * 60
-        ]
-        
-        # Sort by priority (desc), then age (desc)
-        sorted_tasks = sorted(tasks, key=lambda t: (-t.priority, -t.age_hours))
+        return self._render(self._write_task_table, tasks)
+    
+    def _write_task_table(self, buf: io.StringIO, tasks: List[TaskDetail]) -> None:
+        """Write task list as table."""
+        buf.write(self._color(f'OPEN TASKS ({len(tasks)} total)', 'bold'))
+        buf.write('\n')
+        buf.write(_DASH60)
         
-        # Limit to first 50 tasks for readability
-        display_tasks = sorted_tasks[:50]
+        # First 50 tasks by priority (desc), then age (desc), for
+        # readability; a partial sort, since the rest are never shown
+        display_tasks = heapq.nlargest(50, tasks, key=_TASK_SORT_KEY)
         
         headers = ['ID', 'Status', 'Agent', 'Pri', 'Age(h)', 'Title']
-        rows = []
-        
-        for task in display_tasks:
-            # Truncate title if too long
-            title = task.title[:40] + '...' if len(task.title) > 40 else task.title
-            agent = task.assigned_to or '-'
-            
-            rows.append([
-                str(task.id),
-                task.status,
-                agent[:12],  # Truncate agent name
-                str(task.priority),
-                f"{task.age_hours:.1f}",
-                title
-            ])
+        rows = [
+            [
+                str(task_id),
+                status,
+                agent[:12] if agent else '-',  # Truncate agent name
+                str(priority),
+                format(age_hours, _AGE_FMT),
+                _truncate(title, 40)
+            ]
+            for task_id, status, agent, priority, age_hours, title
+            in map(_TASK_ROW_FIELDS, display_tasks)
+        ]
         
         alignments = ['right', 'left', 'left', 'right', 'right', 'left']
-        table = TableFormatter.format_table(headers, rows, alignments)
-        lines.append(table)
+        buf.write('\n')
+        TableFormatter.write_table(buf, headers, rows, alignments)
         
         if len(tasks) > 50:
-            lines.append(f"\n(Showing first 50 of {len(tasks)} tasks)")
-        
-        return '\n'.join(lines)
+            buf.write(f"\n\n(Showing first 50 of {len(tasks)} tasks)")
@@ -583,18 +583,17 @@ class Scheduler:
             'errors': 0
         }
         
-        # Step 1: Scan and validate leases
+        # Step 1: Scan and validate leases (the same pass finds stale leases)
         self.logger.info("Step 1: Scanning existing leases...")
-        leases = self.lease_store.list_all()
+        _, stale_leases, leases = self.lease_store.snapshot(
+            max_runtime_sec=self.config.max_runtime_sec,
+            check_pid=True
+        )
         stats['leases_scanned'] = len(leases)
         self.logger.info(f"Found {len(leases)} active leases")
         
         # Step 2: Reclaim stale leases
         self.logger.info("Step 2: Checking for stale leases...")
-        stale_leases = self.lease_store.find_stale_leases(
-            max_runtime_sec=self.config.max_runtime_sec,
-            check_pid=True
-        )
         
         for lease, reason in stale_leases:
             self.logger.warning(f"Stale lease detected: task={lease.task_id}, agent={lease.agent}, reason={reason}")
@@ -629,7 +628,8 @@ class Scheduler:
         if not self.agent_registry:
             self.logger.info("Step 3: Querying idle tasks (legacy mode)...")
             
-            # Calculate available slots per agent
+            # Calculate available slots per agent (recounted, since
+            # reclaiming above removes leases)
             active_counts = self.lease_store.count_active_by_agent()
             available_slots = {}
             
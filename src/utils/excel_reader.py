@@ -1,7 +1,8 @@
 """Excel file reader and CSV extractor."""
 
+from contextlib import contextmanager
 from pathlib import Path
-from typing import List, Optional
+from typing import Iterator, List, Optional
 import re
 
 import pandas as pd
@@ -9,6 +10,55 @@ import pandas as pd
 from ..logger import get_logger
 
 
+class ExcelWorkbook:
+    """An open Excel workbook, parsed once and shared across sheet reads."""
+    
+    def __init__(self, reader: "ExcelReader", excel_file: Path, excel_data: pd.ExcelFile):
+        """
+        Initialize workbook handle.
+        
+        Args:
+            reader: ExcelReader that opened the workbook
+            excel_file: Path to Excel file
+            excel_data: Open pandas ExcelFile
+        """
+        self.reader = reader
+        self.excel_file = excel_file
+        self._excel_data = excel_data
+    
+    @property
+    def sheet_names(self) -> List[str]:
+        """Sheet names in workbook order."""
+        return self._excel_data.sheet_names
+    
+    def read_sheet(self, sheet_name: str) -> pd.DataFrame:
+        """
+        Read a single sheet from the open workbook.
+        
+        Args:
+            sheet_name: Name of sheet to read
+            
+        Returns:
+            Sheet contents as a DataFrame
+        """
+        return self._excel_data.parse(sheet_name)
+    
+    def extract_all(self, output_dir: Path, base_name: Optional[str] = None) -> List[Path]:
+        """
+        Extract all sheets to CSV files without reopening the workbook.
+        
+        Args:
+            output_dir: Directory for output CSV files
+            base_name: Base name for output files (default: excel file stem)
+            
+        Returns:
+            List of created CSV file paths
+        """
+        return self.reader.extract_all_sheets(
+            self.excel_file, output_dir, base_name, workbook=self
+        )
+
+
 class ExcelReader:
     """Reads Excel files and extracts sheets to CSV."""
     
@@ -16,34 +66,52 @@ class ExcelReader:
         """Initialize Excel reader."""
         self.logger = get_logger("ExcelReader")
     
-    def get_sheet_names(self, excel_file: Path) -> Optional[List[str]]:
+    @contextmanager
+    def open(self, excel_file: Path) -> Iterator[Optional[ExcelWorkbook]]:
         """
-        Get list of sheet names from Excel file.
+        Open an Excel file once for listing and extracting its sheets.
+        
+        The workbook's ZIP/XML container is parsed a single time and
+        closed when the with block exits.
         
         Args:
             excel_file: Path to Excel file
             
-        Returns:
-            List of sheet names, or None if error
+        Yields:
+            Open ExcelWorkbook, or None if the file could not be read
         """
         try:
-            # Read Excel file to get sheet names
             excel_data = pd.ExcelFile(excel_file)
-            sheet_names = excel_data.sheet_names
+        except Exception as e:
+            self.logger.error("Failed to read sheet names from %s: %s", excel_file, e)
+            yield None
+            return
+        
+        try:
+            self.logger.debug("Found %d sheets in %s", len(excel_data.sheet_names), excel_file.name)
+            yield ExcelWorkbook(self, excel_file, excel_data)
+        finally:
             excel_data.close()
-            
-            self.logger.debug(f"Found {len(sheet_names)} sheets in {excel_file.name}")
-            return sheet_names
+    
+    def get_sheet_names(self, excel_file: Path) -> Optional[List[str]]:
+        """
+        Get list of sheet names from Excel file.
         
-        except Exception as e:
-            self.logger.error(f"Failed to read sheet names from {excel_file}: {e}")
-            return None
+        Args:
+            excel_file: Path to Excel file
+            
+        Returns:
+            List of sheet names, or None if error
+        """
+        with self.open(excel_file) as workbook:
+            return workbook.sheet_names if workbook is not None else None
     
     def extract_sheet_to_csv(
         self,
         excel_file: Path,
         sheet_name: str,
-        output_file: Path
+        output_file: Path,
+        workbook: Optional[ExcelWorkbook] = None
     ) -> bool:
         """
         Extract a single sheet to CSV file.
@@ -52,13 +120,18 @@ class ExcelReader:
             excel_file: Path to Excel file
             sheet_name: Name of sheet to extract
             output_file: Path for output CSV file
+            workbook: Already open workbook to read from (default: read
+                the file directly)
             
         Returns:
             True if successful, False otherwise
         """
         try:
             # Read the specific sheet
-            df = pd.read_excel(excel_file, sheet_name=sheet_name)
+            if workbook is not None:
+                df = workbook.read_sheet(sheet_name)
+            else:
+                df = pd.read_excel(excel_file, sheet_name=sheet_name)
             
             # Ensure output directory exists
             output_file.parent.mkdir(parents=True, exist_ok=True)
@@ -66,18 +139,19 @@ class ExcelReader:
             # Write to CSV
             df.to_csv(output_file, index=False)
             
-            self.logger.debug(f"Extracted sheet '{sheet_name}' to {output_file}")
+            self.logger.debug("Extracted sheet '%s' to %s", sheet_name, output_file)
             return True
         
         except Exception as e:
-            self.logger.error(f"Failed to extract sheet '{sheet_name}' from {excel_file}: {e}")
+            self.logger.error("Failed to extract sheet '%s' from %s: %s", sheet_name, excel_file, e)
             return False
     
     def extract_all_sheets(
         self,
         excel_file: Path,
         output_dir: Path,
-        base_name: Optional[str] = None
+        base_name: Optional[str] = None,
+        workbook: Optional[ExcelWorkbook] = None
     ) -> List[Path]:
         """
         Extract all sheets from Excel file to CSV files.
@@ -88,17 +162,26 @@ class ExcelReader:
             excel_file: Path to Excel file
             output_dir: Directory for output CSV files
             base_name: Base name for output files (default: excel file stem)
+            workbook: Already open workbook from open() (default: open
+                the file for the duration of the call)
             
         Returns:
             List of created CSV file paths
         """
+        if workbook is None:
+            with self.open(excel_file) as opened:
+                if opened is None:
+                    self.logger.error("No sheets found in %s", excel_file)
+                    return []
+                return self.extract_all_sheets(excel_file, output_dir, base_name, workbook=opened)
+        
         if base_name is None:
             base_name = excel_file.stem
         
         # Get all sheet names
-        sheet_names = self.get_sheet_names(excel_file)
+        sheet_names = workbook.sheet_names
         if not sheet_names:
-            self.logger.error(f"No sheets found in {excel_file}")
+            self.logger.error("No sheets found in %s", excel_file)
             return []
         
         # Extract each sheet
@@ -108,11 +191,11 @@ class ExcelReader:
             csv_filename = f"{base_name}_{sanitized_name}.csv"
             csv_path = output_dir / csv_filename
             
-            if self.extract_sheet_to_csv(excel_file, sheet_name, csv_path):
+            if self.extract_sheet_to_csv(excel_file, sheet_name, csv_path, workbook):
                 csv_files.append(csv_path)
-                self.logger.info(f"Created CSV: {csv_filename}")
+                self.logger.info("Created CSV: %s", csv_filename)
             else:
-                self.logger.warning(f"Failed to extract sheet: {sheet_name}")
+                self.logger.warning("Failed to extract sheet: %s", sheet_name)
         
         return csv_files
     
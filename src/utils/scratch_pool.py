@@ -0,0 +1,98 @@
+"""Reusable scratch directories for processor temp output."""
+
+import atexit
+import os
+import shutil
+import tempfile
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, List
+
+from ..logger import get_logger
+
+
+class ScratchDirPool:
+    """Bounded pool of empty temporary directories reused across files."""
+    
+    def __init__(self, max_size: int = 4, prefix: str = "calypso-"):
+        """
+        Initialize scratch directory pool.
+        
+        Args:
+            max_size: Maximum number of idle directories kept for reuse
+            prefix: Name prefix for created directories
+        """
+        self.max_size = max_size
+        self.prefix = prefix
+        self.logger = get_logger("ScratchDirPool")
+        self._free: List[Path] = []
+        self._lock = threading.Lock()
+    
+    def acquire(self) -> Path:
+        """
+        Get an empty scratch directory, creating one if none are idle.
+        
+        Returns:
+            Path to an empty directory
+        """
+        with self._lock:
+            if self._free:
+                return self._free.pop()
+        return Path(tempfile.mkdtemp(prefix=self.prefix))
+    
+    def release(self, path: Path) -> None:
+        """
+        Empty a scratch directory and return it to the pool.
+        
+        The directory itself is kept so the next acquire() needs no mkdir.
+        It is removed instead if the pool is full or it cannot be emptied.
+        
+        Args:
+            path: Directory previously returned by acquire()
+        """
+        try:
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        shutil.rmtree(entry.path)
+                    else:
+                        os.unlink(entry.path)
+        except OSError as e:
+            self.logger.warning("Discarding scratch directory %s: %s", path, e)
+            shutil.rmtree(path, ignore_errors=True)
+            return
+        
+        with self._lock:
+            if len(self._free) < self.max_size:
+                self._free.append(path)
+                return
+        shutil.rmtree(path, ignore_errors=True)
+    
+    @contextmanager
+    def scoped(self) -> Iterator[Path]:
+        """
+        Borrow a scratch directory for the duration of a with block.
+        
+        Drop-in replacement for tempfile.TemporaryDirectory().
+        
+        Yields:
+            Path to an empty directory
+        """
+        path = self.acquire()
+        try:
+            yield path
+        finally:
+            self.release(path)
+    
+    def close(self) -> None:
+        """Remove all idle scratch directories."""
+        with self._lock:
+            free, self._free = self._free, []
+        for path in free:
+            shutil.rmtree(path, ignore_errors=True)
+
+
+# Shared by the audio and spreadsheet processors
+scratch_dirs = ScratchDirPool(max_size=os.cpu_count() or 1)
+atexit.register(scratch_dirs.close)
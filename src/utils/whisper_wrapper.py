@@ -1,5 +1,7 @@
 """Wrapper for OpenAI Whisper CLI tool."""
 
+import functools
+import logging
 import subprocess
 import shutil
 from pathlib import Path
@@ -10,6 +12,17 @@ from ..exceptions import WhisperError
 from ..logger import get_logger
 
 
+@functools.lru_cache(maxsize=None)
+def _whisper_on_path() -> bool:
+    """
+    Check once per process whether the whisper executable is on PATH.
+    
+    Returns:
+        True if found, False otherwise
+    """
+    return shutil.which("whisper") is not None
+
+
 @dataclass
 class WhisperResult:
     """Result of Whisper transcription."""
@@ -47,10 +60,12 @@ class WhisperWrapper:
         """
         Check if Whisper is installed and available.
         
+        The PATH lookup is cached, so calling this for every file is cheap.
+        
         Returns:
             True if Whisper is installed, False otherwise
         """
-        return shutil.which("whisper") is not None
+        return _whisper_on_path()
     
     def transcribe(
         self,
@@ -105,8 +120,9 @@ class WhisperWrapper:
             "--output_format", "all",  # Generate all output formats
         ]
         
-        self.logger.info(f"Running Whisper transcription: {audio_file.name}")
-        self.logger.debug(f"Command: {' '.join(command)}")
+        self.logger.info("Running Whisper transcription: %s", audio_file.name)
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Command: %s", ' '.join(command))
         
         try:
             # Run Whisper
@@ -118,9 +134,9 @@ class WhisperWrapper:
                 check=True
             )
             
-            self.logger.debug(f"Whisper stdout: {result.stdout}")
+            self.logger.debug("Whisper stdout: %s", result.stdout)
             if result.stderr:
-                self.logger.debug(f"Whisper stderr: {result.stderr}")
+                self.logger.debug("Whisper stderr: %s", result.stderr)
             
             # Find generated artifacts
             artifacts = self._find_artifacts(audio_file, output_dir)
@@ -150,7 +166,7 @@ class WhisperWrapper:
         
         except subprocess.CalledProcessError as e:
             error = WhisperError(f"Whisper failed: {e.stderr}")
-            self.logger.error(f"Whisper error: {e.stderr}")
+            self.logger.error("Whisper error: %s", e.stderr)
             return WhisperResult(
                 success=False,
                 audio_file=audio_file,
@@ -192,9 +208,9 @@ class WhisperWrapper:
             artifact_path = output_dir / f"{base_name}{ext}"
             if artifact_path.exists():
                 artifacts[ext.lstrip('.')] = artifact_path
-                self.logger.debug(f"Found artifact: {artifact_path}")
+                self.logger.debug("Found artifact: %s", artifact_path)
             else:
                 artifacts[ext.lstrip('.')] = None
-                self.logger.debug(f"Artifact not found: {artifact_path}")
+                self.logger.debug("Artifact not found: %s", artifact_path)
         
         return artifacts
\ No newline at end of file
@@ -1,6 +1,7 @@
 """Unit tests for AgentRegistry class."""
 
 import json
+import os
 import pytest
 import tempfile
 from pathlib import Path
@@ -227,13 +228,22 @@ class TestAgentRegistry:
         assert "vaela" in dev_agents
         assert "damien" in dev_agents
     
+    def test_get_agents_by_type_returns_tuple(self, valid_control_file):
+        """Test that get_agents_by_type returns the same immutable pool each call."""
+        registry = AgentRegistry(valid_control_file)
+        
+        dev_agents = registry.get_agents_by_type("dev")
+        
+        assert dev_agents == ("vaela", "damien")
+        assert registry.get_agents_by_type("dev") is dev_agents
+    
     def test_get_agents_by_type_unknown(self, valid_control_file):
         """Test get_agents_by_type with unknown type."""
         registry = AgentRegistry(valid_control_file)
         
         agents = registry.get_agents_by_type("unknown")
         
-        assert agents == []
+        assert agents == ()
     
     def test_get_agents_by_type_empty_registry(self, empty_control_file):
         """Test get_agents_by_type on empty registry."""
@@ -241,7 +251,7 @@ class TestAgentRegistry:
         
         agents = registry.get_agents_by_type("any")
         
-        assert agents == []
+        assert agents == ()
     
     def test_get_agent_type_valid(self, valid_control_file):
         """Test get_agent_type with valid agent name."""
@@ -384,6 +394,88 @@ class TestAgentRegistry:
         # Original data should still be intact
         assert len(registry.agents) == 1
     
+    def test_reload_skips_unchanged_file(self, valid_control_file):
+        """Test that reload() does not reparse an unchanged file."""
+        registry = AgentRegistry(valid_control_file)
+        agents = registry.agents
+        
+        registry.reload()
+        
+        assert registry.agents is agents
+    
+    def test_reload_force_hash_detects_same_stat_rewrite(self, tmp_path):
+        """Test that reload(force_hash=True) sees a rewrite with the same stat."""
+        control_file = tmp_path / "same-stat.json"
+        control_file.write_text(json.dumps([{"agentName": "agent1", "agentType": "type1"}]))
+        
+        registry = AgentRegistry(control_file)
+        st = control_file.stat()
+        
+        # Same size, same mtime, different contents
+        control_file.write_text(json.dumps([{"agentName": "agent1", "agentType": "type2"}]))
+        os.utime(control_file, ns=(st.st_atime_ns, st.st_mtime_ns))
+        
+        registry.reload()
+        assert registry.get_agent_type("agent1") == "type1"
+        
+        registry.reload(force_hash=True)
+        assert registry.get_agent_type("agent1") == "type2"
+    
+    def test_large_file_mapped_only_with_msgspec(self, tmp_path, monkeypatch):
+        """Test that large files are memory-mapped only when msgspec can decode the map."""
+        import mmap
+        import src.scheduler.agent_registry as agent_registry_module
+        
+        control_file = tmp_path / "large.json"
+        control_file.write_text(json.dumps([{"agentName": "agent1", "agentType": "type1"}]))
+        size = control_file.stat().st_size
+        monkeypatch.setattr(agent_registry_module, "_MMAP_MIN_SIZE", 1)
+        
+        monkeypatch.setattr(agent_registry_module, "_fast_json_decode", None)
+        with agent_registry_module._file_buffer(control_file, size) as raw:
+            assert isinstance(raw, bytes)
+        assert AgentRegistry(control_file).get_agent_type("agent1") == "type1"
+        
+        monkeypatch.setattr(agent_registry_module, "_fast_json_decode", lambda raw: json.loads(bytes(raw)))
+        with agent_registry_module._file_buffer(control_file, size) as raw:
+            assert isinstance(raw, mmap.mmap)
+    
+    def test_reload_hashes_only_unchanged_stat(self, tmp_path, monkeypatch):
+        """Test that contents are hashed only when force_hash meets an unchanged stat."""
+        import src.scheduler.agent_registry as agent_registry_module
+        
+        control_file = tmp_path / "hashing.json"
+        control_file.write_text(json.dumps([{"agentName": "agent1", "agentType": "type1"}]))
+        
+        hashed = []
+        real_blake2b = agent_registry_module.hashlib.blake2b
+        
+        def counting_blake2b(*args, **kwargs):
+            hashed.append(True)
+            return real_blake2b(*args, **kwargs)
+        
+        monkeypatch.setattr(agent_registry_module.hashlib, "blake2b", counting_blake2b)
+        
+        registry = AgentRegistry(control_file)
+        assert hashed == []
+        
+        # No stored digest yet: the first content check reparses
+        registry.reload(force_hash=True)
+        assert len(hashed) == 1
+        agents = registry.agents
+        
+        # Digest now stored: identical contents are not reparsed
+        registry.reload(force_hash=True)
+        assert len(hashed) == 2
+        assert registry.agents is agents
+        
+        # A stat change reparses without hashing
+        control_file.write_text(json.dumps([{"agentName": "agent2", "agentType": "type1"}]))
+        os.utime(control_file, ns=(0, 10**9))
+        registry.reload(force_hash=True)
+        assert len(hashed) == 2
+        assert registry.get_agent_type("agent2") == "type1"
+    
     # Integration tests
     
     def test_multiple_types_integration(self, tmp_path):
@@ -0,0 +1,62 @@
+"""Unit tests for the TinyScheduler command-line interface."""
+
+import pytest
+from pathlib import Path
+from unittest import mock
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.scheduler.cli import _requested_command, create_parser, validate_config_command
+
+
+class TestRequestedCommand:
+    """Tests for finding the subcommand before building the parser."""
+    
+    @pytest.mark.parametrize("argv, expected", [
+        (["run", "--once"], "run"),
+        (["--env-file", "tinyscheduler.env", "validate-config"], "validate-config"),
+        (["--base-path", "run", "config", "--show"], "config"),
+        (["--base-path=run", "config"], "config"),
+        (["--base", "run", "validate-config"], "validate-config"),
+        (["--log-level", "DEBUG", "run", "--recipe", "config"], "run"),
+        (["--", "run"], "run"),
+        (["run", "--help"], None),
+        (["--base-path", "/tmp"], None),
+        (["unknown"], None),
+        ([], None),
+    ])
+    def test_requested_command(self, argv, expected):
+        """Test that option values equal to a command name are skipped."""
+        assert _requested_command(argv) == expected
+    
+    def test_option_value_named_like_command_parses(self):
+        """Test that the narrowed parser accepts a base path named like a command."""
+        argv = ["--base-path", "run", "config", "--json"]
+        
+        args = create_parser(_requested_command(argv)).parse_args(argv)
+        
+        assert args.command == "config"
+        assert args.base_path == "run"
+        assert args.json
+
+
+class TestValidateConfigCommand:
+    """Tests for the validate-config report."""
+    
+    def test_partial_report_written_when_validation_raises(self, capsys):
+        """Test that lines collected before an error are still printed."""
+        config = mock.Mock()
+        config.validate.return_value = []
+        
+        with mock.patch(
+            "src.scheduler.validation.validate_agent_control_file",
+            side_effect=RuntimeError("control file unreadable")
+        ):
+            with pytest.raises(RuntimeError):
+                validate_config_command(config)
+        
+        out = capsys.readouterr().out
+        assert "Validating TinyScheduler configuration..." in out
+        assert "Configuration settings are valid" in out
+        assert out.rstrip().endswith("Agent Control File:")
@@ -0,0 +1,173 @@
+"""Unit tests for LeaseStore."""
+
+import json
+import os
+import pytest
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.scheduler.lease import Lease, LeaseStore
+
+
+def make_lease(task_id="1", state="running", heartbeat=None):
+    """Create a lease started a minute ago."""
+    now = datetime.now(timezone.utc).replace(microsecond=0)
+    return Lease(
+        task_id=task_id,
+        agent="vaela",
+        pid=12345,
+        recipe="recipe.yaml",
+        started_at=now - timedelta(minutes=1),
+        heartbeat=heartbeat or now,
+        host="localhost",
+        state=state,
+    )
+
+
+@pytest.fixture
+def store(tmp_path):
+    """LeaseStore in a temporary directory."""
+    return LeaseStore(tmp_path / "leases")
+
+
+class TestCreateAndUpdate:
+    """Tests for writing lease files."""
+    
+    def test_create_twice_raises(self, store):
+        """Test that a second create for the same task is rejected."""
+        store.create(make_lease())
+        
+        with pytest.raises(FileExistsError):
+            store.create(make_lease())
+        
+        assert store.read("1").state == "running"
+    
+    def test_create_with_archived_lease_raises(self, store):
+        """Test that a task with an archived lease cannot get a second, running one."""
+        lease = make_lease()
+        store.create(lease)
+        lease.state = "completed"
+        store.update(lease)
+        
+        with pytest.raises(FileExistsError):
+            store.create(make_lease())
+        
+        running_path, archive_path = store._lease_paths("1")
+        assert not running_path.exists()
+        assert [l.state for l in store.list_all()] == ["completed"]
+    
+    def test_update_same_state(self, store):
+        """Test that an update rewrites the lease in place."""
+        lease = make_lease()
+        store.create(lease)
+        
+        lease.recipe = "other.yaml"
+        store.update(lease)
+        
+        assert store.read("1").recipe == "other.yaml"
+        assert [p.name for p in store.lease_dir.glob("*.tmp")] == []
+    
+    def test_update_state_change_moves_to_archive(self, store):
+        """Test that a state change moves the lease out of the running directory."""
+        lease = make_lease()
+        store.create(lease)
+        
+        lease.state = "completed"
+        store.update(lease)
+        
+        running_path, archive_path = store._lease_paths("1")
+        assert not running_path.exists()
+        assert archive_path.exists()
+        assert store.read("1").state == "completed"
+        assert store.count_active_by_agent() == {}
+        
+        lease.state = "running"
+        store.update(lease)
+        
+        assert running_path.exists()
+        assert not archive_path.exists()
+        assert store.count_active_by_agent() == {"vaela": 1}
+    
+    def test_update_missing_lease_raises(self, store):
+        """Test that updating a lease that was never created fails without creating it."""
+        for state in ("running", "completed"):
+            with pytest.raises(FileNotFoundError):
+                store.update(make_lease(state=state))
+        
+        assert store.read("1") is None
+        assert [p.name for p in store.lease_dir.rglob("*") if p.is_file()] == []
+    
+    def test_create_without_hard_links_is_exclusive(self, store, monkeypatch):
+        """Test that the no-hard-link fallback still rejects a second create."""
+        def no_link(src, dst):
+            raise PermissionError("hard links not supported")
+        
+        monkeypatch.setattr("src.scheduler.lease.os.link", no_link)
+        
+        store.create(make_lease())
+        
+        with pytest.raises(FileExistsError):
+            store.create(make_lease())
+        
+        assert store.read("1").agent == "vaela"
+        assert [p.name for p in store.lease_dir.glob("*.tmp")] == []
+
+
+class TestReadCache:
+    """Tests for reusing parsed lease files."""
+    
+    def test_rewrite_with_same_mtime_inode_and_size_is_reread(self, tmp_path):
+        """Test that a reader in another process notices a rewrite keeping the heartbeat."""
+        writer = LeaseStore(tmp_path / "leases")
+        reader = LeaseStore(tmp_path / "leases")
+        writer.create(make_lease())
+        assert reader.read("1").recipe == "recipe.yaml"
+        
+        # Same size, same inode, mtime put back: only the ctime changes
+        # (after a tick of the filesystem clock, which may be coarse)
+        time.sleep(0.02)
+        lease_path = writer._lease_path("1")
+        st = lease_path.stat()
+        data = lease_path.read_bytes().replace(b"recipe.yaml", b"change.yaml")
+        with open(lease_path, "r+b") as f:
+            f.write(data)
+        os.utime(lease_path, ns=(st.st_atime_ns, st.st_mtime_ns))
+        
+        assert reader.read("1").recipe == "change.yaml"
+    
+    def test_changing_a_read_lease_leaves_cache_alone(self, store):
+        """Test that callers get copies, not the cached lease itself."""
+        store.create(make_lease())
+        
+        lease = store.read("1")
+        lease.state = "completed"
+        lease.metadata["note"] = "changed"
+        
+        again = store.read("1")
+        assert again is not lease
+        assert again.state == "running"
+        assert again.metadata == {}
+    
+    def test_naive_heartbeat_read_as_utc(self, store):
+        """Test that a lease with a naive heartbeat is still read, as UTC."""
+        store.create(make_lease())
+        lease_path = store._lease_path("1")
+        data = json.loads(lease_path.read_text())
+        data["heartbeat"] = "2024-01-01T00:00:00"
+        lease_path.write_text(json.dumps(data))
+        
+        # mtime older than the heartbeat: the stored value is kept
+        older = datetime(2023, 12, 31, tzinfo=timezone.utc).timestamp()
+        os.utime(lease_path, (older, older))
+        assert store.read("1").heartbeat == datetime(2024, 1, 1)
+        
+        # Touched later: the mtime wins
+        store.update_heartbeat("1")
+        lease = store.read("1")
+        assert lease is not None
+        assert lease.heartbeat > datetime(2024, 1, 1, tzinfo=timezone.utc)
+        assert store.count_active_by_agent() == {"vaela": 1}
@@ -63,6 +63,26 @@ class TestAgentControlFileValidation:
             expected_path = temp_dir / "docs" / "technical" / "agent-control.json"
             assert config.agent_control_file == expected_path
     
+    def test_config_get_is_cached(self, temp_dir):
+        """Test get() parses the environment once until invalidated."""
+        TinySchedulerConfig.invalidate()
+        try:
+            with mock.patch.dict(os.environ, {
+                'TINYSCHEDULER_BASE_PATH': str(temp_dir),
+                'TINYSCHEDULER_LOOP_INTERVAL_SEC': '30'
+            }):
+                config = TinySchedulerConfig.get()
+                assert TinySchedulerConfig.get() is config
+                
+                os.environ['TINYSCHEDULER_LOOP_INTERVAL_SEC'] = '45'
+                assert TinySchedulerConfig.get().loop_interval_sec == 30
+                assert TinySchedulerConfig.get(force=True).loop_interval_sec == 45
+                
+                TinySchedulerConfig.invalidate()
+                assert TinySchedulerConfig.get() is not config
+        finally:
+            TinySchedulerConfig.invalidate()
+    
     def test_validation_with_valid_file(self, mock_config, valid_control_data):
         """Test validation passes with valid file."""
         # Create valid file
@@ -294,6 +314,47 @@ class TestConfigIntegration:
                 assert 'agent_control_file' in config_dict
                 assert config_dict['agent_control_file'] == str(config.agent_control_file)
     
+    def test_relative_base_path_follows_working_directory(self, tmp_path, monkeypatch):
+        """Test that a relative base path is resolved against the current directory."""
+        first, second = tmp_path / "first", tmp_path / "second"
+        first.mkdir()
+        second.mkdir()
+        
+        with mock.patch.dict(os.environ, {'TINYSCHEDULER_BASE_PATH': 'calypso'}):
+            monkeypatch.chdir(first)
+            assert TinySchedulerConfig.from_env().base_path == first.resolve() / "calypso"
+            
+            monkeypatch.chdir(second)
+            assert TinySchedulerConfig.from_env().base_path == second.resolve() / "calypso"
+    
+    def test_invalidate_follows_retargeted_base_path_symlink(self, tmp_path):
+        """Test that invalidate() drops resolved base paths cached before a symlink moved."""
+        first, second = tmp_path / "first", tmp_path / "second"
+        first.mkdir()
+        second.mkdir()
+        link = tmp_path / "current"
+        link.symlink_to(first)
+        
+        with mock.patch.dict(os.environ, {'TINYSCHEDULER_BASE_PATH': str(link)}):
+            assert TinySchedulerConfig.from_env().base_path == first.resolve()
+            
+            link.unlink()
+            link.symlink_to(second)
+            TinySchedulerConfig.invalidate()
+            
+            assert TinySchedulerConfig.from_env().base_path == second.resolve()
+    
+    def test_ensure_directories_recreates_removed_directory(self, tmp_path):
+        """Test that a later ensure_directories() call recreates a removed directory."""
+        with mock.patch.dict(os.environ, {'TINYSCHEDULER_BASE_PATH': str(tmp_path)}):
+            config = TinySchedulerConfig.from_env()
+        
+        config.ensure_directories()
+        config.running_dir.rmdir()
+        config.ensure_directories()
+        
+        assert config.running_dir.is_dir()
+    
     def test_config_str_includes_agent_control_file(self):
         """Test str(config) includes agent_control_file."""
         with tempfile.TemporaryDirectory() as tmpdir:
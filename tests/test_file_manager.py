@@ -0,0 +1,250 @@
+"""Unit tests for FileManager and file copy helpers."""
+
+import errno
+import os
+import pytest
+import shutil
+from datetime import datetime
+from pathlib import Path
+from types import SimpleNamespace
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import src.file_manager as file_manager_module
+from src.file_manager import FileManager, fast_copy
+
+
+@pytest.fixture
+def manager():
+    """Fresh FileManager."""
+    return FileManager()
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Controllable time.time() for failed-file timestamps."""
+    now = [1_700_000_000.25]
+    monkeypatch.setattr(file_manager_module, "time", SimpleNamespace(time=lambda: now[0]))
+    return now
+
+
+def _stamp(seconds):
+    """Format a failed-file timestamp the way FileManager does."""
+    return datetime.fromtimestamp(int(seconds)).strftime("%Y%m%d_%H%M%S")
+
+
+def _write(path, data="data"):
+    """Write a small file and return its path."""
+    path.write_text(data)
+    return path
+
+
+class TestFailedTimestamp:
+    """Tests for naming files moved to the failed directory."""
+
+    def test_counter_suffix_within_one_second(self, manager, clock):
+        """Test that later files in the same second get a counter suffix."""
+        base = _stamp(clock[0])
+
+        assert manager._failed_timestamp() == base
+        assert manager._failed_timestamp() == f"{base}_1"
+        assert manager._failed_timestamp() == f"{base}_2"
+
+    def test_counter_resets_next_second(self, manager, clock):
+        """Test that a new second starts again without a suffix."""
+        manager._failed_timestamp()
+        manager._failed_timestamp()
+
+        clock[0] += 1
+
+        assert manager._failed_timestamp() == _stamp(clock[0])
+
+    def test_same_name_files_do_not_overwrite(self, manager, clock, tmp_path):
+        """Test that files with the same name failing in one second are all kept."""
+        failed_dir = tmp_path / "failed"
+        base = _stamp(clock[0])
+
+        for i in range(3):
+            source_dir = tmp_path / f"in{i}"
+            source_dir.mkdir()
+            assert manager.move_to_failed(_write(source_dir / "report.txt", str(i)), failed_dir)
+
+        assert sorted(p.name for p in failed_dir.iterdir()) == [
+            f"report_{base}.txt", f"report_{base}_1.txt", f"report_{base}_2.txt"
+        ]
+        assert (failed_dir / f"report_{base}_2.txt").read_text() == "2"
+
+
+class TestMoveBatchToFailed:
+    """Tests for moving several failed files at once."""
+
+    def test_moves_all_and_counts(self, manager, clock, tmp_path):
+        """Test that every file is moved and the count returned."""
+        files = [(_write(tmp_path / f"f{i}.bin"), f"reason {i}") for i in range(3)]
+
+        moved = manager.move_batch_to_failed(files, tmp_path / "failed")
+
+        assert moved == 3
+        assert all(not path.exists() for path, _ in files)
+        assert len(list((tmp_path / "failed").iterdir())) == 3
+
+    def test_missing_file_not_counted(self, manager, clock, tmp_path):
+        """Test that a file that disappeared is skipped without stopping the batch."""
+        present = _write(tmp_path / "present.bin")
+
+        moved = manager.move_batch_to_failed(
+            [(tmp_path / "gone.bin", "gone"), (present, "failed")],
+            tmp_path / "failed"
+        )
+
+        assert moved == 1
+        assert [p.name.split("_")[0] for p in (tmp_path / "failed").iterdir()] == ["present"]
+
+    def test_empty_batch_creates_nothing(self, manager, tmp_path):
+        """Test that an empty batch does not create the failed directory."""
+        assert manager.move_batch_to_failed([], tmp_path / "failed") == 0
+        assert not (tmp_path / "failed").exists()
+
+
+class TestLinkOrCopy:
+    """Tests for hard linking with a copy fallback."""
+
+    def test_links_on_same_filesystem(self, manager, tmp_path):
+        """Test that the destination shares the source's inode."""
+        source = _write(tmp_path / "source.txt")
+        destination = tmp_path / "out" / "dest.txt"
+
+        assert manager.link_or_copy(source, destination)
+
+        assert os.path.samefile(source, destination)
+
+    def test_copies_when_link_fails(self, manager, tmp_path, monkeypatch):
+        """Test that a failed link (e.g., another filesystem) falls back to a copy."""
+        def cross_device_link(src, dst):
+            raise OSError(errno.EXDEV, "Invalid cross-device link")
+
+        monkeypatch.setattr(file_manager_module.os, "link", cross_device_link)
+        source = _write(tmp_path / "source.txt", "contents")
+        destination = tmp_path / "dest.txt"
+
+        assert manager.link_or_copy(source, destination)
+
+        assert destination.read_text() == "contents"
+        assert not os.path.samefile(source, destination)
+
+    def test_existing_link_is_success(self, manager, tmp_path):
+        """Test that linking again onto the same file succeeds."""
+        source = _write(tmp_path / "source.txt")
+        destination = tmp_path / "dest.txt"
+        os.link(source, destination)
+
+        assert manager.link_or_copy(source, destination)
+
+    def test_existing_other_file_is_overwritten_by_copy(self, manager, tmp_path):
+        """Test that a different existing destination is replaced with a copy."""
+        source = _write(tmp_path / "source.txt", "new")
+        destination = _write(tmp_path / "dest.txt", "old")
+
+        assert manager.link_or_copy(source, destination)
+
+        assert destination.read_text() == "new"
+
+    def test_missing_source(self, manager, tmp_path):
+        """Test that a missing source is reported as a failure."""
+        assert not manager.link_or_copy(tmp_path / "missing.txt", tmp_path / "dest.txt")
+
+
+class TestFastCopy:
+    """Tests for copying file contents."""
+
+    def test_copies_contents(self, tmp_path):
+        """Test that the destination gets the source's contents."""
+        source = _write(tmp_path / "source.bin", "x" * 100_000)
+        destination = _write(tmp_path / "dest.bin", "longer old contents" * 10_000)
+
+        fast_copy(source, destination)
+
+        assert destination.read_text() == "x" * 100_000
+
+    def test_falls_back_when_copy_file_range_unsupported(self, tmp_path, monkeypatch):
+        """Test that an unsupported copy_file_range falls back to shutil.copyfile."""
+        def unsupported(*args):
+            raise OSError(errno.EXDEV, "Invalid cross-device link")
+
+        copied = []
+        real_copyfile = shutil.copyfile
+
+        def recording_copyfile(src, dst):
+            copied.append(src)
+            return real_copyfile(src, dst)
+
+        monkeypatch.setattr(file_manager_module, "_HAS_COPY_FILE_RANGE", True)
+        monkeypatch.setattr(file_manager_module.os, "copy_file_range", unsupported, raising=False)
+        monkeypatch.setattr(file_manager_module.shutil, "copyfile", recording_copyfile)
+        source = _write(tmp_path / "source.bin", "contents")
+        destination = tmp_path / "dest.bin"
+
+        fast_copy(source, destination)
+
+        assert copied == [source]
+        assert destination.read_text() == "contents"
+
+    def test_other_copy_file_range_errors_raise(self, tmp_path, monkeypatch):
+        """Test that a real copy failure is not hidden by the fallback."""
+        def no_space(*args):
+            raise OSError(errno.ENOSPC, "No space left on device")
+
+        monkeypatch.setattr(file_manager_module, "_HAS_COPY_FILE_RANGE", True)
+        monkeypatch.setattr(file_manager_module.os, "copy_file_range", no_space, raising=False)
+        source = _write(tmp_path / "source.bin")
+
+        with pytest.raises(OSError) as exc_info:
+            fast_copy(source, tmp_path / "dest.bin")
+
+        assert exc_info.value.errno == errno.ENOSPC
+
+    def test_copy_onto_itself_keeps_data(self, tmp_path):
+        """Test that copying a file onto itself raises instead of truncating it."""
+        source = _write(tmp_path / "source.bin", "contents")
+
+        with pytest.raises(shutil.SameFileError):
+            fast_copy(source, source)
+
+        assert source.read_text() == "contents"
+
+
+class TestRemovedDirectories:
+    """Tests for directories removed after they were created or confirmed."""
+
+    def test_move_to_failed_recreates_removed_directory(self, manager, clock, tmp_path):
+        """Test that cleaning out the failed directory does not break later moves."""
+        failed_dir = tmp_path / "failed"
+        assert manager.move_to_failed(_write(tmp_path / "first.bin"), failed_dir)
+
+        shutil.rmtree(failed_dir)
+
+        assert manager.move_to_failed(_write(tmp_path / "second.bin"), failed_dir)
+        assert [p.name.split("_")[0] for p in failed_dir.iterdir()] == ["second"]
+
+    def test_move_and_copy_recreate_removed_parent(self, manager, tmp_path):
+        """Test that move, copy and link recreate a removed destination directory."""
+        out_dir = tmp_path / "out"
+        assert manager.move_file(_write(tmp_path / "a.txt"), out_dir / "a.txt")
+
+        for name, operation in (
+            ("b.txt", manager.move_file),
+            ("c.txt", manager.copy_file),
+            ("d.txt", manager.link_or_copy),
+        ):
+            shutil.rmtree(out_dir)
+            assert operation(_write(tmp_path / name), out_dir / name)
+            assert (out_dir / name).read_text() == "data"
+
+    def test_missing_source_is_not_retried(self, manager, tmp_path):
+        """Test that a missing source still fails without touching the destination."""
+        out_dir = tmp_path / "out"
+        assert manager.move_file(_write(tmp_path / "a.txt"), out_dir / "a.txt")
+
+        assert not manager.move_file(tmp_path / "missing.txt", out_dir / "b.txt")
+        assert [p.name for p in out_dir.iterdir()] == ["a.txt"]
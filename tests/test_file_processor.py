@@ -0,0 +1,207 @@
+"""Unit tests for FileProcessorOrchestrator."""
+
+import os
+import pytest
+from pathlib import Path
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.config import Config
+from src.factory import ProcessorFactory
+from src.file_processor import FileProcessorOrchestrator
+from src.processors.base import BUILTIN_PROCESSORS
+
+
+@pytest.fixture
+def config(tmp_path):
+    """Config with all directories under a temporary path."""
+    inbound = tmp_path / "inbound"
+    inbound.mkdir()
+    return Config(
+        inbound_dir=inbound,
+        outbound_dir=tmp_path / "processed",
+        logs_dir=tmp_path / "logs",
+        failed_dir=tmp_path / "failed",
+        max_workers=1,
+    )
+
+
+def _failed_names(config):
+    """Return the sorted names of files in the failed directory."""
+    if not config.failed_dir.exists():
+        return []
+    return sorted(path.name for path in config.failed_dir.iterdir())
+
+
+class TestUnsupportedFiles:
+    """Tests for moving unsupported files to the failed directory."""
+
+    def test_unsupported_files_moved_in_batch(self, config, monkeypatch):
+        """Test that process_all moves unsupported files only through the batch."""
+        config.max_workers = 2
+        for name in ("a.bin", "b.bin"):
+            (config.inbound_dir / name).write_text("data")
+
+        orchestrator = FileProcessorOrchestrator(config)
+
+        single_moves = []
+        monkeypatch.setattr(
+            orchestrator.file_manager,
+            "move_to_failed",
+            lambda file_path, *args, **kwargs: single_moves.append(file_path)
+        )
+
+        stats = orchestrator.process_all()
+
+        assert single_moves == []
+        assert stats.failed == 2
+        assert list(config.inbound_dir.iterdir()) == []
+        assert [name.split("_")[0] for name in _failed_names(config)] == ["a", "b"]
+
+    def test_process_file_moves_unsupported_file(self, config):
+        """Test that processing a single unsupported file still moves it."""
+        file_path = config.inbound_dir / "notes.bin"
+        file_path.write_text("data")
+
+        result = FileProcessorOrchestrator(config).process_file(file_path)
+
+        assert not result.success
+        assert result.message == "Unsupported file type: .bin"
+        assert not file_path.exists()
+        assert len(_failed_names(config)) == 1
+
+
+class TestParallelProcessing:
+    """Tests for process_all running files on worker threads."""
+
+    def test_mixed_files_with_workers(self, config):
+        """Test counts and destinations for supported, unsupported and failing files."""
+        config.max_workers = 4
+        good = [f"good{i}.txt" for i in range(8)]
+        unsupported = [f"blob{i}.bin" for i in range(4)]
+        failing = [f"stuck{i}.md" for i in range(3)]
+        for name in good + unsupported + failing:
+            (config.inbound_dir / name).write_text(name)
+
+        # A directory in the way makes the text processor's move fail
+        for name in failing:
+            (config.outbound_dir / name).mkdir(parents=True)
+
+        stats = FileProcessorOrchestrator(config).process_all()
+
+        assert stats.total_files == 15
+        assert stats.successful == 8
+        assert stats.failed == 7
+        assert list(config.inbound_dir.iterdir()) == []
+
+        for name in good:
+            assert (config.outbound_dir / name).read_text() == name
+
+        failed = _failed_names(config)
+        assert len(failed) == 7
+        assert sorted(name.split("_")[0] for name in failed) == sorted(
+            Path(name).stem for name in unsupported + failing
+        )
+        for name in failed:
+            original = name.split("_")[0] + Path(name).suffix
+            assert (config.failed_dir / name).read_text() == original
+
+
+class TestProcessorRegistration:
+    """Tests for registering the built-in processors."""
+
+    def test_registered_extensions_match_processor_classes(self, config):
+        """Test that every extension maps to the class that declares it."""
+        factory = FileProcessorOrchestrator(config).factory
+
+        registered = set()
+        for (module, class_name), extensions in BUILTIN_PROCESSORS.items():
+            for ext in extensions:
+                processor_class = factory.get_processor_class_by_ext(ext)
+                assert processor_class.__name__ == class_name
+                assert processor_class.SUPPORTED_EXTENSIONS == extensions
+            registered |= extensions
+
+        assert factory.get_all_supported_extensions() == sorted(registered)
+
+
+class TestProcessOrder:
+    """Tests for the order inbound files are processed in."""
+
+    @pytest.fixture
+    def inbound_files(self, config):
+        """Inbound files whose names and modification times sort differently."""
+        names = ["c.txt", "a.txt", "b.txt"]
+        for age, name in enumerate(names):
+            path = config.inbound_dir / name
+            path.write_text(name)
+            mtime = 1_700_000_000 - age * 60  # c newest, b oldest
+            os.utime(path, (mtime, mtime))
+        return names
+
+    def _order(self, config, process_order):
+        """Return inbound file names in the order they would be processed."""
+        config.process_order = process_order
+        return [p.name for p in FileProcessorOrchestrator(config)._get_inbound_files()]
+
+    def test_sorted_by_name(self, config, inbound_files):
+        """Test that "sorted" orders files by name."""
+        assert self._order(config, "sorted") == ["a.txt", "b.txt", "c.txt"]
+
+    def test_oldest_first(self, config, inbound_files):
+        """Test that "mtime" orders files oldest first."""
+        assert self._order(config, "mtime") == ["b.txt", "a.txt", "c.txt"]
+
+    def test_unsorted_returns_every_file(self, config, inbound_files):
+        """Test that "unsorted" returns each file once, in directory order."""
+        assert sorted(self._order(config, "unsorted")) == sorted(inbound_files)
+
+    def test_missing_inbound_directory(self, config):
+        """Test that a missing inbound directory gives no files."""
+        orchestrator = FileProcessorOrchestrator(config)
+        config.inbound_dir.rmdir()
+
+        assert orchestrator._get_inbound_files() == []
+
+
+class TestLazyRegistration:
+    """Tests for loading processor classes on first use."""
+
+    def test_processors_loaded_only_when_needed(self, config):
+        """Test that only the processor for a processed file is loaded."""
+        orchestrator = FileProcessorOrchestrator(config)
+        assert orchestrator.factory._loaded == {}
+
+        file_path = config.inbound_dir / "notes.txt"
+        file_path.write_text("notes")
+        assert orchestrator.process_file(file_path).success
+
+        loaded = [cls.__name__ for cls in orchestrator.factory._loaded.values()]
+        assert loaded == ["TextProcessor"]
+
+    def test_loader_called_once_for_all_extensions(self):
+        """Test that a lazy loader runs once and its class serves every extension."""
+        class DummyProcessor:
+            SUPPORTED_EXTENSIONS = frozenset({'.a', '.b'})
+
+            def process(self, file_path, config):
+                return None
+
+        calls = []
+
+        def loader():
+            calls.append(True)
+            return DummyProcessor
+
+        factory = ProcessorFactory()
+        factory.register_lazy("DummyProcessor", ['.a', '.B'], loader)
+        factory.freeze()
+
+        assert calls == []
+        assert factory.is_supported('b')
+
+        first = factory.get_processor('.a')
+        assert factory.get_processor('b') is first
+        assert isinstance(first, DummyProcessor)
+        assert calls == [True]
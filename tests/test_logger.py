@@ -0,0 +1,79 @@
+"""Unit tests for logging setup."""
+
+import logging
+import pytest
+from pathlib import Path
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.logger import TemplateSamplingFilter, setup_logging, shutdown_logging
+
+
+@pytest.fixture
+def file_logger(tmp_path):
+    """Logger writing DEBUG records to a file only."""
+    log_file = tmp_path / "calypso.log"
+    logger = setup_logging(log_level="DEBUG", log_file=log_file, console=False)
+    yield logger, log_file
+    shutdown_logging()
+    logger.handlers.clear()
+
+
+def _read_lines(log_file):
+    """Flush pending records and return the log file's lines."""
+    shutdown_logging()
+    return log_file.read_text(encoding="utf-8").splitlines()
+
+
+class TestTemplateSampling:
+    """Tests for sampling repetitive DEBUG records written to the log file."""
+
+    def test_templated_debug_records_are_sampled(self, file_logger):
+        """Test that a %s template is sampled even though each call differs."""
+        logger, log_file = file_logger
+
+        for i in range(50):
+            logger.debug("Moved artifact to logs: %s", f"artifact-{i}.txt")
+
+        lines = _read_lines(log_file)
+
+        assert len(lines) == 5
+        assert lines[0].endswith("Moved artifact to logs: artifact-0.txt")
+        assert lines[1].endswith("Moved artifact to logs: artifact-10.txt")
+
+    def test_distinct_templates_counted_separately(self, file_logger):
+        """Test that each template gets its own first record through."""
+        logger, log_file = file_logger
+
+        for i in range(3):
+            logger.debug("Moved artifact to logs: %s", i)
+            logger.debug("Deleted temp file: %s", i)
+
+        lines = _read_lines(log_file)
+
+        assert len(lines) == 2
+        assert lines[0].endswith("Moved artifact to logs: 0")
+        assert lines[1].endswith("Deleted temp file: 0")
+
+    def test_info_records_never_sampled(self, file_logger):
+        """Test that records at INFO and above all reach the file."""
+        logger, log_file = file_logger
+
+        for i in range(20):
+            logger.info("Processing file: %s", i)
+
+        assert len(_read_lines(log_file)) == 20
+
+    def test_filter_without_template_uses_msg(self):
+        """Test that records not prepared by the queue handler key on msg."""
+        sampling = TemplateSamplingFilter(sample_rate=2)
+
+        def make_record(arg):
+            return logging.LogRecord(
+                "calypso", logging.DEBUG, __file__, 1, "Item %s", (arg,), None
+            )
+
+        results = [sampling.filter(make_record(i)) for i in range(4)]
+
+        assert results == [True, False, True, False]
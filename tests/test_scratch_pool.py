@@ -0,0 +1,75 @@
+"""Unit tests for ScratchDirPool."""
+
+import pytest
+import tempfile
+from pathlib import Path
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.utils.scratch_pool import ScratchDirPool
+
+
+@pytest.fixture
+def pool(tmp_path, monkeypatch):
+    """Pool creating its directories under a temporary path."""
+    monkeypatch.setattr(tempfile, "tempdir", str(tmp_path))
+    pool = ScratchDirPool(max_size=2, prefix="test-")
+    yield pool
+    pool.close()
+
+
+class TestScratchDirPool:
+    """Tests for reusing scratch directories."""
+
+    def test_acquire_creates_empty_directory(self, pool, tmp_path):
+        """Test that acquire() creates a new empty directory when none are idle."""
+        path = pool.acquire()
+
+        assert path.is_dir()
+        assert path.parent == tmp_path
+        assert path.name.startswith("test-")
+        assert list(path.iterdir()) == []
+
+    def test_release_empties_and_reuses(self, pool):
+        """Test that a released directory is emptied and handed out again."""
+        path = pool.acquire()
+        (path / "out.txt").write_text("data")
+        (path / "nested" / "deeper").mkdir(parents=True)
+        (path / "nested" / "deeper" / "file.txt").write_text("data")
+
+        pool.release(path)
+
+        assert path.is_dir()
+        assert list(path.iterdir()) == []
+        assert pool.acquire() == path
+
+    def test_release_beyond_max_size_removes(self, pool):
+        """Test that directories beyond max_size are removed, not kept."""
+        paths = [pool.acquire() for _ in range(3)]
+
+        for path in paths:
+            pool.release(path)
+
+        assert [path.exists() for path in paths] == [True, True, False]
+
+    def test_scoped_releases_on_error(self, pool):
+        """Test that scoped() returns the directory to the pool even on error."""
+        with pytest.raises(RuntimeError):
+            with pool.scoped() as path:
+                (path / "partial.txt").write_text("data")
+                raise RuntimeError("processing failed")
+
+        assert list(path.iterdir()) == []
+        assert pool.acquire() == path
+
+    def test_close_removes_idle_directories(self, pool):
+        """Test that close() deletes every idle directory."""
+        paths = [pool.acquire() for _ in range(2)]
+        for path in paths:
+            pool.release(path)
+
+        pool.close()
+
+        assert not any(path.exists() for path in paths)
+        assert pool.acquire() not in paths